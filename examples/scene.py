@@ -1,8 +1,8 @@
 from nanocalibur.dsl_markers import (
+    AbstractCodeBlock,
     Actor,
     Camera,
     Color,
-    Tick,
     Game,
     Global,
     KeyboardCondition,
@@ -27,65 +27,129 @@ class Coin(Actor):
     pass
 
 
-@condition(KeyboardCondition.on_press("d", id="human_1"))
-def move_right(player: Player["hero"]):
+AbstractCodeBlock.begin(
+    "human_player_controls",
+    role_id=str,
+    hero_uid=str,
+    key_up=str,
+    key_left=str,
+    key_down=str,
+    key_right=str,
+    descr="keyboard movement for one human-controlled hero",
+)
+
+
+@condition(KeyboardCondition.on_press(key_right, id=role_id))
+def move_right(player: Player[hero_uid]):
     player.vx = player.speed
     player.play("run")
 
-@condition(KeyboardCondition.on_press("q", id="human_1"))
-def move_left(player: Player["hero"]):
+
+@condition(KeyboardCondition.on_press(key_left, id=role_id))
+def move_left(player: Player[hero_uid]):
     player.vx = -player.speed
     player.play("run")
 
-@condition(KeyboardCondition.on_press("z", id="human_1"))
-def move_up(player: Player["hero"]):
+
+@condition(KeyboardCondition.on_press(key_up, id=role_id))
+def move_up(player: Player[hero_uid]):
     player.vy = -player.speed
     player.play("run")
 
-@condition(KeyboardCondition.on_press("s", id="human_1"))
-def move_down(player: Player["hero"]):
+
+@condition(KeyboardCondition.on_press(key_down, id=role_id))
+def move_down(player: Player[hero_uid]):
     player.vy = player.speed
     player.play("run")
 
 
-@condition(KeyboardCondition.end_press(["d", "q"], id="human_1"))
-def stop_horizontal(player: Player["hero"]):
+@condition(KeyboardCondition.end_press([key_right, key_left], id=role_id))
+def stop_horizontal(player: Player[hero_uid]):
     player.vx = 0
     if player.vy == 0:
         player.play("idle")
 
 
-@condition(KeyboardCondition.end_press(["z", "s"], id="human_1"))
-def stop_vertical(player: Player["hero"]):
+@condition(KeyboardCondition.end_press([key_up, key_down], id=role_id))
+def stop_vertical(player: Player[hero_uid]):
     player.vy = 0
     if player.vx == 0:
         player.play("idle")
 
 
-@condition(OnToolCall("llm_dummy_move_right", "Move llm_dummy right", id="dummy_1"))
-def llm_dummy_move_right(bot: Player["llm_dummy"]):
-    bot.vx = bot.speed
-    bot.play("run")
+AbstractCodeBlock.end("human_player_controls")
 
+AbstractCodeBlock.instantiate(
+    "human_player_controls",
+    role_id="human_1",
+    hero_uid="hero",
+    key_up="z",
+    key_left="q",
+    key_down="s",
+    key_right="d",
+)
 
-@condition(OnToolCall("llm_dummy_move_left", "Move llm_dummy left", id="dummy_1"))
-def llm_dummy_move_left(bot: Player["llm_dummy"]):
-    bot.vx = -bot.speed
-    bot.play("run")
+
+AbstractCodeBlock.begin(
+    "llm_dummy_horizontal_move",
+    tool_name=str,
+    tool_descr=str,
+    direction=int,
+    descr="one horizontal movement tool for llm_dummy",
+)
 
 
-@condition(OnToolCall("llm_dummy_move_up", "Move llm_dummy up", id="dummy_1"))
-def llm_dummy_move_up(bot: Player["llm_dummy"]):
-    bot.vy = -bot.speed
+@condition(OnToolCall(tool_name, tool_descr, id="dummy_1"))
+def llm_dummy_move_horizontal(bot: Player["llm_dummy"]):
+    bot.vx = direction * bot.speed
     bot.play("run")
 
 
-@condition(OnToolCall("llm_dummy_move_down", "Move llm_dummy down", id="dummy_1"))
-def llm_dummy_move_down(bot: Player["llm_dummy"]):
-    bot.vy = bot.speed
+AbstractCodeBlock.end("llm_dummy_horizontal_move")
+
+AbstractCodeBlock.begin(
+    "llm_dummy_vertical_move",
+    tool_name=str,
+    tool_descr=str,
+    direction=int,
+    descr="one vertical movement tool for llm_dummy",
+)
+
+
+@condition(OnToolCall(tool_name, tool_descr, id="dummy_1"))
+def llm_dummy_move_vertical(bot: Player["llm_dummy"]):
+    bot.vy = direction * bot.speed
     bot.play("run")
 
 
+AbstractCodeBlock.end("llm_dummy_vertical_move")
+
+AbstractCodeBlock.instantiate(
+    "llm_dummy_horizontal_move",
+    tool_name="llm_dummy_move_right",
+    tool_descr="Move llm_dummy right",
+    direction=1,
+)
+AbstractCodeBlock.instantiate(
+    "llm_dummy_horizontal_move",
+    tool_name="llm_dummy_move_left",
+    tool_descr="Move llm_dummy left",
+    direction=-1,
+)
+AbstractCodeBlock.instantiate(
+    "llm_dummy_vertical_move",
+    tool_name="llm_dummy_move_up",
+    tool_descr="Move llm_dummy up",
+    direction=-1,
+)
+AbstractCodeBlock.instantiate(
+    "llm_dummy_vertical_move",
+    tool_name="llm_dummy_move_down",
+    tool_descr="Move llm_dummy down",
+    direction=1,
+)
+
+
 @condition(OnToolCall("llm_dummy_idle", "Set llm_dummy to idle animation", id="dummy_1"))
 def llm_dummy_idle(bot: Player["llm_dummy"]):
     bot.vx = 0
@@ -119,9 +183,8 @@ def disable_gravity(scene: Scene):
 
 @condition(KeyboardCondition.begin_press("e", id="human_1"))
 @condition(OnToolCall("spawn_bonus", "Spawn one bonus coin near the hero", id="human_1"))
-def spawn_bonus(scene: Scene, tick: Tick, last_coin: Coin[-1]):
-    for _ in range(20):
-        yield tick
+def spawn_bonus(scene: Scene, last_coin: Coin[-1]):
+    yield scene.wait_ticks(20)
     if last_coin is not None and scene.elapsed > 300:
         new_x = last_coin.x + 32
         coin = Coin(x=new_x,
@@ -136,8 +199,12 @@ def spawn_bonus(scene: Scene, tick: Tick, last_coin: Coin[-1]):
 game = Game()
 scene = Scene(gravity=False)
 game.set_scene(scene)
-game.add_role(Role(id="human_1", required=True, kind=RoleKind.HUMAN))
-game.add_role(Role(id="dummy_1", required=True, kind=RoleKind.AI))
+game.add_roles(
+    [
+        Role(id="human_1", required=True, kind=RoleKind.HUMAN),
+        Role(id="dummy_1", required=True, kind=RoleKind.AI),
+    ]
+)
 game.set_multiplayer(
     Multiplayer(
         default_loop="hybrid",
@@ -172,8 +239,6 @@ hero_player = Player(
         sprite="hero",
     )
 
-scene.add_actor(hero_player)
-
 llm_dummy_player = Player(
         uid="llm_dummy",
         x=96,
@@ -186,13 +251,11 @@ llm_dummy_player = Player(
         sprite="hero",
     )
 
-scene.add_actor(llm_dummy_player)
-
 coin = Coin(uid="coin_1", x=320, y=224, active=True, sprite="coin")
-scene.add_actor(coin)
 
 coin_pet = Coin(uid="coin_pet", x=200, y=300, block_mask=1, parent="hero", active=True, sprite="coin")
-scene.add_actor(coin_pet)
+
+scene.add_actors([hero_player, llm_dummy_player, coin, coin_pet])
 
 game.add_resource(
     "hero_sheet",
@@ -1,14 +1,38 @@
-from nanocalibur.compiler import DSLCompiler
+"""NanoCalibur DSL compiler.
+
+Public names other than the error types are imported on first attribute
+access (PEP 562), so entry points that only need part of the package do not
+pay for loading the compiler, TypeScript generator or MCP bridge.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from nanocalibur.errors import DSLError, DSLValidationError
-from nanocalibur.exporter import (
-    compile_project,
-    export_project,
-    project_to_dict,
-    project_to_ir_dict,
-)
-from nanocalibur.mcp_bridge import NanoCaliburHTTPClient, build_fastmcp_from_http
-from nanocalibur.project_compiler import ProjectCompiler
-from nanocalibur.ts_generator import TSGenerator
+
+if TYPE_CHECKING:
+    from nanocalibur.compiler import DSLCompiler
+    from nanocalibur.exporter import (
+        compile_project,
+        export_project,
+        project_to_dict,
+        project_to_ir_dict,
+    )
+    from nanocalibur.mcp_bridge import NanoCaliburHTTPClient, build_fastmcp_from_http
+    from nanocalibur.project_compiler import ProjectCompiler
+    from nanocalibur.ts_generator import TSGenerator
+
+_LAZY_ATTRIBUTES = {
+    "DSLCompiler": "nanocalibur.compiler",
+    "ProjectCompiler": "nanocalibur.project_compiler",
+    "TSGenerator": "nanocalibur.ts_generator",
+    "compile_project": "nanocalibur.exporter",
+    "export_project": "nanocalibur.exporter",
+    "project_to_dict": "nanocalibur.exporter",
+    "project_to_ir_dict": "nanocalibur.exporter",
+    "NanoCaliburHTTPClient": "nanocalibur.mcp_bridge",
+    "build_fastmcp_from_http": "nanocalibur.mcp_bridge",
+}
 
 __all__ = [
     "DSLCompiler",
@@ -23,3 +47,16 @@ __all__ = [
     "project_to_dict",
     "project_to_ir_dict",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
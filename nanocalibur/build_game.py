@@ -3,10 +3,17 @@ from __future__ import annotations
 
 import argparse
 import ast
+import hashlib
+import io
+import json
+import os
 import shutil
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -18,28 +25,87 @@ from nanocalibur.exporter import export_project
 
 GENERATED_DIR_NAME = "nanocalibur_generated"
 TEMPLATES_DIR = ROOT / "nanocalibur" / "templates" / "web_bundle"
+COLLECT_CACHE_DIR = Path(".nanocalibur_cache") / "collect"
+# Exact node types of top-level import statements; most statements are not
+# imports, so they are rejected with one set lookup.
+_IMPORT_TYPES = frozenset({ast.Import, ast.ImportFrom})
 
 
-def _write_text(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+def _copy_file(src: Path, dst: Path) -> None:
+    # Bundle files are build artifacts: copy contents only (copyfile uses
+    # sendfile where available) and skip copy2's metadata syscalls.
+    shutil.copyfile(src, dst)
 
 
-def _read_template(filename: str) -> str:
-    template_path = TEMPLATES_DIR / filename
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template file not found: {template_path}")
-    return template_path.read_text(encoding="utf-8")
-
-
-def _resolve_module_file(candidate_base: Path) -> Path | None:
+def _copy_if_changed(src: Path, dst: Path) -> None:
+    # Leaving identical files untouched keeps their mtime, so incremental
+    # TypeScript builds downstream do not rebuild them.
+    try:
+        if dst.stat().st_size == src.stat().st_size and dst.read_bytes() == src.read_bytes():
+            return
+    except OSError:
+        pass
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    _copy_file(src, dst)
+
+
+def _sync_tree(src_dir: Path, dst_dir: Path) -> None:
+    """Make ``dst_dir`` mirror ``src_dir``, rewriting only changed files."""
+    src_files = {path.relative_to(src_dir) for path in src_dir.rglob("*") if path.is_file()}
+    if dst_dir.exists():
+        # Reverse order visits children before their parent directory.
+        for dst in sorted(dst_dir.rglob("*"), reverse=True):
+            rel = dst.relative_to(dst_dir)
+            if dst.is_dir() and not dst.is_symlink():
+                if not (src_dir / rel).is_dir():
+                    shutil.rmtree(dst)
+            elif rel not in src_files:
+                dst.unlink()
+    for rel in sorted(src_files):
+        _copy_if_changed(src_dir / rel, dst_dir / rel)
+
+
+@lru_cache(maxsize=32)
+def _read_template(filename: str) -> bytes:
+    # Templates ship with the package and do not change within a process.
+    return (TEMPLATES_DIR / filename).read_bytes()
+
+
+def _copy_template(filename: str, destination: Path) -> None:
+    content = _read_template(filename)
+    try:
+        if destination.stat().st_size == len(content) and destination.read_bytes() == content:
+            return
+    except OSError:
+        pass
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_bytes(content)
+
+
+def _is_regular_file(path: Path) -> bool:
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _resolve_module_file(
+    candidate_base: Path,
+    module_cache: Optional[Dict[Path, Optional[Path]]] = None,
+) -> Path | None:
+    if module_cache is not None and candidate_base in module_cache:
+        return module_cache[candidate_base]
+    resolved: Path | None = None
     module_file = candidate_base.with_suffix(".py")
-    if module_file.exists() and module_file.is_file():
-        return module_file.resolve()
-    package_init = candidate_base / "__init__.py"
-    if package_init.exists() and package_init.is_file():
-        return package_init.resolve()
-    return None
+    if _is_regular_file(module_file):
+        resolved = module_file.resolve()
+    else:
+        package_init = candidate_base / "__init__.py"
+        if _is_regular_file(package_init):
+            resolved = package_init.resolve()
+    if module_cache is not None:
+        module_cache[candidate_base] = resolved
+    return resolved
 
 
 def _extract_local_import_paths(
@@ -47,6 +113,7 @@ def _extract_local_import_paths(
     *,
     project_root: Path,
     current_file: Path,
+    module_cache: Optional[Dict[Path, Optional[Path]]] = None,
 ) -> List[Path]:
     paths: List[Path] = []
 
@@ -58,7 +125,7 @@ def _extract_local_import_paths(
             base = base.parent
         if stmt.module:
             target = base.joinpath(*stmt.module.split("."))
-            resolved = _resolve_module_file(target)
+            resolved = _resolve_module_file(target, module_cache)
             if resolved is not None:
                 paths.append(resolved)
             return paths
@@ -66,7 +133,7 @@ def _extract_local_import_paths(
             if alias.name == "*":
                 continue
             target = base.joinpath(*alias.name.split("."))
-            resolved = _resolve_module_file(target)
+            resolved = _resolve_module_file(target, module_cache)
             if resolved is not None:
                 paths.append(resolved)
         return paths
@@ -74,61 +141,233 @@ def _extract_local_import_paths(
     if isinstance(stmt, ast.Import):
         for alias in stmt.names:
             target = project_root.joinpath(*alias.name.split("."))
-            resolved = _resolve_module_file(target)
+            resolved = _resolve_module_file(target, module_cache)
             if resolved is not None:
                 paths.append(resolved)
     return paths
 
 
+def _collect_cache_file(cache_dir: Path, path: Path) -> Path:
+    # One entry per module, overwritten in place when the module changes, so
+    # edits do not accumulate stale files in the project directory.
+    name = hashlib.blake2b(os.fsencode(path), digest_size=16).hexdigest()
+    return cache_dir / f"{name}.json"
+
+
+def _load_collect_cache(cache_file: Path, digest: str) -> Optional[dict]:
+    try:
+        entry = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(entry, dict)
+        or entry.get("digest") != digest
+        or not isinstance(entry.get("imports"), list)
+        or not isinstance(entry.get("source"), str)
+    ):
+        return None
+    return entry
+
+
+def _store_collect_cache(cache_file: Path, entry: dict) -> None:
+    # The cache only saves work; an unwritable project directory must not
+    # fail the build.
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(entry), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _cached_local_deps(
+    entry: dict,
+    *,
+    project_root: Path,
+    current_file: Path,
+    module_cache: Optional[Dict[Path, Optional[Path]]] = None,
+) -> Optional[List[Path]]:
+    """Re-resolve the cached import statements of a module.
+
+    Returns ``None`` when an import no longer resolves the way it did when the
+    entry was written, e.g. because a local module was added or removed.
+    """
+    deps: List[Path] = []
+    for item in entry["imports"]:
+        if not isinstance(item, dict) or not isinstance(item.get("stmt"), str):
+            return None
+        try:
+            stmt = ast.parse(item["stmt"]).body[0]
+        except (SyntaxError, IndexError):
+            return None
+        local_deps = _extract_local_import_paths(
+            stmt,
+            project_root=project_root,
+            current_file=current_file,
+            module_cache=module_cache,
+        )
+        if bool(local_deps) != bool(item.get("local")):
+            return None
+        deps.extend(local_deps)
+    return deps
+
+
+def _statement_spans(source: bytes, stmts: List[ast.stmt]) -> List[tuple[int, int]]:
+    """Return the byte spans of top-level statements in ``source``.
+
+    AST column offsets are UTF-8 byte offsets, so spans index the raw bytes.
+    """
+    line_starts = [0]
+    for line in source.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+    spans: List[tuple[int, int]] = []
+    for stmt in stmts:
+        start = line_starts[stmt.lineno - 1] + stmt.col_offset
+        end = line_starts[stmt.end_lineno - 1] + stmt.end_col_offset
+        spans.append((start, end))
+    return spans
+
+
+def _remove_spans(source: bytes, spans: List[tuple[int, int]]) -> str:
+    kept: List[bytes] = []
+    cursor = 0
+    for start, end in spans:
+        kept.append(source[cursor:start])
+        # Drop a trailing `;` so `import x; y = 1` keeps a valid `y = 1`.
+        probe = end
+        while probe < len(source) and source[probe] in b" \t":
+            probe += 1
+        if probe < len(source) and source[probe : probe + 1] == b";":
+            end = probe + 1
+            while end < len(source) and source[end] in b" \t":
+                end += 1
+        cursor = end
+    kept.append(source[cursor:])
+    return b"".join(kept).decode("utf-8")
+
+
+def _filter_module_source(
+    path: Path,
+    source_bytes: bytes,
+    *,
+    project_root: Path,
+    cache_dir: Path,
+    module_cache: Dict[Path, Optional[Path]],
+) -> tuple[List[Path], str]:
+    """Return the local dependencies of a module and its source without them."""
+    # Validated by content digest rather than mtime so checkouts cannot serve
+    # stale entries; imports are re-resolved on every hit.
+    cache_file = _collect_cache_file(cache_dir, path)
+    digest = hashlib.blake2b(source_bytes, digest_size=16).hexdigest()
+    entry = _load_collect_cache(cache_file, digest)
+    if entry is not None:
+        deps = _cached_local_deps(
+            entry,
+            project_root=project_root,
+            current_file=path,
+            module_cache=module_cache,
+        )
+        if deps is not None:
+            return deps, entry["source"]
+
+    module = ast.parse(source_bytes)
+    import_stmts = [stmt for stmt in module.body if type(stmt) in _IMPORT_TYPES]
+
+    # Local imports are cut out of the original text rather than unparsing
+    # the remaining module, which also keeps comments.
+    deps = []
+    imports: list[dict] = []
+    removed_spans: list[tuple[int, int]] = []
+    for stmt, span in zip(import_stmts, _statement_spans(source_bytes, import_stmts)):
+        local_deps = _extract_local_import_paths(
+            stmt,
+            project_root=project_root,
+            current_file=path,
+            module_cache=module_cache,
+        )
+        stmt_source = source_bytes[span[0] : span[1]].decode("utf-8")
+        imports.append({"stmt": stmt_source, "local": bool(local_deps)})
+        if local_deps:
+            deps.extend(local_deps)
+            removed_spans.append(span)
+
+    filtered = _remove_spans(source_bytes, removed_spans).strip("\n")
+    _store_collect_cache(
+        cache_file,
+        {"digest": digest, "imports": imports, "source": filtered},
+    )
+    return deps, filtered
+
+
 def _collect_game_source(main_path: Path) -> str:
     if not main_path.exists():
         raise FileNotFoundError(f"Game entry file not found: {main_path}")
     if not main_path.is_file():
         raise FileNotFoundError(f"Game entry path is not a file: {main_path}")
 
-    project_root = main_path.parent.resolve()
-    visited: set[Path] = set()
+    # Resolve once here; _resolve_module_file returns resolved paths, so
+    # dependencies need no further resolve() calls.
+    main_path = main_path.resolve()
+    project_root = main_path.parent
+    cache_dir = project_root / COLLECT_CACHE_DIR
+    # Import targets resolved during this collection; several modules usually
+    # import the same local files.
+    module_cache: Dict[Path, Optional[Path]] = {}
+    # Graph bookkeeping is keyed by path strings, which hash cheaper than
+    # Path objects; Paths are still passed everywhere else.
+    modules: Dict[str, tuple[List[Path], str]] = {}
+
+    # Discover the import graph level by level so that every file of a level
+    # is read concurrently; filtering itself stays serial.
+    frontier = [main_path]
+    queued = {os.fspath(main_path)}
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        while frontier:
+            next_frontier: list[Path] = []
+            for path, source_bytes in zip(frontier, pool.map(Path.read_bytes, frontier)):
+                deps, filtered = _filter_module_source(
+                    path,
+                    source_bytes,
+                    project_root=project_root,
+                    cache_dir=cache_dir,
+                    module_cache=module_cache,
+                )
+                modules[os.fspath(path)] = (deps, filtered)
+                for dep in deps:
+                    dep_key = os.fspath(dep)
+                    if dep_key not in queued:
+                        queued.add(dep_key)
+                        next_frontier.append(dep)
+            frontier = next_frontier
+
+    # Dependencies come before the modules importing them.
+    visited: set[str] = set()
     ordered_sources: list[tuple[Path, str]] = []
 
     def visit(path: Path) -> None:
-        path = path.resolve()
-        if path in visited:
+        key = os.fspath(path)
+        if key in visited:
             return
-        visited.add(path)
-
-        source = path.read_text(encoding="utf-8")
-        module = ast.parse(source)
-
-        deps: list[Path] = []
-        kept_body: list[ast.stmt] = []
-        for stmt in module.body:
-            local_deps = _extract_local_import_paths(
-                stmt,
-                project_root=project_root,
-                current_file=path,
-            )
-            if local_deps:
-                deps.extend(local_deps)
-                continue
-            kept_body.append(stmt)
-
+        visited.add(key)
+        deps, filtered = modules[key]
         for dep in deps:
             visit(dep)
-
-        filtered_module = ast.Module(body=kept_body, type_ignores=[])
-        ast.fix_missing_locations(filtered_module)
-        ordered_sources.append((path, ast.unparse(filtered_module)))
+        ordered_sources.append((path, filtered))
 
     visit(main_path)
 
-    chunks: list[str] = []
-    for path, chunk in ordered_sources:
+    buffer = io.StringIO()
+    for index, (path, chunk) in enumerate(ordered_sources):
         try:
             rel = path.relative_to(project_root)
         except ValueError:
             rel = path
-        chunks.append(f"# --- source: {rel} ---\n{chunk}")
-    return "\n\n".join(chunks)
+        if index:
+            buffer.write("\n\n")
+        buffer.write("# --- source: ")
+        buffer.write(str(rel))
+        buffer.write(" ---\n")
+        buffer.write(chunk)
+    return buffer.getvalue()
 
 
 def build_web_input(
@@ -163,20 +402,13 @@ def build_web_input(
         "replay_store_sqlite.ts",
         "symbolic_renderer.ts",
     ):
-        shutil.copy2(runtime_dir / runtime_file, generated_dir / runtime_file)
-    canvas_runtime_dir = runtime_dir / "canvas"
-    generated_canvas_dir = generated_dir / "canvas"
-    if generated_canvas_dir.exists():
-        shutil.rmtree(generated_canvas_dir)
-    shutil.copytree(canvas_runtime_dir, generated_canvas_dir)
-
-    _write_text(generated_dir / "bridge.ts", _read_template("bridge.ts"))
-    _write_text(generated_dir / "index.ts", _read_template("index.ts"))
-    _write_text(generated_dir / "node.ts", _read_template("node.ts"))
-    _write_text(
-        output_dir / "README.generated.md",
-        _read_template("README.generated.md"),
-    )
+        _copy_if_changed(runtime_dir / runtime_file, generated_dir / runtime_file)
+    _sync_tree(runtime_dir / "canvas", generated_dir / "canvas")
+
+    _copy_template("bridge.ts", generated_dir / "bridge.ts")
+    _copy_template("index.ts", generated_dir / "index.ts")
+    _copy_template("node.ts", generated_dir / "node.ts")
+    _copy_template("README.generated.md", output_dir / "README.generated.md")
 
     return generated_dir
 
@@ -189,9 +421,7 @@ def sync_into_web_project(bundle_dir: Path, project_dir: Path) -> Path:
     target_dir = src_dir / GENERATED_DIR_NAME
     if bundle_dir.resolve() == target_dir.resolve():
         return target_dir
-    if target_dir.exists():
-        shutil.rmtree(target_dir)
-    shutil.copytree(bundle_dir, target_dir)
+    _sync_tree(bundle_dir, target_dir)
     return target_dir
 
 
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import ast
-import copy
+import hashlib
+import sys
 import warnings
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from nanocalibur.errors import DSLValidationError, format_dsl_diagnostic
 
 
-@dataclass
+@dataclass(slots=True)
 class _ActiveBlock:
     kind: str
     block_id: str
@@ -20,7 +22,7 @@ class _ActiveBlock:
     body: List[ast.stmt]
 
 
-@dataclass
+@dataclass(slots=True)
 class _AbstractTemplate:
     block_id: str
     descr: Optional[str]
@@ -29,6 +31,32 @@ class _AbstractTemplate:
     begin_node: ast.AST
     body: List[ast.stmt]
     instantiate_count: int = 0
+    params_set: FrozenSet[str] = field(default_factory=frozenset)
+    # Top-level names defined by the body, renamed per instance.
+    defined_names: List[str] = field(default_factory=list)
+    # Per body statement, every name it references or defines; statements
+    # touching no parameter or renamed name are cloned without rewriting.
+    referenced_names: List[frozenset] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _MarkerCall:
+    """A top-level ``owner.method(...)`` call that may be a block marker."""
+
+    call: ast.Call
+    method: str
+    # Name of the receiver when it is a plain name, e.g. ``CodeBlock``.
+    owner: Optional[str]
+    # Set for ``name = owner.method(...)``; ``None`` for expression statements.
+    assign_target: Optional[str]
+
+
+_MARKER_METHODS = frozenset({"begin", "end", "instantiate"})
+_BLOCK_CLASSES = frozenset({"CodeBlock", "AbstractCodeBlock"})
+_DEFINITION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_PREPROCESS_CACHE_SIZE = 128
+# Preprocessed source and emitted diagnostics keyed by (source digest, flags).
+_PREPROCESS_CACHE: "OrderedDict[tuple, Tuple[str, Tuple[str, ...]]]" = OrderedDict()
 
 
 def preprocess_code_blocks(
@@ -36,19 +64,67 @@ def preprocess_code_blocks(
     *,
     require_code_blocks: bool,
     unboxed_disable_flag: str,
+) -> str:
+    key = (
+        hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest(),
+        require_code_blocks,
+        unboxed_disable_flag,
+    )
+    cached = _PREPROCESS_CACHE.get(key)
+    if cached is not None:
+        _PREPROCESS_CACHE.move_to_end(key)
+        result, diagnostics = cached
+    else:
+        diagnostic_list: List[str] = []
+        try:
+            result = _preprocess_code_blocks(
+                source,
+                require_code_blocks=require_code_blocks,
+                unboxed_disable_flag=unboxed_disable_flag,
+                diagnostics=diagnostic_list,
+            )
+        except DSLValidationError:
+            for message in diagnostic_list:
+                warnings.warn(message, stacklevel=2)
+            raise
+        diagnostics = tuple(diagnostic_list)
+        _PREPROCESS_CACHE[key] = (result, diagnostics)
+        if len(_PREPROCESS_CACHE) > _PREPROCESS_CACHE_SIZE:
+            _PREPROCESS_CACHE.popitem(last=False)
+
+    # Replayed on cache hits so every compile reports the same warnings.
+    for message in diagnostics:
+        warnings.warn(message, stacklevel=2)
+    return result
+
+
+def _preprocess_code_blocks(
+    source: str,
+    *,
+    require_code_blocks: bool,
+    unboxed_disable_flag: str,
+    diagnostics: List[str],
 ) -> str:
     module = ast.parse(source)
-    if not require_code_blocks and not _contains_code_block_markers(module):
-        return source
-
     output_body: List[ast.stmt] = []
     active: Optional[_ActiveBlock] = None
     abstract_templates: Dict[str, _AbstractTemplate] = {}
     abstract_var_to_id: Dict[str, str] = {}
+    # Instantiations with identical values only differ by the instance suffix;
+    # keyed by (block id, dumped value nodes) -> (instance index, statements).
+    instance_cache: Dict[tuple, Tuple[int, List[ast.stmt]]] = {}
+    # Without strict filtering, sources that never use a marker are returned
+    # unchanged once the loop below has seen every statement.
+    saw_marker = False
 
     for stmt in module.body:
-        begin = _parse_begin(stmt)
+        # Most statements are not marker calls; classify once and skip the
+        # marker parsers for them.
+        marker = _classify_marker_call(stmt)
+
+        begin = _parse_begin(stmt, marker) if marker is not None else None
         if begin is not None:
+            saw_marker = True
             if active is not None:
                 raise DSLValidationError(
                     f"Cannot start block '{begin.block_id}' while block '{active.block_id}' is still open.",
@@ -62,8 +138,11 @@ def preprocess_code_blocks(
             active = begin
             continue
 
-        end_call = _parse_end_call(stmt, abstract_var_to_id)
+        end_call = (
+            _parse_end_call(stmt, marker, abstract_var_to_id) if marker is not None else None
+        )
         if end_call is not None:
+            saw_marker = True
             if active is None:
                 raise DSLValidationError("CodeBlock.end(...) without matching begin(...).", node=stmt)
             if end_call["kind"] != active.kind:
@@ -83,10 +162,13 @@ def preprocess_code_blocks(
                 template = _AbstractTemplate(
                     block_id=active.block_id,
                     descr=active.descr,
-                    params=list(active.params),
+                    params=active.params,
+                    params_set=frozenset(active.params),
                     var_name=active.var_name,
                     begin_node=active.begin_node,
-                    body=list(active.body),
+                    body=active.body,
+                    defined_names=_collect_template_names(active.body),
+                    referenced_names=[_collect_referenced_names(stmt) for stmt in active.body],
                 )
                 abstract_templates[template.block_id] = template
                 if template.var_name:
@@ -94,7 +176,11 @@ def preprocess_code_blocks(
             active = None
             continue
 
-        instantiate = _parse_instantiate(stmt, abstract_var_to_id)
+        instantiate = (
+            _parse_instantiate(stmt, marker, abstract_var_to_id) if marker is not None else None
+        )
+        if instantiate is not None:
+            saw_marker = True
         if instantiate is not None and active is None:
             block_id = instantiate["block_id"]
             template = abstract_templates.get(block_id)
@@ -113,7 +199,7 @@ def preprocess_code_blocks(
                     f"AbstractCodeBlock '{block_id}' missing instantiate values for: {', '.join(missing)}.",
                     node=stmt,
                 )
-            unknown = sorted(set(values.keys()) - set(template.params))
+            unknown = sorted(values.keys() - template.params_set)
             if unknown:
                 raise DSLValidationError(
                     f"AbstractCodeBlock '{block_id}' instantiate(...) has unknown parameters: {unknown}.",
@@ -121,13 +207,22 @@ def preprocess_code_blocks(
                 )
 
             template.instantiate_count += 1
-            output_body.extend(
-                _instantiate_template(
-                    template,
-                    values,
-                    template.instantiate_count,
-                )
+            cache_key = (
+                block_id,
+                frozenset(
+                    (name, ast.dump(value_node))
+                    for name, value_node in instantiate["kwargs"].items()
+                ),
             )
+            cached_instance = instance_cache.get(cache_key)
+            if cached_instance is not None:
+                output_body.extend(
+                    _reindex_instance(template, *cached_instance, template.instantiate_count)
+                )
+                continue
+            instance_body = _instantiate_template(template, values, template.instantiate_count)
+            instance_cache[cache_key] = (template.instantiate_count, instance_body)
+            output_body.extend(instance_body)
             continue
 
         if active is not None:
@@ -139,82 +234,85 @@ def preprocess_code_blocks(
             continue
 
         if require_code_blocks:
-            warnings.warn(
+            diagnostics.append(
                 format_dsl_diagnostic(
                     "Ignoring top-level statement outside any CodeBlock. "
                     f"Wrap it inside CodeBlock.begin/end or pass '{unboxed_disable_flag}' "
                     "to build_game to disable strict block filtering.",
                     node=stmt,
-                ),
-                stacklevel=2,
+                )
             )
             continue
 
         output_body.append(stmt)
 
+    if not saw_marker and not require_code_blocks:
+        return source
+
     if active is not None:
         raise DSLValidationError(
             f"Block '{active.block_id}' was opened but never closed with end(...).",
             node=active.begin_node,
         )
 
-    for template in abstract_templates.values():
-        if template.instantiate_count > 0:
-            continue
-        description = f" ({template.descr})" if template.descr else ""
-        warnings.warn(
-            format_dsl_diagnostic(
-                f"AbstractCodeBlock '{template.block_id}' is never instantiated{description}.",
-                node=template.begin_node,
-            ),
-            stacklevel=2,
-        )
-
+    unused = [
+        template for template in abstract_templates.values() if template.instantiate_count == 0
+    ]
+    if unused:
+        # Reported as one diagnostic located at the first unused template.
+        labels = [
+            f"'{template.block_id}'" + (f" ({template.descr})" if template.descr else "")
+            for template in unused
+        ]
+        if len(unused) == 1:
+            message = f"AbstractCodeBlock {labels[0]} is never instantiated."
+        else:
+            message = f"AbstractCodeBlocks {', '.join(labels)} are never instantiated."
+        diagnostics.append(format_dsl_diagnostic(message, node=unused[0].begin_node))
+
+    # Only unparsed, so the synthesized nodes need no source locations.
     transformed = ast.Module(body=output_body, type_ignores=[])
-    ast.fix_missing_locations(transformed)
     return ast.unparse(transformed)
 
 
-def _contains_code_block_markers(module: ast.Module) -> bool:
-    for stmt in module.body:
-        if _parse_begin(stmt) is not None:
-            return True
-        if _parse_end_call(stmt, {}) is not None:
-            return True
-        if _parse_instantiate(stmt, {}) is not None:
-            return True
-    return False
-
-
-def _parse_begin(stmt: ast.stmt) -> Optional[_ActiveBlock]:
+def _classify_marker_call(stmt: ast.stmt) -> Optional[_MarkerCall]:
     assign_target: Optional[str] = None
-    call: Optional[ast.Call] = None
-    if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
+    stmt_type = type(stmt)
+    if stmt_type is ast.Expr:
         call = stmt.value
     elif (
-        isinstance(stmt, ast.Assign)
+        stmt_type is ast.Assign
         and len(stmt.targets) == 1
-        and isinstance(stmt.targets[0], ast.Name)
-        and isinstance(stmt.value, ast.Call)
+        and type(stmt.targets[0]) is ast.Name
     ):
         assign_target = stmt.targets[0].id
         call = stmt.value
     else:
         return None
-
-    if not isinstance(call.func, ast.Attribute) or not isinstance(call.func.value, ast.Name):
+    if type(call) is not ast.Call or type(call.func) is not ast.Attribute:
         return None
-    cls_name = call.func.value.id
     method = call.func.attr
-    if method != "begin" or cls_name not in {"CodeBlock", "AbstractCodeBlock"}:
+    if method not in _MARKER_METHODS:
+        return None
+    owner = call.func.value.id if type(call.func.value) is ast.Name else None
+    return _MarkerCall(call=call, method=method, owner=owner, assign_target=assign_target)
+
+
+def _parse_begin(stmt: ast.stmt, marker: _MarkerCall) -> Optional[_ActiveBlock]:
+    if marker.method != "begin" or marker.owner not in _BLOCK_CLASSES:
         return None
+    call = marker.call
+    cls_name = marker.owner
+    assign_target = marker.assign_target
 
     if not call.args:
         raise DSLValidationError(f"{cls_name}.begin(...) expects a block id.", node=stmt)
     first_arg = call.args[0]
-    if not (isinstance(first_arg, ast.Constant) and isinstance(first_arg.value, str)):
+    if not (type(first_arg) is ast.Constant and type(first_arg.value) is str):
         raise DSLValidationError(f"{cls_name}.begin(...) block id must be a string literal.", node=stmt)
-    block_id = first_arg.value
+    # Identifiers from the parser are already interned; string literals are
+    # not, so intern the ids and parameter names used as dict keys.
+    block_id = sys.intern(first_arg.value)
     if not block_id:
         raise DSLValidationError(f"{cls_name}.begin(...) block id must be non-empty.", node=stmt)
 
@@ -225,8 +323,8 @@ def _parse_begin(stmt: ast.stmt) -> Optional[_ActiveBlock]:
         for keyword in call.keywords:
             if keyword.arg == "descr":
                 if not (
-                    isinstance(keyword.value, ast.Constant)
-                    and isinstance(keyword.value.value, str)
+                    type(keyword.value) is ast.Constant
+                    and type(keyword.value.value) is str
                 ):
                     raise DSLValidationError(
                         "CodeBlock.begin(..., descr=...) must be a string literal.",
@@ -278,8 +376,8 @@ def _parse_begin(stmt: ast.stmt) -> Optional[_ActiveBlock]:
             )
         if keyword.arg == "descr":
             if not (
-                isinstance(keyword.value, ast.Constant)
-                and isinstance(keyword.value.value, str)
+                type(keyword.value) is ast.Constant
+                and type(keyword.value.value) is str
             ):
                 raise DSLValidationError(
                     "AbstractCodeBlock.begin(..., descr=...) must be a string literal.",
@@ -288,7 +386,7 @@ def _parse_begin(stmt: ast.stmt) -> Optional[_ActiveBlock]:
             descr = keyword.value.value
             continue
         if keyword.arg == "params":
-            if not isinstance(keyword.value, ast.Dict):
+            if type(keyword.value) is not ast.Dict:
                 raise DSLValidationError(
                     "AbstractCodeBlock.begin(..., params=...) must be a dict literal.",
                     node=keyword.value,
@@ -300,15 +398,15 @@ def _parse_begin(stmt: ast.stmt) -> Optional[_ActiveBlock]:
                         node=keyword.value,
                     )
                 if not (
-                    isinstance(key_node, ast.Constant)
-                    and isinstance(key_node.value, str)
+                    type(key_node) is ast.Constant
+                    and type(key_node.value) is str
                     and key_node.value
                 ):
                     raise DSLValidationError(
                         "AbstractCodeBlock params keys must be non-empty strings.",
                         node=key_node,
                     )
-                params.append(key_node.value)
+                params.append(sys.intern(key_node.value))
             continue
         params.append(keyword.arg)
 
@@ -331,17 +429,16 @@ def _parse_begin(stmt: ast.stmt) -> Optional[_ActiveBlock]:
 
 def _parse_end_call(
     stmt: ast.stmt,
+    marker: _MarkerCall,
     abstract_var_to_id: Dict[str, str],
 ) -> Optional[Dict[str, Optional[str]]]:
-    if not isinstance(stmt, ast.Expr) or not isinstance(stmt.value, ast.Call):
-        return None
-    call = stmt.value
-    if not isinstance(call.func, ast.Attribute):
+    if marker.assign_target is not None:
         return None
+    call = marker.call
 
-    if isinstance(call.func.value, ast.Name) and call.func.attr == "end":
-        owner = call.func.value.id
-        if owner == "CodeBlock" or owner == "AbstractCodeBlock":
+    if marker.owner is not None and marker.method == "end":
+        owner = marker.owner
+        if owner in _BLOCK_CLASSES:
             if call.keywords:
                 raise DSLValidationError(f"{owner}.end(...) does not accept keyword args.", node=stmt)
             block_id: Optional[str] = None
@@ -352,20 +449,20 @@ def _parse_end_call(
                         node=stmt,
                     )
                 if not (
-                    isinstance(call.args[0], ast.Constant)
-                    and isinstance(call.args[0].value, str)
+                    type(call.args[0]) is ast.Constant
+                    and type(call.args[0].value) is str
                 ):
                     raise DSLValidationError(
                         f"{owner}.end(...) block id must be a string literal.",
                         node=call.args[0],
                     )
-                block_id = call.args[0].value
+                block_id = sys.intern(call.args[0].value)
             return {
                 "kind": "code" if owner == "CodeBlock" else "abstract",
                 "block_id": block_id,
             }
 
-        if call.func.attr == "end" and owner in abstract_var_to_id:
+        if owner in abstract_var_to_id:
             if call.args or call.keywords:
                 raise DSLValidationError(
                     f"{owner}.end(...) does not accept arguments.",
@@ -380,15 +477,12 @@ def _parse_end_call(
 
 def _parse_instantiate(
     stmt: ast.stmt,
+    marker: _MarkerCall,
     abstract_var_to_id: Dict[str, str],
 ) -> Optional[Dict[str, object]]:
-    if not isinstance(stmt, ast.Expr) or not isinstance(stmt.value, ast.Call):
-        return None
-    call = stmt.value
-    if not isinstance(call.func, ast.Attribute):
-        return None
-    if call.func.attr != "instantiate":
+    if marker.assign_target is not None or marker.method != "instantiate":
         return None
+    call = marker.call
 
     kwargs = {kw.arg: kw.value for kw in call.keywords if kw.arg is not None}
     if any(kw.arg is None for kw in call.keywords):
@@ -397,21 +491,18 @@ def _parse_instantiate(
             node=stmt,
         )
 
-    if isinstance(call.func.value, ast.Name) and call.func.value.id in abstract_var_to_id:
+    if marker.owner is not None and marker.owner in abstract_var_to_id:
         if call.args:
             raise DSLValidationError(
                 "instance.instantiate(...) does not accept positional args.",
                 node=stmt,
             )
         return {
-            "block_id": abstract_var_to_id[call.func.value.id],
+            "block_id": abstract_var_to_id[marker.owner],
             "kwargs": kwargs,
         }
 
-    if (
-        isinstance(call.func.value, ast.Name)
-        and call.func.value.id == "AbstractCodeBlock"
-    ):
+    if marker.owner == "AbstractCodeBlock":
         if not call.args:
             raise DSLValidationError(
                 "AbstractCodeBlock.instantiate(...) expects block id as first positional arg.",
@@ -423,13 +514,13 @@ def _parse_instantiate(
                 node=stmt,
             )
         block_arg = call.args[0]
-        if not (isinstance(block_arg, ast.Constant) and isinstance(block_arg.value, str)):
+        if not (type(block_arg) is ast.Constant and type(block_arg.value) is str):
             raise DSLValidationError(
                 "AbstractCodeBlock.instantiate(...) block id must be a string literal.",
                 node=block_arg,
             )
         return {
-            "block_id": block_arg.value,
+            "block_id": sys.intern(block_arg.value),
             "kwargs": kwargs,
         }
 
@@ -437,6 +528,9 @@ def _parse_instantiate(
 
 
 def _parse_static_macro_value(node: ast.AST, context_node: ast.AST):
+    # Most macro values are plain constants; only containers need literal_eval.
+    if isinstance(node, ast.Constant) and _is_supported_macro_value(node.value):
+        return node.value
     try:
         value = ast.literal_eval(node)
     except Exception as exc:  # pragma: no cover - ast error formatting
@@ -455,20 +549,23 @@ def _parse_static_macro_value(node: ast.AST, context_node: ast.AST):
 
 
 def _is_supported_macro_value(value) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, (bool, int, float, str)):
-        return True
-    if isinstance(value, list):
-        return all(_is_supported_macro_value(item) for item in value)
-    if isinstance(value, dict):
-        for key, item in value.items():
-            if not isinstance(key, str):
-                return False
-            if not _is_supported_macro_value(item):
-                return False
-        return True
-    return False
+    # Iterative walk: nested literals do not grow the Python call stack.
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, (bool, int, float, str)):
+            continue
+        if isinstance(current, list):
+            stack.extend(current)
+            continue
+        if isinstance(current, dict):
+            for key, item in current.items():
+                if not isinstance(key, str):
+                    return False
+                stack.append(item)
+            continue
+        return False
+    return True
 
 
 def _instantiate_template(
@@ -478,62 +575,134 @@ def _instantiate_template(
 ) -> List[ast.stmt]:
     macro_values_ast = {name: _literal_to_ast(value) for name, value in values.items()}
 
-    name_map: Dict[str, str] = {}
-    for stmt in template.body:
-        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            name_map[stmt.name] = f"{stmt.name}__{template.block_id}_{instance_index}"
-        elif isinstance(stmt, ast.Assign):
-            for target in stmt.targets:
-                if isinstance(target, ast.Name):
-                    name_map[target.id] = f"{target.id}__{template.block_id}_{instance_index}"
-        elif isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
-            name_map[stmt.target.id] = (
-                f"{stmt.target.id}__{template.block_id}_{instance_index}"
-            )
+    suffix = f"__{template.block_id}_{instance_index}"
+    name_map = {name: f"{name}{suffix}" for name in template.defined_names}
 
-    replacer = _TemplateReplacer(macro_values_ast=macro_values_ast, name_map=name_map)
+    rewritten_names = name_map.keys() | macro_values_ast.keys()
     out: List[ast.stmt] = []
-    for stmt in template.body:
-        cloned = copy.deepcopy(stmt)
-        rewritten = replacer.visit(cloned)
-        ast.fix_missing_locations(rewritten)
-        out.append(rewritten)
+    for stmt, referenced in zip(template.body, template.referenced_names):
+        cloned = _clone_ast(stmt)
+        if referenced.isdisjoint(rewritten_names):
+            out.append(cloned)
+        else:
+            out.append(_apply_replacements(cloned, macro_values_ast, name_map))
     return out
 
 
-class _TemplateReplacer(ast.NodeTransformer):
-    def __init__(self, *, macro_values_ast: Dict[str, ast.AST], name_map: Dict[str, str]) -> None:
-        self._macro_values_ast = macro_values_ast
-        self._name_map = name_map
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        node = self.generic_visit(node)
-        if node.name in self._name_map:
-            node.name = self._name_map[node.name]
-        return node
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        node = self.generic_visit(node)
-        if node.name in self._name_map:
-            node.name = self._name_map[node.name]
-        return node
+def _reindex_instance(
+    template: _AbstractTemplate,
+    cached_index: int,
+    cached_body: List[ast.stmt],
+    instance_index: int,
+) -> List[ast.stmt]:
+    """Clone an instance built with the same values under a new suffix."""
+    old_suffix = f"__{template.block_id}_{cached_index}"
+    new_suffix = f"__{template.block_id}_{instance_index}"
+    rename = {
+        f"{name}{old_suffix}": f"{name}{new_suffix}" for name in template.defined_names
+    }
+    out: List[ast.stmt] = []
+    for stmt, referenced in zip(cached_body, template.referenced_names):
+        cloned = _clone_ast(stmt)
+        if not referenced.isdisjoint(template.defined_names):
+            for node in ast.walk(cloned):
+                if isinstance(node, ast.Name):
+                    node.id = rename.get(node.id, node.id)
+                elif isinstance(node, _DEFINITION_TYPES):
+                    node.name = rename.get(node.name, node.name)
+        out.append(cloned)
+    return out
 
-    def visit_ClassDef(self, node: ast.ClassDef):
-        node = self.generic_visit(node)
-        if node.name in self._name_map:
-            node.name = self._name_map[node.name]
-        return node
 
-    def visit_Name(self, node: ast.Name):
-        if isinstance(node.ctx, ast.Load):
-            if node.id in self._macro_values_ast:
-                return copy.deepcopy(self._macro_values_ast[node.id])
-            if node.id in self._name_map:
-                return ast.copy_location(ast.Name(id=self._name_map[node.id], ctx=node.ctx), node)
-        elif isinstance(node.ctx, ast.Store):
-            if node.id in self._name_map:
-                node.id = self._name_map[node.id]
+def _collect_referenced_names(stmt: ast.stmt) -> frozenset:
+    names = set()
+    for node in ast.walk(stmt):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, _DEFINITION_TYPES):
+            names.add(node.name)
+    return frozenset(names)
+
+
+def _clone_ast(node):
+    """Copy an AST subtree.
+
+    ASTs are acyclic and their leaves are immutable, so this skips the memo
+    and ``__reduce_ex__`` machinery of ``copy.deepcopy``.
+    """
+    if isinstance(node, ast.AST):
+        node_type = type(node)
+        clone = node_type.__new__(node_type)
+        for name in node._fields:
+            setattr(clone, name, _clone_ast(getattr(node, name, None)))
+        for name in node._attributes:
+            if hasattr(node, name):
+                setattr(clone, name, getattr(node, name))
+        return clone
+    if isinstance(node, list):
+        return [_clone_ast(item) for item in node]
+    return node
+
+
+def _collect_template_names(body: List[ast.stmt]) -> List[str]:
+    names: Dict[str, None] = {}
+    for stmt in body:
+        if isinstance(stmt, _DEFINITION_TYPES):
+            names[stmt.name] = None
+        elif isinstance(stmt, ast.Assign):
+            for target in stmt.targets:
+                if isinstance(target, ast.Name):
+                    names[target.id] = None
+        elif isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+            names[stmt.target.id] = None
+    return list(names)
+
+
+def _apply_replacements(
+    node: ast.AST,
+    macro_values_ast: Dict[str, ast.AST],
+    name_map: Dict[str, str],
+) -> ast.AST:
+    """Substitute macros and rename defined names in a cloned subtree.
+
+    Nodes are mutated in place; only macro substitution sites produce a new
+    node, which the caller stores in place of the old one. Macro value nodes
+    are shared between sites rather than cloned: the output is only
+    unparsed, and later clones of an instance copy them.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        ctx_type = type(node.ctx)
+        if ctx_type is ast.Load:
+            macro_value = macro_values_ast.get(node.id)
+            if macro_value is not None:
+                return macro_value
+        if ctx_type is not ast.Del:
+            node.id = name_map.get(node.id, node.id)
         return node
+    if node_type in _DEFINITION_TYPES:
+        node.name = name_map.get(node.name, node.name)
+    _walk_children(node, macro_values_ast, name_map)
+    return node
+
+
+def _walk_children(
+    node: ast.AST,
+    macro_values_ast: Dict[str, ast.AST],
+    name_map: Dict[str, str],
+) -> None:
+    for name in node._fields:
+        value = getattr(node, name, None)
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                if isinstance(item, ast.AST):
+                    replaced = _apply_replacements(item, macro_values_ast, name_map)
+                    if replaced is not item:
+                        value[index] = replaced
+        elif isinstance(value, ast.AST):
+            replaced = _apply_replacements(value, macro_values_ast, name_map)
+            if replaced is not value:
+                setattr(node, name, replaced)
 
 
 def _literal_to_ast(value) -> ast.AST:
@@ -1,22 +1,21 @@
 import ast
 from typing import Dict
 
-from nanocalibur.typesys import FieldType, Prim, PrimType
+from nanocalibur.typesys import FieldType, ListType, Prim, PrimType
 
-_ALLOWED_BIN = {
+# Operator node type -> target operator. Binary, boolean, comparison and
+# unary operator node types are disjoint, so one table serves every handler.
+_OP_TABLE = {
+    # Binary operators.
     ast.Add: "+",
     ast.Sub: "-",
     ast.Mult: "*",
     ast.Div: "/",
     ast.Mod: "%",
-}
-
-_ALLOWED_BOOL = {
+    # Boolean operators.
     ast.And: "&&",
     ast.Or: "||",
-}
-
-_ALLOWED_CMP = {
+    # Comparisons.
     ast.Eq: "==",
     ast.NotEq: "!=",
     ast.Lt: "<",
@@ -25,9 +24,7 @@ _ALLOWED_CMP = {
     ast.GtE: ">=",
     ast.Is: "==",
     ast.IsNot: "!=",
-}
-
-_ALLOWED_UNARY = {
+    # Unary operators.
     ast.Not: "!",
     ast.UAdd: "+",
     ast.USub: "-",
@@ -40,6 +37,10 @@ _PRIM_NAMES = {
     "bool": Prim.BOOL,
 }
 
+# Field types are frozen, so annotations share one instance per type.
+_PRIM_TYPES: Dict[str, PrimType] = {name: PrimType(prim) for name, prim in _PRIM_NAMES.items()}
+_LIST_TYPES: Dict[FieldType, ListType] = {}
+
 BASE_ACTOR_FIELDS: Dict[str, FieldType] = {
     "uid": PrimType(Prim.STR),
     "x": PrimType(Prim.FLOAT),
@@ -68,11 +69,10 @@ BASE_ACTOR_DEFAULT_OVERRIDES = {
 CALLABLE_EXPR_PREFIX = "__nc_callable__:"
 
 __all__ = [
-    "_ALLOWED_BIN",
-    "_ALLOWED_BOOL",
-    "_ALLOWED_CMP",
-    "_ALLOWED_UNARY",
+    "_OP_TABLE",
     "_PRIM_NAMES",
+    "_PRIM_TYPES",
+    "_LIST_TYPES",
     "BASE_ACTOR_FIELDS",
     "BASE_ACTOR_NO_DEFAULT_FIELDS",
     "BASE_ACTOR_DEFAULT_OVERRIDES",
@@ -38,11 +38,9 @@ from .constants import (
     BASE_ACTOR_DEFAULT_OVERRIDES,
     BASE_ACTOR_FIELDS,
     BASE_ACTOR_NO_DEFAULT_FIELDS,
-    _ALLOWED_BIN,
-    _ALLOWED_BOOL,
-    _ALLOWED_CMP,
-    _ALLOWED_UNARY,
-    _PRIM_NAMES,
+    _OP_TABLE,
+    _LIST_TYPES,
+    _PRIM_TYPES,
 )
 from .helpers import (
     _expect_name,
@@ -55,7 +53,7 @@ from .helpers import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionScope:
     defined_names: Set[str]
     actor_var_types: Dict[str, str]
@@ -72,6 +70,30 @@ class DSLCompiler:
         self.schemas = SchemaRegistry()
         self.global_actor_types: Dict[str, Optional[str]] = dict(global_actor_types or {})
         self.callable_signatures: Dict[str, int] = {}
+        # Exact node type -> handler; DSL sources only contain plain ast nodes.
+        self._stmt_handlers = {
+            ast.Assign: self._compile_assign_stmt,
+            ast.AnnAssign: self._compile_ann_assign_stmt,
+            ast.If: self._compile_if_stmt,
+            ast.While: self._compile_while_stmt,
+            ast.For: self._compile_for_stmt,
+            ast.Expr: self._compile_expr_stmt,
+            ast.Pass: self._compile_pass_stmt,
+            ast.Continue: self._compile_continue_stmt,
+        }
+        self._expr_handlers = {
+            ast.Constant: self._compile_constant_expr,
+            ast.List: self._compile_list_expr,
+            ast.Dict: self._compile_dict_expr,
+            ast.Name: self._compile_name_expr,
+            ast.Attribute: self._compile_attribute_expr,
+            ast.Subscript: self._compile_subscript_expr,
+            ast.BinOp: self._compile_binop_expr,
+            ast.BoolOp: self._compile_boolop_expr,
+            ast.UnaryOp: self._compile_unaryop_expr,
+            ast.Compare: self._compile_compare_expr,
+            ast.Call: self._compile_call_expr,
+        }
 
     def set_callable_signatures(self, signatures: Dict[str, int]) -> None:
         """Register callable helper signatures available in expressions."""
@@ -98,34 +120,26 @@ class DSLCompiler:
                 raise DSLValidationError(_format_syntax_error(exc, source)) from exc
 
             actions: List[ActionIR] = []
-
-            # Pass 1: collect schemas so action bindings can reference them.
+            # Schemas are registered while walking the module; actions are
+            # compiled afterwards so bindings can reference any schema.
+            functions: List[ast.FunctionDef] = []
             for node in module.body:
                 with dsl_node_context(node):
-                    if _is_docstring_expr(node):
+                    if isinstance(node, ast.FunctionDef):
+                        functions.append(node)
                         continue
                     if isinstance(node, ast.ClassDef):
                         self._register_actor_schema(node)
                         continue
-                    if isinstance(node, ast.FunctionDef):
+                    if _is_docstring_expr(node):
                         continue
                     raise DSLValidationError(
                         f"Unsupported top-level statement: {type(node).__name__}"
                     )
 
-            # Pass 2: compile actions.
-            for node in module.body:
+            for node in functions:
                 with dsl_node_context(node):
-                    if isinstance(node, ast.FunctionDef):
-                        actions.append(self._compile_action(node))
-                    elif isinstance(node, ast.ClassDef):
-                        continue
-                    elif _is_docstring_expr(node):
-                        continue
-                    else:
-                        raise DSLValidationError(
-                            f"Unsupported top-level statement: {type(node).__name__}"
-                        )
+                    actions.append(self._compile_action(node))
 
             return actions
 
@@ -212,13 +226,17 @@ class DSLCompiler:
         return self._parse_container_field_type(annotation)
 
     def _parse_container_field_type(self, node: ast.AST) -> FieldType:
-        if isinstance(node, ast.Name) and node.id in _PRIM_NAMES:
-            return PrimType(_PRIM_NAMES[node.id])
+        if isinstance(node, ast.Name) and node.id in _PRIM_TYPES:
+            return _PRIM_TYPES[node.id]
 
         if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name):
             container_name = node.value.id
             if container_name in {"List", "list"}:
-                return ListType(self._parse_container_field_type(node.slice))
+                elem_type = self._parse_container_field_type(node.slice)
+                list_type = _LIST_TYPES.get(elem_type)
+                if list_type is None:
+                    list_type = _LIST_TYPES[elem_type] = ListType(elem_type)
+                return list_type
             if container_name in {"Dict", "dict"}:
                 if not isinstance(node.slice, ast.Tuple) or len(node.slice.elts) != 2:
                     raise DSLValidationError(
@@ -612,129 +630,196 @@ class DSLCompiler:
 
     def _compile_stmt(self, stmt: ast.stmt, scope: ActionScope, loop_depth: int):
         with dsl_node_context(stmt):
-            if isinstance(stmt, ast.Assign):
-                if len(stmt.targets) != 1:
-                    raise DSLValidationError("Chained assignment is not allowed.")
-                target = self._compile_assign_target(stmt.targets[0], scope)
-                if (
-                    isinstance(target, Var)
-                    and isinstance(stmt.value, ast.Call)
-                    and isinstance(stmt.value.func, ast.Name)
-                    and stmt.value.func.id in self.schemas.actor_fields
-                ):
-                    (
-                        actor_type_name,
-                        uid_expr,
-                        fields_payload_json,
-                    ) = self._compile_actor_ctor_template(
-                        stmt.value,
-                        scope,
-                        source_name=f"{target.name} = {stmt.value.func.id}(...)",
-                    )
-                    scope.defined_names.add(target.name)
-                    scope.actor_var_types.pop(target.name, None)
-                    scope.actor_list_var_types.pop(target.name, None)
-                    scope.spawn_actor_templates[target.name] = (
-                        actor_type_name,
-                        uid_expr,
-                        fields_payload_json,
-                    )
-                    return None
-                value = self._compile_expr(stmt.value, scope, allow_range_call=False)
-                if isinstance(target, Var):
-                    scope.defined_names.add(target.name)
-                    self._sync_var_types_on_assign(target.name, value, scope)
-                return Assign(target=target, value=value)
-
-            if isinstance(stmt, ast.AnnAssign):
-                if stmt.value is None:
-                    raise DSLValidationError("Annotated assignment must assign a value.")
-                target = self._compile_assign_target(stmt.target, scope)
-                value = self._compile_expr(stmt.value, scope, allow_range_call=False)
-                if isinstance(target, Var):
-                    scope.defined_names.add(target.name)
-                    self._sync_var_types_on_assign(target.name, value, scope)
-                return Assign(target=target, value=value)
-
-            if isinstance(stmt, ast.If):
-                body = []
-                for child in stmt.body:
-                    compiled = self._compile_stmt(child, scope, loop_depth=loop_depth)
-                    if compiled is not None:
-                        body.append(compiled)
-                orelse = []
-                for child in stmt.orelse:
-                    compiled = self._compile_stmt(child, scope, loop_depth=loop_depth)
-                    if compiled is not None:
-                        orelse.append(compiled)
-                return If(
-                    condition=self._compile_expr(stmt.test, scope, allow_range_call=False),
-                    body=body,
-                    orelse=orelse,
-                )
-
-            if isinstance(stmt, ast.While):
-                body = []
-                for child in stmt.body:
-                    compiled = self._compile_stmt(child, scope, loop_depth=loop_depth + 1)
-                    if compiled is not None:
-                        body.append(compiled)
-                return While(
-                    condition=self._compile_expr(stmt.test, scope, allow_range_call=False),
-                    body=body,
-                )
-
-            if isinstance(stmt, ast.For):
-                if stmt.orelse:
-                    raise DSLValidationError("for-else is not supported.")
-                if not isinstance(stmt.target, ast.Name):
-                    raise DSLValidationError("for loop target must be a simple name.")
-
-                iterable = self._compile_expr(stmt.iter, scope, allow_range_call=True)
-                scope.defined_names.add(stmt.target.id)
-                iter_actor_type = self._iterated_actor_type(iterable, scope)
-                if iter_actor_type is None:
-                    scope.actor_var_types.pop(stmt.target.id, None)
-                else:
-                    scope.actor_var_types[stmt.target.id] = iter_actor_type
-                scope.actor_list_var_types.pop(stmt.target.id, None)
-                body = []
-                for child in stmt.body:
-                    compiled = self._compile_stmt(child, scope, loop_depth=loop_depth + 1)
-                    if compiled is not None:
-                        body.append(compiled)
-                return For(
-                    var=stmt.target.id,
-                    iterable=iterable,
-                    body=body,
-                )
+            handler = self._stmt_handlers.get(type(stmt))
+            if handler is None:
+                raise DSLValidationError(f"Unsupported statement: {type(stmt).__name__}")
+            return handler(stmt, scope, loop_depth)
+
+    def _compile_assign_stmt(self, stmt: ast.Assign, scope: ActionScope, loop_depth: int):
+        if len(stmt.targets) != 1:
+            raise DSLValidationError("Chained assignment is not allowed.")
+        target = self._compile_assign_target(stmt.targets[0], scope)
+        if (
+            isinstance(target, Var)
+            and isinstance(stmt.value, ast.Call)
+            and isinstance(stmt.value.func, ast.Name)
+            and stmt.value.func.id in self.schemas.actor_fields
+        ):
+            (
+                actor_type_name,
+                uid_expr,
+                fields_payload_json,
+            ) = self._compile_actor_ctor_template(
+                stmt.value,
+                scope,
+                source_name=f"{target.name} = {stmt.value.func.id}(...)",
+            )
+            scope.defined_names.add(target.name)
+            scope.actor_var_types.pop(target.name, None)
+            scope.actor_list_var_types.pop(target.name, None)
+            scope.spawn_actor_templates[target.name] = (
+                actor_type_name,
+                uid_expr,
+                fields_payload_json,
+            )
+            return None
+        value = self._compile_expr(stmt.value, scope, allow_range_call=False)
+        if isinstance(target, Var):
+            scope.defined_names.add(target.name)
+            self._sync_var_types_on_assign(target.name, value, scope)
+        return Assign(target=target, value=value)
+
+    def _compile_ann_assign_stmt(
+        self,
+        stmt: ast.AnnAssign,
+        scope: ActionScope,
+        loop_depth: int,
+    ):
+        if stmt.value is None:
+            raise DSLValidationError("Annotated assignment must assign a value.")
+        target = self._compile_assign_target(stmt.target, scope)
+        value = self._compile_expr(stmt.value, scope, allow_range_call=False)
+        if isinstance(target, Var):
+            scope.defined_names.add(target.name)
+            self._sync_var_types_on_assign(target.name, value, scope)
+        return Assign(target=target, value=value)
+
+    def _compile_if_stmt(self, stmt: ast.If, scope: ActionScope, loop_depth: int):
+        body = []
+        for child in stmt.body:
+            compiled = self._compile_stmt(child, scope, loop_depth=loop_depth)
+            if compiled is not None:
+                body.append(compiled)
+        orelse = []
+        for child in stmt.orelse:
+            compiled = self._compile_stmt(child, scope, loop_depth=loop_depth)
+            if compiled is not None:
+                orelse.append(compiled)
+        return If(
+            condition=self._compile_expr(stmt.test, scope, allow_range_call=False),
+            body=body,
+            orelse=orelse,
+        )
 
-            if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Yield):
-                return self._compile_yield_stmt(stmt.value, scope)
+    def _compile_while_stmt(self, stmt: ast.While, scope: ActionScope, loop_depth: int):
+        body = []
+        for child in stmt.body:
+            compiled = self._compile_stmt(child, scope, loop_depth=loop_depth + 1)
+            if compiled is not None:
+                body.append(compiled)
+        return While(
+            condition=self._compile_expr(stmt.test, scope, allow_range_call=False),
+            body=body,
+        )
 
-            if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
-                return self._compile_call_stmt(stmt.value, scope)
+    def _compile_for_stmt(self, stmt: ast.For, scope: ActionScope, loop_depth: int):
+        if stmt.orelse:
+            raise DSLValidationError("for-else is not supported.")
+        if not isinstance(stmt.target, ast.Name):
+            raise DSLValidationError("for loop target must be a simple name.")
+
+        iterable = self._compile_expr(stmt.iter, scope, allow_range_call=True)
+        var_name = stmt.target.id
+        scope.defined_names.add(var_name)
+        iter_actor_type = self._iterated_actor_type(iterable, scope)
+        if iter_actor_type is None:
+            scope.actor_var_types.pop(var_name, None)
+        else:
+            scope.actor_var_types[var_name] = iter_actor_type
+        scope.actor_list_var_types.pop(var_name, None)
+        body = []
+        for child in stmt.body:
+            compiled = self._compile_stmt(child, scope, loop_depth=loop_depth + 1)
+            if compiled is not None:
+                body.append(compiled)
+        return For(
+            var=var_name,
+            iterable=iterable,
+            body=body,
+        )
 
-            if isinstance(stmt, ast.Pass):
-                return None
+    def _compile_expr_stmt(self, stmt: ast.Expr, scope: ActionScope, loop_depth: int):
+        if isinstance(stmt.value, ast.Yield):
+            return self._compile_yield_stmt(stmt.value, scope)
+        if isinstance(stmt.value, ast.Call):
+            return self._compile_call_stmt(stmt.value, scope)
+        raise DSLValidationError(f"Unsupported statement: {type(stmt).__name__}")
 
-            if isinstance(stmt, ast.Continue):
-                if loop_depth <= 0:
-                    raise DSLValidationError("'continue' is only allowed inside loops.")
-                return Continue()
+    def _compile_pass_stmt(self, stmt: ast.Pass, scope: ActionScope, loop_depth: int):
+        return None
 
-            raise DSLValidationError(f"Unsupported statement: {type(stmt).__name__}")
+    def _compile_continue_stmt(self, stmt: ast.Continue, scope: ActionScope, loop_depth: int):
+        if loop_depth <= 0:
+            raise DSLValidationError("'continue' is only allowed inside loops.")
+        return Continue()
 
     def _compile_yield_stmt(self, expr: ast.Yield, scope: ActionScope) -> Yield:
         if expr.value is None:
             raise DSLValidationError("yield must return a Tick binding variable.")
+        wait_call = expr.value
+        if (
+            isinstance(wait_call, ast.Call)
+            and isinstance(wait_call.func, ast.Attribute)
+            and isinstance(wait_call.func.value, ast.Name)
+            and wait_call.func.value.id in scope.scene_vars
+            and wait_call.func.attr == "wait_ticks"
+        ):
+            owner = wait_call.func.value.id
+            if wait_call.keywords or len(wait_call.args) != 1:
+                raise DSLValidationError(f"{owner}.wait_ticks(...) expects one argument.")
+            # The runtime sleeps a generator that yields a number n for n ticks.
+            ticks = self._compile_expr(wait_call.args[0], scope, allow_range_call=False)
+            if not self._may_be_int_expr(ticks, scope):
+                raise DSLValidationError(
+                    f"{owner}.wait_ticks(...) expects an int number of ticks."
+                )
+            return Yield(value=ticks)
         value = self._compile_expr(expr.value, scope, allow_range_call=False)
         if not isinstance(value, Var) or value.name not in scope.tick_vars:
             raise DSLValidationError(
-                "yield must reference a parameter annotated as Tick."
+                "yield must reference a parameter annotated as Tick "
+                "or call scene.wait_ticks(...)."
             )
         return Yield(value=value)
 
+    def _may_be_int_expr(self, value: Expr, scope: ActionScope) -> bool:
+        """Return False when ``value`` is statically known not to be an int.
+
+        Plain locals, globals and call results carry no static type here and
+        are accepted.
+        """
+        if isinstance(value, Const):
+            return type(value.value) is int
+        if isinstance(value, (ListExpr, ObjectExpr)):
+            return False
+        if isinstance(value, Var):
+            return not (
+                value.name in scope.actor_var_types
+                or value.name in scope.actor_list_var_types
+                or value.name in scope.role_var_types
+                or value.name in scope.scene_vars
+                or value.name in scope.tick_vars
+                or value.name in scope.spawn_actor_templates
+            )
+        if isinstance(value, Attr):
+            actor_type = scope.actor_var_types.get(value.obj)
+            if actor_type is not None:
+                return self.schemas.actor_field_type(actor_type, value.field) == _PRIM_TYPES["int"]
+            role_type = scope.role_var_types.get(value.obj)
+            if role_type is not None:
+                return self.schemas.role_field_type(role_type, value.field) == _PRIM_TYPES["int"]
+            return True
+        if isinstance(value, Unary):
+            return value.op != "!" and self._may_be_int_expr(value.value, scope)
+        if isinstance(value, Binary):
+            # "/" is true division; comparisons and &&/|| produce booleans.
+            return (
+                value.op in {"+", "-", "*", "%"}
+                and self._may_be_int_expr(value.left, scope)
+                and self._may_be_int_expr(value.right, scope)
+            )
+        return True
+
     def _compile_call_stmt(self, expr: ast.Call, scope: ActionScope):
         if not (
             isinstance(expr.func, ast.Attribute)
@@ -1204,125 +1289,160 @@ class DSLCompiler:
 
     def _compile_expr(self, expr: ast.AST, scope: ActionScope, allow_range_call: bool):
         with dsl_node_context(expr):
-            if isinstance(expr, ast.Constant):
-                if expr.value is None:
-                    return Const(None)
-                if isinstance(expr.value, bool):
-                    return Const(expr.value)
-                if isinstance(expr.value, (int, float, str)):
-                    return Const(expr.value)
+            handler = self._expr_handlers.get(type(expr))
+            if handler is None:
+                raise DSLValidationError(f"Unsupported expression: {type(expr).__name__}")
+            return handler(expr, scope, allow_range_call)
+
+    def _compile_constant_expr(
+        self,
+        expr: ast.Constant,
+        scope: ActionScope,
+        allow_range_call: bool,
+    ):
+        if expr.value is None:
+            return Const(None)
+        if isinstance(expr.value, bool):
+            return Const(expr.value)
+        if isinstance(expr.value, (int, float, str)):
+            return Const(expr.value)
+        raise DSLValidationError(
+            "Only int, float, str, bool, and None constants are allowed."
+        )
+
+    def _compile_list_expr(self, expr: ast.List, scope: ActionScope, allow_range_call: bool):
+        return ListExpr(
+            items=[
+                self._compile_expr(item, scope, allow_range_call=False)
+                for item in expr.elts
+            ]
+        )
+
+    def _compile_dict_expr(self, expr: ast.Dict, scope: ActionScope, allow_range_call: bool):
+        fields: Dict[str, Expr] = {}
+        for key_node, value_node in zip(expr.keys, expr.values):
+            if key_node is None:
+                raise DSLValidationError("Dict unpacking is not supported.")
+            key_expr = self._compile_expr(key_node, scope, allow_range_call=False)
+            if not isinstance(key_expr, Const) or not isinstance(key_expr.value, str):
                 raise DSLValidationError(
-                    "Only int, float, str, bool, and None constants are allowed."
+                    "Dict literal keys must be constant strings."
                 )
+            fields[key_expr.value] = self._compile_expr(
+                value_node, scope, allow_range_call=False
+            )
+        return ObjectExpr(fields=fields)
 
-            if isinstance(expr, ast.List):
-                return ListExpr(
-                    items=[
-                        self._compile_expr(item, scope, allow_range_call=False)
-                        for item in expr.elts
-                    ]
-                )
+    def _compile_name_expr(self, expr: ast.Name, scope: ActionScope, allow_range_call: bool):
+        if expr.id not in scope.defined_names:
+            raise DSLValidationError(f"Unknown variable '{expr.id}'.")
+        return Var(expr.id)
 
-            if isinstance(expr, ast.Dict):
-                fields: Dict[str, Expr] = {}
-                for key_node, value_node in zip(expr.keys, expr.values):
-                    if key_node is None:
-                        raise DSLValidationError("Dict unpacking is not supported.")
-                    key_expr = self._compile_expr(key_node, scope, allow_range_call=False)
-                    if not isinstance(key_expr, Const) or not isinstance(key_expr.value, str):
-                        raise DSLValidationError(
-                            "Dict literal keys must be constant strings."
-                        )
-                    fields[key_expr.value] = self._compile_expr(
-                        value_node, scope, allow_range_call=False
-                    )
-                return ObjectExpr(fields=fields)
-
-            if isinstance(expr, ast.Name):
-                if expr.id not in scope.defined_names:
-                    raise DSLValidationError(f"Unknown variable '{expr.id}'.")
-                return Var(expr.id)
-
-            if isinstance(expr, ast.Attribute):
-                return self._compile_attr(expr, scope)
-
-            if isinstance(expr, ast.Subscript):
-                if isinstance(expr.slice, ast.Slice):
-                    raise DSLValidationError("Slice expressions are not supported.")
-                return SubscriptExpr(
-                    value=self._compile_expr(expr.value, scope, allow_range_call=False),
-                    index=self._compile_expr(expr.slice, scope, allow_range_call=False),
-                )
+    def _compile_attribute_expr(
+        self,
+        expr: ast.Attribute,
+        scope: ActionScope,
+        allow_range_call: bool,
+    ):
+        return self._compile_attr(expr, scope)
 
-            if isinstance(expr, ast.BinOp):
-                op = _ALLOWED_BIN.get(type(expr.op))
-                if op is None:
-                    raise DSLValidationError(
-                        f"Unsupported binary operator: {type(expr.op).__name__}"
-                    )
-                return Binary(
-                    op=op,
-                    left=self._compile_expr(expr.left, scope, allow_range_call=False),
-                    right=self._compile_expr(expr.right, scope, allow_range_call=False),
-                )
+    def _compile_subscript_expr(
+        self,
+        expr: ast.Subscript,
+        scope: ActionScope,
+        allow_range_call: bool,
+    ):
+        if isinstance(expr.slice, ast.Slice):
+            raise DSLValidationError("Slice expressions are not supported.")
+        return SubscriptExpr(
+            value=self._compile_expr(expr.value, scope, allow_range_call=False),
+            index=self._compile_expr(expr.slice, scope, allow_range_call=False),
+        )
 
-            if isinstance(expr, ast.BoolOp):
-                op = _ALLOWED_BOOL.get(type(expr.op))
-                if op is None:
-                    raise DSLValidationError(
-                        f"Unsupported boolean operator: {type(expr.op).__name__}"
-                    )
-                compiled_values = [
-                    self._compile_expr(v, scope, allow_range_call=False) for v in expr.values
-                ]
-                combined = compiled_values[0]
-                for value in compiled_values[1:]:
-                    combined = Binary(op=op, left=combined, right=value)
-                return combined
-
-            if isinstance(expr, ast.UnaryOp):
-                op = _ALLOWED_UNARY.get(type(expr.op))
-                if op is None:
-                    raise DSLValidationError(
-                        f"Unsupported unary operator: {type(expr.op).__name__}"
-                    )
-                return Unary(
-                    op=op,
-                    value=self._compile_expr(expr.operand, scope, allow_range_call=False),
-                )
+    def _compile_binop_expr(self, expr: ast.BinOp, scope: ActionScope, allow_range_call: bool):
+        op = _OP_TABLE.get(type(expr.op))
+        if op is None:
+            raise DSLValidationError(
+                f"Unsupported binary operator: {type(expr.op).__name__}"
+            )
+        return Binary(
+            op=op,
+            left=self._compile_expr(expr.left, scope, allow_range_call=False),
+            right=self._compile_expr(expr.right, scope, allow_range_call=False),
+        )
 
-            if isinstance(expr, ast.Compare):
-                if len(expr.ops) != 1 or len(expr.comparators) != 1:
-                    raise DSLValidationError("Chained comparisons are not supported.")
-                left_expr = self._compile_expr(expr.left, scope, allow_range_call=False)
-                right_expr = self._compile_expr(
-                    expr.comparators[0], scope, allow_range_call=False
-                )
-                op_node = type(expr.ops[0])
-                if op_node in {ast.Is, ast.IsNot}:
-                    left_is_none = isinstance(left_expr, Const) and left_expr.value is None
-                    right_is_none = isinstance(right_expr, Const) and right_expr.value is None
-                    if not (left_is_none or right_is_none):
-                        raise DSLValidationError(
-                            "'is'/'is not' comparisons are only supported with None."
-                        )
-                op = _ALLOWED_CMP.get(op_node)
-                if op is None:
-                    raise DSLValidationError(
-                        f"Unsupported comparison operator: {type(expr.ops[0]).__name__}"
-                    )
-                return Binary(
-                    op=op,
-                    left=left_expr,
-                    right=right_expr,
-                )
+    def _compile_boolop_expr(
+        self,
+        expr: ast.BoolOp,
+        scope: ActionScope,
+        allow_range_call: bool,
+    ):
+        op = _OP_TABLE.get(type(expr.op))
+        if op is None:
+            raise DSLValidationError(
+                f"Unsupported boolean operator: {type(expr.op).__name__}"
+            )
+        values = iter(expr.values)
+        combined = self._compile_expr(next(values), scope, allow_range_call=False)
+        for value in values:
+            combined = Binary(
+                op=op,
+                left=combined,
+                right=self._compile_expr(value, scope, allow_range_call=False),
+            )
+        return combined
 
-            if isinstance(expr, ast.Call):
-                if allow_range_call:
-                    return self._compile_range_call(expr, scope)
-                return self._compile_builtin_expr_call(expr, scope)
+    def _compile_unaryop_expr(
+        self,
+        expr: ast.UnaryOp,
+        scope: ActionScope,
+        allow_range_call: bool,
+    ):
+        op = _OP_TABLE.get(type(expr.op))
+        if op is None:
+            raise DSLValidationError(
+                f"Unsupported unary operator: {type(expr.op).__name__}"
+            )
+        return Unary(
+            op=op,
+            value=self._compile_expr(expr.operand, scope, allow_range_call=False),
+        )
+
+    def _compile_compare_expr(
+        self,
+        expr: ast.Compare,
+        scope: ActionScope,
+        allow_range_call: bool,
+    ):
+        if len(expr.ops) != 1 or len(expr.comparators) != 1:
+            raise DSLValidationError("Chained comparisons are not supported.")
+        left_expr = self._compile_expr(expr.left, scope, allow_range_call=False)
+        right_expr = self._compile_expr(
+            expr.comparators[0], scope, allow_range_call=False
+        )
+        op_node = type(expr.ops[0])
+        if op_node in {ast.Is, ast.IsNot}:
+            left_is_none = isinstance(left_expr, Const) and left_expr.value is None
+            right_is_none = isinstance(right_expr, Const) and right_expr.value is None
+            if not (left_is_none or right_is_none):
+                raise DSLValidationError(
+                    "'is'/'is not' comparisons are only supported with None."
+                )
+        op = _OP_TABLE.get(op_node)
+        if op is None:
+            raise DSLValidationError(
+                f"Unsupported comparison operator: {type(expr.ops[0]).__name__}"
+            )
+        return Binary(
+            op=op,
+            left=left_expr,
+            right=right_expr,
+        )
 
-            raise DSLValidationError(f"Unsupported expression: {type(expr).__name__}")
+    def _compile_call_expr(self, expr: ast.Call, scope: ActionScope, allow_range_call: bool):
+        if allow_range_call:
+            return self._compile_range_call(expr, scope)
+        return self._compile_builtin_expr_call(expr, scope)
 
     def _compile_builtin_expr_call(self, expr: ast.Call, scope: ActionScope) -> CallExpr:
         if (
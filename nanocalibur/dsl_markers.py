@@ -13,6 +13,18 @@ except ImportError:  # pragma: no cover - Python < 3.11 fallback
         pass
 
 
+class _SlotsMeta(type):
+    """Give marker subclasses empty ``__slots__`` unless they declare their own.
+
+    Field annotations on DSL classes are read by the compiler, never stored on
+    instances, so subclasses such as ``class Player(Actor)`` need no ``__dict__``.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
 class Global:
     """Binding marker used in action signatures for global variables.
 
@@ -20,6 +32,8 @@ class Global:
         ``score: Global["score"]``
     """
 
+    __slots__ = ()
+
     def __class_getitem__(cls, item):
         """Allow ``Global[...]`` syntax in type annotations.
 
@@ -64,7 +78,7 @@ class Global:
         return None
 
 
-class Actor:
+class Actor(metaclass=_SlotsMeta):
     """Actor base class and binding marker used in DSL.
 
     Built-in engine-managed fields:
@@ -80,6 +94,8 @@ class Actor:
     - ``actor: Actor[-1]``
     """
 
+    __slots__ = ()
+
     uid: str
     x: float
     y: float
@@ -144,6 +160,8 @@ class Scene:
     - ``elapsed`` number of ticks since game start.
     """
 
+    __slots__ = ()
+
     elapsed: int
 
     def __class_getitem__(cls, item):
@@ -163,6 +181,10 @@ class Scene:
         """Declare an initial actor instance inside this scene."""
         return None
 
+    def add_actors(self, _actors: list[Actor]):
+        """Declare several initial actor instances inside this scene."""
+        return None
+
     def add_rule(self, _condition, _action: Callable[..., Any]):
         """Register a rule mapping condition to action inside this scene."""
         return None
@@ -195,6 +217,10 @@ class Scene:
         """Advance the session turn in turn-based or hybrid loop modes."""
         return None
 
+    def wait_ticks(self, _ticks: int):
+        """Suspend the action for ``_ticks`` ticks when used as ``yield scene.wait_ticks(n)``."""
+        return None
+
 
 class Tick:
     """Action parameter marker for per-frame wait tokens.
@@ -204,6 +230,8 @@ class Tick:
         ``    yield tick``
     """
 
+    __slots__ = ()
+
 
 class Sprite:
     """Sprite declaration object consumed by :meth:`Game.add_sprite`.
@@ -216,6 +244,8 @@ class Sprite:
     - ``bind=Player``
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -243,6 +273,8 @@ class Sprite:
 class Multiplayer:
     """Multiplayer runtime defaults and loop controls."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -266,9 +298,11 @@ class RoleKind(StrEnum):
     HYBRID = "hybrid"
 
 
-class Role:
+class Role(metaclass=_SlotsMeta):
     """Role declaration for multiplayer sessions."""
 
+    __slots__ = ()
+
     id: str
     required: bool
     kind: str
@@ -291,6 +325,8 @@ class Role:
 class Game:
     """Top-level DSL game container."""
 
+    __slots__ = ()
+
     def add_global(self, _name_or_global, _value: Any = None):
         """Declare a global variable.
 
@@ -328,6 +364,10 @@ class Game:
         """Declare a multiplayer role that can join sessions."""
         return None
 
+    def add_roles(self, _roles: list[Role]):
+        """Declare several multiplayer roles at once."""
+        return None
+
     def add_resource(self, _name: str, _path: str):
         """Declare an image resource by name and path."""
         return None
@@ -340,6 +380,8 @@ class Game:
 class CodeBlock:
     """Top-level structural block marker for DSL authoring."""
 
+    __slots__ = ()
+
     @staticmethod
     def begin(_id: str, *, descr: str | None = None):
         """Start a code block identified by ``_id``."""
@@ -354,6 +396,8 @@ class CodeBlock:
 class AbstractCodeBlock(CodeBlock):
     """Template block marker that requires explicit ``instantiate(...)`` calls."""
 
+    __slots__ = ()
+
     @staticmethod
     def begin(_id: str, **_params_and_descr):
         """Start an abstract code block template.
@@ -426,6 +470,8 @@ class Random:
 class GlobalVariable:
     """Named global declaration payload for ``game.add_global``."""
 
+    __slots__ = ()
+
     def __init__(self, _type, _name: str, _value: Any):
         return None
 
@@ -472,6 +518,8 @@ class TileMap:
     file containing a matrix of integers.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -491,6 +539,8 @@ class Color:
     ``symbol`` and ``description`` are used by symbolic rendering.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         r: int,
@@ -510,6 +560,8 @@ class Tile:
     ``block_mask`` controls tile-vs-actor blocking (``None`` means non-blocking).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -1,8 +1,12 @@
+import hashlib
 import json
+import pickle
+import warnings
+from collections import OrderedDict
 from dataclasses import asdict, is_dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from nanocalibur.game_model import (
     AnimationClipSpec,
@@ -31,6 +35,12 @@ from nanocalibur.ts_generator import TSGenerator
 from nanocalibur.ir import ParamBinding
 
 
+_COMPILE_CACHE_SIZE = 64
+# Pickled projects and the warnings raised while compiling them, keyed by
+# (source digest, source path, compile options).
+_COMPILE_CACHE: "OrderedDict[tuple, Tuple[bytes, Tuple[Tuple[str, type], ...]]]" = OrderedDict()
+
+
 def compile_project(
     source: str,
     source_path: str | None = None,
@@ -38,13 +48,55 @@ def compile_project(
     require_code_blocks: bool = False,
     unboxed_disable_flag: str = "--allow-unboxed",
 ) -> ProjectSpec:
-    """Compile DSL source into a :class:`ProjectSpec`."""
-    return ProjectCompiler().compile(
-        source,
-        source_path=source_path,
-        require_code_blocks=require_code_blocks,
-        unboxed_disable_flag=unboxed_disable_flag,
+    """Compile DSL source into a :class:`ProjectSpec`.
+
+    Results are memoized by source hash and compile options. Every call
+    returns its own copy, so callers may mutate the project freely, and
+    reports the same warnings as the first compile.
+    """
+    key = (
+        hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest(),
+        None if source_path is None else str(Path(source_path).resolve()),
+        require_code_blocks,
+        unboxed_disable_flag,
     )
+    cached = _COMPILE_CACHE.get(key)
+    if cached is not None:
+        _COMPILE_CACHE.move_to_end(key)
+        payload, diagnostics = cached
+        # A hit skips the whole compile, not just code block preprocessing,
+        # so warnings from every stage are replayed with their categories.
+        for message, category in diagnostics:
+            warnings.warn(message, category, stacklevel=2)
+        return pickle.loads(payload)
+
+    compiler = ProjectCompiler()
+    caught: List[warnings.WarningMessage] = []
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            project = compiler.compile(
+                source,
+                source_path=source_path,
+                require_code_blocks=require_code_blocks,
+                unboxed_disable_flag=unboxed_disable_flag,
+            )
+    finally:
+        diagnostics = tuple((str(warning.message), warning.category) for warning in caught)
+        # Re-issued outside the recording context so the caller's filters apply.
+        for message, category in diagnostics:
+            warnings.warn(message, category, stacklevel=2)
+
+    # Projects that read other files (map grids) can change without their
+    # source changing, so they are always recompiled.
+    if not compiler.loaded_files:
+        _COMPILE_CACHE[key] = (
+            pickle.dumps(project, protocol=pickle.HIGHEST_PROTOCOL),
+            diagnostics,
+        )
+        if len(_COMPILE_CACHE) > _COMPILE_CACHE_SIZE:
+            _COMPILE_CACHE.popitem(last=False)
+    return project
 
 
 def project_to_dict(project: ProjectSpec) -> Dict[str, Any]:
@@ -123,8 +175,10 @@ def export_project(
     ir_path = out_dir / "game_ir.json"
     ts_path = out_dir / "game_logic.ts"
 
+    # The spec is bundled with the game and parsed on every start, so it is
+    # written compactly; the IR stays indented for reading.
     spec_path.write_text(
-        json.dumps(project_to_dict(project), indent=2, sort_keys=True),
+        json.dumps(project_to_dict(project), separators=(",", ":"), sort_keys=True),
         encoding="utf-8",
     )
     ir_path.write_text(
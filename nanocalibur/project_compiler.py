@@ -87,6 +87,8 @@ LOGICAL_TARGET_BINDING_UID = "__nanocalibur_logical_target__"
 class ProjectCompiler:
     def __init__(self) -> None:
         self._source_dir = Path.cwd()
+        # Files read from disk by the last compile (e.g. map grid files).
+        self.loaded_files: List[Path] = []
 
     def compile(
         self,
@@ -101,6 +103,7 @@ class ProjectCompiler:
             self._source_dir = Path(source_path).resolve().parent
         else:
             self._source_dir = Path.cwd()
+        self.loaded_files = []
 
         with dsl_source_context(source):
             preprocessed_source = preprocess_code_blocks(
@@ -973,16 +976,28 @@ class ProjectCompiler:
                             raise DSLValidationError("add_role(...) does not accept keyword args.")
                         if len(args) != 1:
                             raise DSLValidationError("add_role(...) expects one argument.")
-                        role = self._parse_role(
-                            self._resolve_role_arg(args[0], declared_role_vars),
-                            compiler,
+                        self._register_role(
+                            self._parse_role(
+                                self._resolve_role_arg(args[0], declared_role_vars),
+                                compiler,
+                            ),
+                            roles_by_id,
                         )
-                        existing = roles_by_id.get(role.id)
-                        if existing is not None and existing != role:
-                            raise DSLValidationError(
-                                f"Role '{role.id}' is already declared with different settings."
+                        continue
+
+                    if method_name == "add_roles":
+                        if kwargs:
+                            raise DSLValidationError("add_roles(...) does not accept keyword args.")
+                        if len(args) != 1 or not isinstance(args[0], (ast.List, ast.Tuple)):
+                            raise DSLValidationError("add_roles(...) expects one list of roles.")
+                        for role_arg in args[0].elts:
+                            self._register_role(
+                                self._parse_role(
+                                    self._resolve_role_arg(role_arg, declared_role_vars),
+                                    compiler,
+                                ),
+                                roles_by_id,
                             )
-                        roles_by_id[role.id] = role
                         continue
 
                     if method_name == "add_global":
@@ -1038,6 +1053,18 @@ class ProjectCompiler:
                     )
                     continue
 
+                if scene_method_name == "add_actors":
+                    actors.extend(
+                        self._parse_actor_instances(
+                            scene_args,
+                            scene_kwargs,
+                            compiler,
+                            actors,
+                            declared_actor_vars,
+                        )
+                    )
+                    continue
+
                 if scene_method_name == "add_rule":
                     if scene_kwargs:
                         raise DSLValidationError("scene.add_rule(...) does not accept keyword args.")
@@ -1394,6 +1421,14 @@ class ProjectCompiler:
             max_catchup_steps=max_catchup_steps,
         )
 
+    def _register_role(self, role: RoleSpec, roles_by_id: Dict[str, RoleSpec]) -> None:
+        existing = roles_by_id.get(role.id)
+        if existing is not None and existing != role:
+            raise DSLValidationError(
+                f"Role '{role.id}' is already declared with different settings."
+            )
+        roles_by_id[role.id] = role
+
     def _resolve_role_arg(
         self,
         node: ast.AST,
@@ -1576,6 +1611,37 @@ class ProjectCompiler:
 
         raise DSLValidationError("Unsupported global value.")
 
+    def _parse_actor_instances(
+        self,
+        args: List[ast.AST],
+        kwargs: Dict[str, ast.AST],
+        compiler: DSLCompiler,
+        existing_actors: List[ActorInstanceSpec],
+        declared_actor_vars: Dict[str, ast.Call] | None = None,
+    ) -> List[ActorInstanceSpec]:
+        if kwargs:
+            raise DSLValidationError("scene.add_actors(...) does not accept keyword args.")
+        if len(args) != 1 or not isinstance(args[0], (ast.List, ast.Tuple)):
+            raise DSLValidationError(
+                "scene.add_actors(...) expects one list of actors."
+            )
+
+        # Share one uid set across the batch instead of rebuilding it per actor.
+        existing_uids = {actor.uid for actor in existing_actors}
+        parsed: List[ActorInstanceSpec] = []
+        for actor_arg in args[0].elts:
+            actor = self._parse_actor_instance(
+                [actor_arg],
+                {},
+                compiler,
+                existing_actors,
+                declared_actor_vars,
+                existing_uids=existing_uids,
+            )
+            existing_uids.add(actor.uid)
+            parsed.append(actor)
+        return parsed
+
     def _parse_actor_instance(
         self,
         args: List[ast.AST],
@@ -1583,8 +1649,10 @@ class ProjectCompiler:
         compiler: DSLCompiler,
         existing_actors: List[ActorInstanceSpec],
         declared_actor_vars: Dict[str, ast.Call] | None = None,
+        existing_uids: set[str] | None = None,
     ) -> ActorInstanceSpec:
-        existing_uids = {actor.uid for actor in existing_actors}
+        if existing_uids is None:
+            existing_uids = {actor.uid for actor in existing_actors}
 
         if len(args) == 1 and not kwargs:
             actor_arg = args[0]
@@ -1868,7 +1936,9 @@ class ProjectCompiler:
 
         if not removed:
             return fn
-        cloned = copy.deepcopy(fn)
+        # Only the decorator list differs; the action compiler never mutates
+        # the body, so the clone can share it with the original node.
+        cloned = copy.copy(fn)
         cloned.decorator_list = stripped
         return cloned
 
@@ -2154,10 +2224,12 @@ class ProjectCompiler:
         if any(len(row) != width for row in tile_grid):
             raise DSLValidationError("map grid must be rectangular.")
         height = len(tile_grid)
+        # Scan the grid once; per-cell work is only redone to locate an error.
+        used_tile_ids = set()
         for row in tile_grid:
-            for tile_id in row:
-                if tile_id < 0:
-                    raise DSLValidationError("map grid tile ids must be >= 0.")
+            used_tile_ids.update(row)
+        if min(used_tile_ids) < 0:
+            raise DSLValidationError("map grid tile ids must be >= 0.")
 
         if "width" in kwargs and _expect_int(kwargs["width"], "map width") != width:
             raise DSLValidationError(
@@ -2173,11 +2245,10 @@ class ProjectCompiler:
             declared_color_vars=declared_color_vars,
             declared_tile_vars=declared_tile_vars,
         )
-        for tile_y, row in enumerate(tile_grid):
+        undefined_tile_ids = used_tile_ids - tile_defs.keys() - {0}
+        for tile_y, row in enumerate(tile_grid if undefined_tile_ids else ()):
             for tile_x, tile_id in enumerate(row):
-                if tile_id == 0:
-                    continue
-                if tile_id not in tile_defs:
+                if tile_id in undefined_tile_ids:
                     raise DSLValidationError(
                         f"map grid references tile id '{tile_id}' at ({tile_x}, {tile_y}) "
                         "but this id is not defined in tiles."
@@ -2210,6 +2281,7 @@ class ProjectCompiler:
             raise DSLValidationError(
                 f"Cannot read map grid file '{raw_path}': {exc}."
             ) from exc
+        self.loaded_files.append(resolved)
 
         rows: List[List[int]] = []
         for line_no, raw_line in enumerate(text.splitlines(), start=1):
@@ -2221,16 +2293,14 @@ class ProjectCompiler:
             if not tokens:
                 continue
 
-            row: List[int] = []
-            for token in tokens:
-                try:
-                    value = int(token, 10)
-                except ValueError as exc:
-                    raise DSLValidationError(
-                        f"Invalid map grid value '{token}' in '{raw_path}' at line {line_no}. "
-                        "Expected integers."
-                    ) from exc
-                row.append(value)
+            try:
+                row = [int(token, 10) for token in tokens]
+            except ValueError as exc:
+                token = next(token for token in tokens if not _is_base10_int(token))
+                raise DSLValidationError(
+                    f"Invalid map grid value '{token}' in '{raw_path}' at line {line_no}. "
+                    "Expected integers."
+                ) from exc
             rows.append(row)
 
         if not rows:
@@ -2245,12 +2315,12 @@ class ProjectCompiler:
             raise DSLValidationError(
                 f"Map grid file '{raw_path}' must be rectangular."
             )
-        for row in rows:
-            for value in row:
-                if value < 0:
-                    raise DSLValidationError(
-                        f"Map grid file '{raw_path}' contains negative tile id {value}."
-                    )
+        lowest = min(min(row) for row in rows)
+        if lowest < 0:
+            first_negative = next(value for row in rows for value in row if value < 0)
+            raise DSLValidationError(
+                f"Map grid file '{raw_path}' contains negative tile id {first_negative}."
+            )
 
         return rows
 
@@ -3690,6 +3760,14 @@ def _expect_int_matrix(node: ast.AST, label: str) -> List[List[int]]:
     return rows
 
 
+def _is_base10_int(token: str) -> bool:
+    try:
+        int(token, 10)
+    except ValueError:
+        return False
+    return True
+
+
 def _expect_optional_int(node: ast.AST, label: str) -> Optional[int]:
     value = _eval_static_expr(node)
     if value is None:
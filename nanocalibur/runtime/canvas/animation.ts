@@ -2,6 +2,7 @@ import {
   ActorState,
   AnimationRuntime,
   CanvasHostOptions,
+  ClipTable,
   DEFAULT_TICKS_PER_FRAME,
   MOVEMENT_SPEED_THRESHOLD,
   PhysicsBodyRuntime,
@@ -15,6 +16,7 @@ export class AnimationSystem {
   private readonly getBodyByUid: (uid: string) => PhysicsBodyRuntime | undefined;
   private readonly animations = new Map<string, AnimationRuntime>();
   private readonly clipOverrides = new Map<string, string>();
+  private readonly clipTables = new WeakMap<SpriteAnimationConfig, ClipTable>();
 
   constructor(
     options: CanvasHostOptions,
@@ -47,16 +49,20 @@ export class AnimationSystem {
       alive.add(actor.uid);
       const body = this.getBodyByUid(actor.uid);
       const preferredClip = this.clipOverrides.get(actor.uid);
-      const selectedClip = this.selectClipName(sprite, body, preferredClip);
-      const clip = this.resolveClip(sprite, selectedClip);
-      if (!clip || clip.clip.frames.length === 0) {
+      const table = this.getClipTable(sprite);
+      const clipIndex = this.selectClipIndex(sprite, table, body, preferredClip);
+      if (clipIndex < 0 || table.length[clipIndex] === 0) {
+        this.animations.delete(actor.uid);
         continue;
       }
 
       let runtime = this.animations.get(actor.uid);
       if (!runtime) {
         runtime = {
-          clipName: clip.name,
+          sprite,
+          table,
+          clipIndex,
+          clipName: table.names[clipIndex],
           frameCursor: 0,
           ticksInFrame: 0,
           facing: 1,
@@ -64,10 +70,16 @@ export class AnimationSystem {
         this.animations.set(actor.uid, runtime);
       }
 
-      if (runtime.clipName !== clip.name) {
-        runtime.clipName = clip.name;
-        runtime.frameCursor = 0;
-        runtime.ticksInFrame = 0;
+      runtime.sprite = sprite;
+      if (runtime.table !== table || runtime.clipIndex !== clipIndex) {
+        const clipName = table.names[clipIndex];
+        if (runtime.clipName !== clipName) {
+          runtime.frameCursor = 0;
+          runtime.ticksInFrame = 0;
+        }
+        runtime.table = table;
+        runtime.clipIndex = clipIndex;
+        runtime.clipName = clipName;
       }
 
       if (body) {
@@ -79,15 +91,11 @@ export class AnimationSystem {
       }
 
       runtime.ticksInFrame += 1;
-      const ticksPerFrame = Math.max(
-        1,
-        asNumber(clip.clip.ticksPerFrame, DEFAULT_TICKS_PER_FRAME),
-      );
-      if (runtime.ticksInFrame >= ticksPerFrame) {
+      if (runtime.ticksInFrame >= table.ticksPerFrame[clipIndex]) {
         runtime.ticksInFrame = 0;
-        if (runtime.frameCursor < clip.clip.frames.length - 1) {
+        if (runtime.frameCursor < table.length[clipIndex] - 1) {
           runtime.frameCursor += 1;
-        } else if (clip.clip.loop !== false) {
+        } else if (table.loop[clipIndex] !== 0) {
           runtime.frameCursor = 0;
         }
       }
@@ -106,26 +114,20 @@ export class AnimationSystem {
   }
 
   getFrameInfo(actor: ActorState): SpriteFrameInfo | null {
-    const sprite = this.resolveSpriteConfig(actor);
-    if (!sprite) {
-      return null;
-    }
-
     const runtime = this.animations.get(actor.uid);
     if (!runtime) {
       return null;
     }
 
-    const clip = this.resolveClip(sprite, runtime.clipName);
-    if (!clip || clip.clip.frames.length === 0) {
-      return null;
-    }
-
-    const frameIndex = clip.clip.frames[
-      clamp(runtime.frameCursor, 0, clip.clip.frames.length - 1)
-    ];
+    const table = runtime.table;
+    const clipIndex = runtime.clipIndex;
+    const frameIndex =
+      table.frames[
+        table.start[clipIndex] +
+          clamp(runtime.frameCursor, 0, table.length[clipIndex] - 1)
+      ];
     return {
-      sprite,
+      sprite: runtime.sprite,
       frameIndex,
       facing: runtime.facing,
     };
@@ -150,52 +152,80 @@ export class AnimationSystem {
     return null;
   }
 
-  private selectClipName(
+  private getClipTable(sprite: SpriteAnimationConfig): ClipTable {
+    const cached = this.clipTables.get(sprite);
+    if (cached) {
+      return cached;
+    }
+
+    const names = Object.keys(sprite.clips);
+    const count = names.length;
+    const indexByName = new Map<string, number>();
+    const start = new Int32Array(count);
+    const length = new Int32Array(count);
+    const ticksPerFrame = new Int32Array(count);
+    const loop = new Uint8Array(count);
+    let totalFrames = 0;
+    for (let index = 0; index < count; index += 1) {
+      const clip = sprite.clips[names[index]];
+      indexByName.set(names[index], index);
+      start[index] = totalFrames;
+      length[index] = clip.frames.length;
+      ticksPerFrame[index] = Math.max(
+        1,
+        Math.ceil(asNumber(clip.ticksPerFrame, DEFAULT_TICKS_PER_FRAME)),
+      );
+      loop[index] = clip.loop === false ? 0 : 1;
+      totalFrames += clip.frames.length;
+    }
+    const frames = new Int32Array(totalFrames);
+    for (let index = 0; index < count; index += 1) {
+      frames.set(sprite.clips[names[index]].frames, start[index]);
+    }
+
+    const table: ClipTable = {
+      names,
+      indexByName,
+      start,
+      length,
+      ticksPerFrame,
+      loop,
+      frames,
+    };
+    this.clipTables.set(sprite, table);
+    return table;
+  }
+
+  private selectClipIndex(
     sprite: SpriteAnimationConfig,
+    table: ClipTable,
     body: PhysicsBodyRuntime | undefined,
     preferredClip: string | undefined,
-  ): string {
-    if (preferredClip && sprite.clips[preferredClip]) {
-      return preferredClip;
+  ): number {
+    const byName = table.indexByName;
+    if (preferredClip && byName.has(preferredClip)) {
+      return byName.get(preferredClip) as number;
     }
 
     if (body && body.config.dynamic) {
-      if (!body.onGround && sprite.clips.jump && body.vy < 0) {
-        return "jump";
+      if (!body.onGround && body.vy < 0 && byName.has("jump")) {
+        return byName.get("jump") as number;
       }
-      if (!body.onGround && sprite.clips.fall && body.vy >= 0) {
-        return "fall";
+      if (!body.onGround && body.vy >= 0 && byName.has("fall")) {
+        return byName.get("fall") as number;
       }
-      if (Math.abs(body.vx) > MOVEMENT_SPEED_THRESHOLD && sprite.clips.run) {
-        return "run";
+      if (Math.abs(body.vx) > MOVEMENT_SPEED_THRESHOLD && byName.has("run")) {
+        return byName.get("run") as number;
       }
-      if (sprite.clips.idle) {
-        return "idle";
+      if (byName.has("idle")) {
+        return byName.get("idle") as number;
       }
     }
 
-    if (sprite.defaultClip && sprite.clips[sprite.defaultClip]) {
-      return sprite.defaultClip;
+    if (sprite.defaultClip && byName.has(sprite.defaultClip)) {
+      return byName.get(sprite.defaultClip) as number;
     }
 
-    const first = Object.keys(sprite.clips)[0];
-    return first || "idle";
-  }
-
-  private resolveClip(
-    sprite: SpriteAnimationConfig,
-    clipName: string,
-  ): { name: string; clip: { frames: number[]; ticksPerFrame?: number; loop?: boolean } } | null {
-    if (sprite.clips[clipName]) {
-      return { name: clipName, clip: sprite.clips[clipName] };
-    }
-    if (sprite.defaultClip && sprite.clips[sprite.defaultClip]) {
-      return { name: sprite.defaultClip, clip: sprite.clips[sprite.defaultClip] };
-    }
-    const entries = Object.entries(sprite.clips);
-    if (entries.length === 0) {
-      return null;
-    }
-    return { name: entries[0][0], clip: entries[0][1] };
+    return table.names.length > 0 ? 0 : -1;
   }
 }
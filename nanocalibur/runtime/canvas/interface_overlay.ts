@@ -3,9 +3,13 @@ const GLOBAL_PLACEHOLDER_RE =
 const HAS_GLOBAL_PLACEHOLDER_RE =
   /{{\s*[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*\s*}}/;
 
+// A text node template split once into literal pieces around its
+// placeholders: `literals` has one more entry than `paths`.
 interface TextBinding {
   node: Text;
-  template: string;
+  literals: string[];
+  paths: string[][];
+  lastText: string;
 }
 
 export class InterfaceOverlay {
@@ -64,10 +68,15 @@ export class InterfaceOverlay {
 
   updateGlobals(globals: Record<string, any>): void {
     for (const binding of this.textBindings) {
-      binding.node.textContent = binding.template.replace(
-        GLOBAL_PLACEHOLDER_RE,
-        (_all, path: string) => this.formatGlobalValue(this.resolvePath(globals, path)),
-      );
+      let text = binding.literals[0];
+      for (let index = 0; index < binding.paths.length; index += 1) {
+        text += this.formatGlobalValue(this.resolvePath(globals, binding.paths[index]));
+        text += binding.literals[index + 1];
+      }
+      if (text !== binding.lastText) {
+        binding.node.textContent = text;
+        binding.lastText = text;
+      }
     }
   }
 
@@ -136,8 +145,23 @@ export class InterfaceOverlay {
       if (!HAS_GLOBAL_PLACEHOLDER_RE.test(template)) {
         continue;
       }
-      this.textBindings.push({ node, template });
+      this.textBindings.push(this.compileTextBinding(node, template));
+    }
+  }
+
+  private compileTextBinding(node: Text, template: string): TextBinding {
+    const literals: string[] = [];
+    const paths: string[][] = [];
+    let cursor = 0;
+    GLOBAL_PLACEHOLDER_RE.lastIndex = 0;
+    let match: RegExpExecArray | null;
+    while ((match = GLOBAL_PLACEHOLDER_RE.exec(template)) !== null) {
+      literals.push(template.slice(cursor, match.index));
+      paths.push(match[1].split("."));
+      cursor = match.index + match[0].length;
     }
+    literals.push(template.slice(cursor));
+    return { node, literals, paths, lastText: template };
   }
 
   private formatGlobalValue(value: unknown): string {
@@ -158,11 +182,10 @@ export class InterfaceOverlay {
     }
   }
 
-  private resolvePath(root: Record<string, any>, path: string): unknown {
+  private resolvePath(root: Record<string, any>, parts: string[]): unknown {
     if (!root || typeof root !== "object") {
       return undefined;
     }
-    const parts = path.split(".");
     let current: unknown = root;
     for (const part of parts) {
       if (!current || typeof current !== "object") {
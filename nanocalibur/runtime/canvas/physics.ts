@@ -1,4 +1,5 @@
 import {
+  ActorIndexPairs,
   ActorState,
   CanvasHostOptions,
   CollisionPair,
@@ -14,15 +15,63 @@ import {
   actorHeight,
   actorWidth,
   asNumber,
-  overlapsActors,
 } from "./utils";
 
+// Below this many actors the all-pairs scan is cheaper than sweep and prune.
+const SWEEP_AND_PRUNE_MIN_ACTORS = 16;
+// Contact grid cell size when no map is loaded; maps use their tile size.
+const DEFAULT_CONTACT_CELL_SIZE = 32;
+// Bodies covering more grid cells than this are tested against everyone.
+const MAX_CONTACT_CELLS_PER_BODY = 16;
+const EDGE_LANES = 4;
+const LEFT = 0;
+const RIGHT = 1;
+const TOP = 2;
+const BOTTOM = 3;
+
 export class PhysicsSystem {
   private readonly options: CanvasHostOptions;
   private readonly bodies = new Map<string, PhysicsBodyRuntime>();
-  private readonly tileBlockMasks = new Map<string, number>();
+  // Block masks of the map tiles, indexed by `tileY * width + tileX`.
+  private tileBlockMasks = new Float64Array(0);
+  private tileHasBlockMask = new Uint8Array(0);
+  private tileGridWidth = 0;
+  // World extent in pixels, derived from the map once in setMap().
+  private worldWidth = 0;
+  private worldHeight = 0;
   private mapSpec: MapSpec | null = null;
   private gravityEnabled = false;
+  // Per-call collider edges, indexed like the actors array. Each collider
+  // owns four adjacent lanes (left, right, top, bottom) so a pair test reads
+  // one contiguous block instead of four separate arrays.
+  private colliderCapacity = 0;
+  private colliderEdges = new Float64Array(0);
+  private colliderEnabled = new Uint8Array(0);
+  // Colliders whose box or enabled flag changed since the previous call.
+  private colliderDirty = new Uint8Array(0);
+  // Overlapping pairs encoded as `i * actorCount + j` (i < j), reused across
+  // calls. They stay valid while the actor count is unchanged, so later calls
+  // only retest pairs that involve a dirty collider.
+  private pairKeys = new Float64Array(64);
+  private pairKeyCount = 0;
+  private pairKeyActorCount = -1;
+  private readonly overlapPairs: ActorIndexPairs = { indices: new Int32Array(128), count: 0 };
+  private readonly contactPairs: ActorIndexPairs = { indices: new Int32Array(128), count: 0 };
+  private contactBodies: Array<PhysicsBodyRuntime | null> = [];
+  // Block mask per actor index for contact detection; NaN marks actors that
+  // take no part, so one numeric compare rejects both them and mask mismatches.
+  private contactMasks = new Float64Array(0);
+  // Uniform grid of contact candidates keyed by packed cell coordinates, and
+  // the pair keys it yields.
+  private readonly contactCells = new Map<number, number[]>();
+  private contactPairKeys = new Float64Array(64);
+  // Set for bodies too large for the grid; cleared again after each call.
+  private contactOversized = new Uint8Array(0);
+  // Actor indices sorted by left edge; kept between calls so the insertion
+  // sort only has to fix up the few actors that changed order.
+  private sweepOrder = new Int32Array(0);
+  private sweepCount = 0;
+  private sweepActive = new Int32Array(0);
   private readonly gravityAcceleration: number;
 
   constructor(options: CanvasHostOptions) {
@@ -31,19 +80,36 @@ export class PhysicsSystem {
   }
 
   setMap(mapSpec: MapSpec | null): void {
+    // The runtime hands the same map object back every step; only rebuild
+    // the tile lookup when the map actually changes.
+    if (mapSpec === this.mapSpec) {
+      return;
+    }
     this.mapSpec = mapSpec;
-    this.tileBlockMasks.clear();
+    this.tileGridWidth = 0;
+    this.worldWidth = 0;
+    this.worldHeight = 0;
     if (!mapSpec) {
+      this.tileBlockMasks = new Float64Array(0);
+      this.tileHasBlockMask = new Uint8Array(0);
       return;
     }
 
+    const width = Math.max(0, Math.trunc(asNumber(mapSpec.width, 0)));
+    const height = Math.max(0, Math.trunc(asNumber(mapSpec.height, 0)));
+    this.tileGridWidth = width;
+    this.worldWidth = mapSpec.width * mapSpec.tile_size;
+    this.worldHeight = mapSpec.height * mapSpec.tile_size;
+    this.tileBlockMasks = new Float64Array(width * height);
+    this.tileHasBlockMask = new Uint8Array(width * height);
+
     if (Array.isArray(mapSpec.tile_grid)) {
-      for (let tileY = 0; tileY < mapSpec.tile_grid.length; tileY += 1) {
+      for (let tileY = 0; tileY < Math.min(height, mapSpec.tile_grid.length); tileY += 1) {
         const row = mapSpec.tile_grid[tileY];
         if (!Array.isArray(row)) {
           continue;
         }
-        for (let tileX = 0; tileX < row.length; tileX += 1) {
+        for (let tileX = 0; tileX < Math.min(width, row.length); tileX += 1) {
           const tileIdRaw = row[tileX];
           if (typeof tileIdRaw !== "number" || !Number.isFinite(tileIdRaw)) {
             continue;
@@ -60,7 +126,9 @@ export class PhysicsSystem {
           if (tileBlockMask === null) {
             continue;
           }
-          this.tileBlockMasks.set(`${tileX},${tileY}`, tileBlockMask);
+          const index = tileY * width + tileX;
+          this.tileBlockMasks[index] = tileBlockMask;
+          this.tileHasBlockMask[index] = 1;
         }
       }
     }
@@ -79,24 +147,34 @@ export class PhysicsSystem {
   }
 
   syncBodiesFromActors(actors: ActorState[], preserveVelocity: boolean): void {
-    const alive = new Set<string>();
-
     for (const actor of actors) {
-      alive.add(actor.uid);
-
-      const body = this.ensureBody(actor);
-      body.config = this.resolveBodyConfig(actor);
+      const x = actorCenterX(actor);
+      const y = actorCenterY(actor);
+      const body = this.ensureBody(actor, x, y);
+      // Body configs only depend on the actor type/uid and the host options.
+      if (body.type !== actor.type) {
+        body.type = actor.type;
+        body.config = this.resolveBodyConfig(actor);
+      }
       body.w = actorWidth(actor);
       body.h = actorHeight(actor);
       body.blockMask = this.resolveActorMask(actor);
       body.active = actor.active !== false;
-      body.x = actorCenterX(actor);
-      body.y = actorCenterY(actor);
+      body.x = x;
+      body.y = y;
 
       body.vx = asNumber(actor.vx, body.vx);
       body.vy = asNumber(actor.vy, body.vy);
     }
 
+    // Actor uids are unique, so stale bodies can only exist when counts differ.
+    if (this.bodies.size === actors.length) {
+      return;
+    }
+    const alive = new Set<string>();
+    for (const actor of actors) {
+      alive.add(actor.uid);
+    }
     for (const uid of this.bodies.keys()) {
       if (!alive.has(uid)) {
         this.bodies.delete(uid);
@@ -141,6 +219,16 @@ export class PhysicsSystem {
       if (!body.config.enabled || !body.active || body.blockMask === null) {
         continue;
       }
+      // A body resting at its previous position with no velocity would be
+      // restored to the same place, so the tile probe cannot change it.
+      if (
+        body.x === body.prevX &&
+        body.y === body.prevY &&
+        body.vx === 0 &&
+        body.vy === 0
+      ) {
+        continue;
+      }
       if (!this.isBodyTouchingBlockingTile(body)) {
         continue;
       }
@@ -170,8 +258,18 @@ export class PhysicsSystem {
             continue;
           }
 
-          const overlapX = (a.w + b.w) / 2 - Math.abs(a.x - b.x);
-          const overlapY = (a.h + b.h) / 2 - Math.abs(a.y - b.y);
+          const dx = a.x - b.x;
+          const dy = a.y - b.y;
+          const reachX = (a.w + b.w) / 2;
+          const reachY = (a.h + b.h) / 2;
+          // Overlapping boxes have |dx| < reachX and |dy| < reachY, so their
+          // centers are closer than the corner distance; reject far pairs early.
+          if (dx * dx + dy * dy > reachX * reachX + reachY * reachY) {
+            continue;
+          }
+
+          const overlapX = reachX - Math.abs(dx);
+          const overlapY = reachY - Math.abs(dy);
           if (overlapX <= 0 || overlapY <= 0) {
             continue;
           }
@@ -207,55 +305,447 @@ export class PhysicsSystem {
   }
 
   detectCollisions(actors: ActorState[]): CollisionPair[] {
-    const collisions: CollisionPair[] = [];
-    for (let i = 0; i < actors.length; i += 1) {
-      const a = actors[i];
-      if (!this.isActorCollisionEnabled(a)) {
+    return this.toCollisionPairs(actors, this.detectCollisionIndexPairs(actors));
+  }
+
+  detectCollisionIndexPairs(actors: ActorState[]): ActorIndexPairs {
+    const dirtyCount = this.loadColliders(actors);
+    const actorCount = actors.length;
+    const out = this.overlapPairs;
+    const reusable = actorCount === this.pairKeyActorCount;
+    if (reusable && dirtyCount === 0) {
+      return out;
+    }
+
+    let pairCount: number;
+    if (reusable && dirtyCount * 4 <= actorCount) {
+      pairCount = this.updateDirtyPairs(actorCount);
+    } else if (actorCount >= SWEEP_AND_PRUNE_MIN_ACTORS) {
+      pairCount = this.collectPairsWithSweepAndPrune(actorCount);
+    } else {
+      pairCount = this.collectPairsAllPairs(actorCount);
+    }
+    this.pairKeyCount = pairCount;
+    this.pairKeyActorCount = actorCount;
+
+    out.count = 0;
+    for (let p = 0; p < pairCount; p += 1) {
+      const pairKey = this.pairKeys[p];
+      const i = Math.floor(pairKey / actorCount);
+      this.pushIndexPair(out, i, pairKey - i * actorCount);
+    }
+    return out;
+  }
+
+  private toCollisionPairs(actors: ActorState[], pairs: ActorIndexPairs): CollisionPair[] {
+    const collisions: CollisionPair[] = new Array(pairs.count);
+    for (let p = 0; p < pairs.count; p += 1) {
+      collisions[p] = {
+        aUid: actors[pairs.indices[2 * p]].uid,
+        bUid: actors[pairs.indices[2 * p + 1]].uid,
+      };
+    }
+    return collisions;
+  }
+
+  private pushIndexPair(pairs: ActorIndexPairs, i: number, j: number): void {
+    const offset = pairs.count * 2;
+    if (offset + 2 > pairs.indices.length) {
+      const grown = new Int32Array(pairs.indices.length * 2);
+      grown.set(pairs.indices);
+      pairs.indices = grown;
+    }
+    pairs.indices[offset] = i;
+    pairs.indices[offset + 1] = j;
+    pairs.count += 1;
+  }
+
+  private collectPairsAllPairs(actorCount: number): number {
+    const { colliderEdges: edges, colliderEnabled } = this;
+    let pairCount = 0;
+    for (let i = 0; i < actorCount; i += 1) {
+      if (colliderEnabled[i] === 0) {
         continue;
       }
-      for (let j = i + 1; j < actors.length; j += 1) {
-        const b = actors[j];
-        if (!this.isActorCollisionEnabled(b)) {
+      const base = i * EDGE_LANES;
+      const left = edges[base + LEFT];
+      const right = edges[base + RIGHT];
+      const top = edges[base + TOP];
+      const bottom = edges[base + BOTTOM];
+      for (let j = i + 1; j < actorCount; j += 1) {
+        const otherBase = j * EDGE_LANES;
+        // Coordinates are fractional, so int32 sign-bit tricks would truncate
+        // them; `&` on the comparison results keeps the test branch-free.
+        if (
+          (colliderEnabled[j] &
+            +(left < edges[otherBase + RIGHT]) &
+            +(right > edges[otherBase + LEFT]) &
+            +(top < edges[otherBase + BOTTOM]) &
+            +(bottom > edges[otherBase + TOP])) !==
+          0
+        ) {
+          pairCount = this.pushPairKey(pairCount, i * actorCount + j);
+        }
+      }
+    }
+    return pairCount;
+  }
+
+  private updateDirtyPairs(actorCount: number): number {
+    const { colliderEdges: edges, colliderEnabled, colliderDirty } = this;
+    const keys = this.pairKeys;
+
+    // Keep the cached pairs between two unchanged colliders as they are.
+    let pairCount = 0;
+    for (let p = 0; p < this.pairKeyCount; p += 1) {
+      const pairKey = keys[p];
+      const i = Math.floor(pairKey / actorCount);
+      if ((colliderDirty[i] | colliderDirty[pairKey - i * actorCount]) === 0) {
+        keys[pairCount] = pairKey;
+        pairCount += 1;
+      }
+    }
+
+    for (let i = 0; i < actorCount; i += 1) {
+      if (colliderDirty[i] === 0 || colliderEnabled[i] === 0) {
+        continue;
+      }
+      const base = i * EDGE_LANES;
+      const left = edges[base + LEFT];
+      const right = edges[base + RIGHT];
+      const top = edges[base + TOP];
+      const bottom = edges[base + BOTTOM];
+      for (let j = 0; j < actorCount; j += 1) {
+        // A pair of two dirty colliders is tested once, from its lower index.
+        if (j === i || (colliderDirty[j] !== 0 && j < i)) {
           continue;
         }
-        if (overlapsActors(a, b)) {
-          collisions.push({ aUid: a.uid, bUid: b.uid });
+        const otherBase = j * EDGE_LANES;
+        if (
+          (colliderEnabled[j] &
+            +(left < edges[otherBase + RIGHT]) &
+            +(right > edges[otherBase + LEFT]) &
+            +(top < edges[otherBase + BOTTOM]) &
+            +(bottom > edges[otherBase + TOP])) !==
+          0
+        ) {
+          pairCount = this.pushPairKey(
+            pairCount,
+            i < j ? i * actorCount + j : j * actorCount + i,
+          );
         }
       }
     }
-    return collisions;
+
+    // Keep the all-pairs emission order so condition matching stays stable.
+    this.pairKeys.subarray(0, pairCount).sort();
+    return pairCount;
   }
 
-  detectContacts(actors: ActorState[]): CollisionPair[] {
-    const contacts: CollisionPair[] = [];
-    for (let i = 0; i < actors.length; i += 1) {
-      const a = actors[i];
-      if (!this.isActorCollisionEnabled(a)) {
+  private collectPairsWithSweepAndPrune(actorCount: number): number {
+    const { colliderEdges: edges, colliderEnabled } = this;
+    const order = this.sweepOrder;
+    const active = this.sweepActive;
+
+    if (this.sweepCount !== actorCount) {
+      for (let i = 0; i < actorCount; i += 1) {
+        order[i] = i;
+      }
+      this.sweepCount = actorCount;
+    }
+
+    for (let i = 1; i < actorCount; i += 1) {
+      const index = order[i];
+      const left = edges[index * EDGE_LANES + LEFT];
+      let k = i - 1;
+      while (k >= 0 && edges[order[k] * EDGE_LANES + LEFT] > left) {
+        order[k + 1] = order[k];
+        k -= 1;
+      }
+      order[k + 1] = index;
+    }
+
+    let pairCount = 0;
+    let activeCount = 0;
+    for (let cursor = 0; cursor < actorCount; cursor += 1) {
+      const index = order[cursor];
+      if (colliderEnabled[index] === 0) {
         continue;
       }
-      const bodyA = this.bodies.get(a.uid);
-      if (!bodyA || !this.isBodyActorMaskCollisionEnabled(bodyA)) {
+      const base = index * EDGE_LANES;
+      const left = edges[base + LEFT];
+      const right = edges[base + RIGHT];
+      const top = edges[base + TOP];
+      const bottom = edges[base + BOTTOM];
+
+      let kept = 0;
+      for (let k = 0; k < activeCount; k += 1) {
+        const other = active[k];
+        const otherBase = other * EDGE_LANES;
+        if (edges[otherBase + RIGHT] <= left) {
+          continue;
+        }
+        active[kept] = other;
+        kept += 1;
+        // The sweep only guarantees other.left <= left, which is not a strict
+        // X overlap when this collider has zero width at other's left edge.
+        if (
+          (+(edges[otherBase + LEFT] < right) &
+            +(edges[otherBase + TOP] < bottom) &
+            +(edges[otherBase + BOTTOM] > top)) !==
+          0
+        ) {
+          pairCount = this.pushPairKey(
+            pairCount,
+            other < index ? other * actorCount + index : index * actorCount + other,
+          );
+        }
+      }
+      active[kept] = index;
+      activeCount = kept + 1;
+    }
+
+    // Keep the all-pairs emission order so condition matching stays stable.
+    this.pairKeys.subarray(0, pairCount).sort();
+    return pairCount;
+  }
+
+  private pushPairKey(pairCount: number, pairKey: number): number {
+    if (pairCount === this.pairKeys.length) {
+      const grown = new Float64Array(this.pairKeys.length * 2);
+      grown.set(this.pairKeys);
+      this.pairKeys = grown;
+    }
+    this.pairKeys[pairCount] = pairKey;
+    return pairCount + 1;
+  }
+
+  // Loads collider boxes for the actors and returns how many of them changed
+  // since the previous call.
+  private loadColliders(actors: ActorState[]): number {
+    this.ensureColliderCapacity(actors.length);
+    const { colliderEdges: edges, colliderEnabled, colliderDirty } = this;
+    let dirtyCount = 0;
+    for (let i = 0; i < actors.length; i += 1) {
+      const actor = actors[i];
+      if (!this.isActorCollisionEnabled(actor)) {
+        colliderDirty[i] = colliderEnabled[i];
+        dirtyCount += colliderEnabled[i];
+        colliderEnabled[i] = 0;
         continue;
       }
+      const x = actorCenterX(actor);
+      const y = actorCenterY(actor);
+      const halfW = actorWidth(actor) / 2;
+      const halfH = actorHeight(actor) / 2;
+      const base = i * EDGE_LANES;
+      const left = x - halfW;
+      const right = x + halfW;
+      const top = y - halfH;
+      const bottom = y + halfH;
+      const dirty =
+        colliderEnabled[i] === 0 ||
+        edges[base + LEFT] !== left ||
+        edges[base + RIGHT] !== right ||
+        edges[base + TOP] !== top ||
+        edges[base + BOTTOM] !== bottom;
+      colliderDirty[i] = dirty ? 1 : 0;
+      if (dirty) {
+        dirtyCount += 1;
+      }
+      colliderEnabled[i] = 1;
+      edges[base + LEFT] = left;
+      edges[base + RIGHT] = right;
+      edges[base + TOP] = top;
+      edges[base + BOTTOM] = bottom;
+    }
+    return dirtyCount;
+  }
 
-      for (let j = i + 1; j < actors.length; j += 1) {
-        const b = actors[j];
-        if (!this.isActorCollisionEnabled(b)) {
+  private ensureColliderCapacity(count: number): void {
+    if (count <= this.colliderCapacity) {
+      return;
+    }
+    let capacity = Math.max(16, this.colliderCapacity);
+    while (capacity < count) {
+      capacity *= 2;
+    }
+    this.colliderCapacity = capacity;
+    this.colliderEdges = new Float64Array(capacity * EDGE_LANES);
+    this.colliderEnabled = new Uint8Array(capacity);
+    this.colliderDirty = new Uint8Array(capacity);
+    this.pairKeyActorCount = -1;
+    this.sweepOrder = new Int32Array(capacity);
+    this.sweepCount = 0;
+    this.sweepActive = new Int32Array(capacity);
+  }
+
+  detectContacts(actors: ActorState[]): CollisionPair[] {
+    return this.toCollisionPairs(actors, this.detectContactIndexPairs(actors));
+  }
+
+  detectContactIndexPairs(actors: ActorState[]): ActorIndexPairs {
+    const out = this.contactPairs;
+    out.count = 0;
+    const bodies = this.contactBodies;
+    const actorCount = actors.length;
+    bodies.length = actorCount;
+    if (this.contactMasks.length < actorCount) {
+      this.contactMasks = new Float64Array(Math.max(actorCount, this.contactMasks.length * 2));
+    }
+    const masks = this.contactMasks;
+    for (let i = 0; i < actorCount; i += 1) {
+      const actor = actors[i];
+      const body = this.isActorCollisionEnabled(actor) ? this.bodies.get(actor.uid) : undefined;
+      if (body && this.isBodyActorMaskCollisionEnabled(body)) {
+        bodies[i] = body;
+        masks[i] = body.blockMask as number;
+      } else {
+        bodies[i] = null;
+        masks[i] = NaN;
+      }
+    }
+
+    if (actorCount >= SWEEP_AND_PRUNE_MIN_ACTORS) {
+      this.collectContactPairsWithGrid(actorCount);
+      return out;
+    }
+
+    for (let i = 0; i < actorCount; i += 1) {
+      const maskA = masks[i];
+      if (maskA !== maskA) {
+        continue;
+      }
+      for (let j = i + 1; j < actorCount; j += 1) {
+        // Only pairs sharing a mask reach the body-level box test.
+        if (masks[j] !== maskA) {
           continue;
         }
-        const bodyB = this.bodies.get(b.uid);
-        if (!bodyB || !this.isBodyActorMaskCollisionEnabled(bodyB)) {
-          continue;
+        if (
+          this.areBodiesTouchingOrOverlapping(
+            bodies[i] as PhysicsBodyRuntime,
+            bodies[j] as PhysicsBodyRuntime,
+          )
+        ) {
+          this.pushIndexPair(out, i, j);
+        }
+      }
+    }
+    return out;
+  }
+
+  private collectContactPairsWithGrid(actorCount: number): void {
+    const bodies = this.contactBodies;
+    const masks = this.contactMasks;
+    const tileSize = this.mapSpec ? asNumber(this.mapSpec.tile_size, 0) : 0;
+    const cellSize = tileSize > 0 ? tileSize : DEFAULT_CONTACT_CELL_SIZE;
+    // Touching counts as contact, so cells cover each box grown by the
+    // contact tolerance; bodies that touch then always share a cell.
+    const tolerance = EPSILON * 2;
+    const cells = this.contactCells;
+    cells.clear();
+    const oversized: number[] = [];
+    if (this.contactOversized.length < actorCount) {
+      this.contactOversized = new Uint8Array(this.contactMasks.length);
+    }
+    const oversizedFlags = this.contactOversized;
+
+    for (let i = 0; i < actorCount; i += 1) {
+      if (masks[i] !== masks[i]) {
+        continue;
+      }
+      const body = bodies[i] as PhysicsBodyRuntime;
+      const halfW = body.w * 0.5 + tolerance;
+      const halfH = body.h * 0.5 + tolerance;
+      const minCellX = Math.floor((body.x - halfW) / cellSize);
+      const maxCellX = Math.floor((body.x + halfW) / cellSize);
+      const minCellY = Math.floor((body.y - halfH) / cellSize);
+      const maxCellY = Math.floor((body.y + halfH) / cellSize);
+      const cellCount = (maxCellX - minCellX + 1) * (maxCellY - minCellY + 1);
+      if (!(cellCount <= MAX_CONTACT_CELLS_PER_BODY)) {
+        oversized.push(i);
+        oversizedFlags[i] = 1;
+        continue;
+      }
+      for (let cellX = minCellX; cellX <= maxCellX; cellX += 1) {
+        for (let cellY = minCellY; cellY <= maxCellY; cellY += 1) {
+          // Distinct cells may share a key; that only adds candidates.
+          const key = cellX * 65536 + cellY;
+          const members = cells.get(key);
+          if (members) {
+            members.push(i);
+          } else {
+            cells.set(key, [i]);
+          }
         }
-        if (bodyA.blockMask !== bodyB.blockMask) {
+      }
+    }
+
+    let keyCount = 0;
+    for (const members of cells.values()) {
+      for (let a = 0; a < members.length; a += 1) {
+        const i = members[a];
+        for (let b = a + 1; b < members.length; b += 1) {
+          const j = members[b];
+          if (
+            masks[j] === masks[i] &&
+            this.areBodiesTouchingOrOverlapping(
+              bodies[i] as PhysicsBodyRuntime,
+              bodies[j] as PhysicsBodyRuntime,
+            )
+          ) {
+            keyCount = this.pushContactPairKey(keyCount, i * actorCount + j);
+          }
+        }
+      }
+    }
+    for (let o = 0; o < oversized.length; o += 1) {
+      const i = oversized[o];
+      for (let j = 0; j < actorCount; j += 1) {
+        if (j === i || masks[j] !== masks[i] || (j < i && oversizedFlags[j] !== 0)) {
           continue;
         }
-        if (this.areBodiesTouchingOrOverlapping(bodyA, bodyB)) {
-          contacts.push({ aUid: a.uid, bUid: b.uid });
+        if (
+          this.areBodiesTouchingOrOverlapping(
+            bodies[i] as PhysicsBodyRuntime,
+            bodies[j] as PhysicsBodyRuntime,
+          )
+        ) {
+          keyCount = this.pushContactPairKey(
+            keyCount,
+            i < j ? i * actorCount + j : j * actorCount + i,
+          );
         }
       }
     }
-    return contacts;
+    for (let o = 0; o < oversized.length; o += 1) {
+      oversizedFlags[oversized[o]] = 0;
+    }
+
+    // Pairs sharing several cells are found once per cell; sorting restores
+    // the all-pairs order and lines duplicates up for removal.
+    const keys = this.contactPairKeys.subarray(0, keyCount).sort();
+    const out = this.contactPairs;
+    let previous = -1;
+    for (let k = 0; k < keyCount; k += 1) {
+      const pairKey = keys[k];
+      if (pairKey === previous) {
+        continue;
+      }
+      previous = pairKey;
+      const i = Math.floor(pairKey / actorCount);
+      this.pushIndexPair(out, i, pairKey - i * actorCount);
+    }
+  }
+
+  private pushContactPairKey(keyCount: number, pairKey: number): number {
+    if (keyCount === this.contactPairKeys.length) {
+      const grown = new Float64Array(this.contactPairKeys.length * 2);
+      grown.set(this.contactPairKeys);
+      this.contactPairKeys = grown;
+    }
+    this.contactPairKeys[keyCount] = pairKey;
+    return keyCount + 1;
   }
 
   detectTileOverlaps(
@@ -271,6 +761,7 @@ export class PhysicsSystem {
       return overlaps;
     }
 
+    const tileSize = this.mapSpec.tile_size;
     for (const actor of actors) {
       if (!this.isActorCollisionEnabled(actor)) {
         continue;
@@ -280,10 +771,12 @@ export class PhysicsSystem {
         continue;
       }
 
-      const leftTile = Math.floor((body.x - body.w / 2 + 1) / this.mapSpec.tile_size);
-      const rightTile = Math.floor((body.x + body.w / 2 - 1) / this.mapSpec.tile_size);
-      const topTile = Math.floor((body.y - body.h / 2 + 1) / this.mapSpec.tile_size);
-      const bottomTile = Math.floor((body.y + body.h / 2 - 1) / this.mapSpec.tile_size);
+      const halfW = body.w * 0.5;
+      const halfH = body.h * 0.5;
+      const leftTile = Math.floor((body.x - halfW + 1) / tileSize);
+      const rightTile = Math.floor((body.x + halfW - 1) / tileSize);
+      const topTile = Math.floor((body.y - halfH + 1) / tileSize);
+      const bottomTile = Math.floor((body.y + halfH - 1) / tileSize);
 
       for (let tileY = topTile; tileY <= bottomTile; tileY += 1) {
         for (let tileX = leftTile; tileX <= rightTile; tileX += 1) {
@@ -301,15 +794,15 @@ export class PhysicsSystem {
           if (!this.isTileBlockingForActorMask(tileX, tileY, body.blockMask)) {
             continue;
           }
-          const tileMask = this.tileBlockMasks.get(`${tileX},${tileY}`);
-          if (tileMask === undefined) {
+          const index = tileY * this.tileGridWidth + tileX;
+          if (this.tileHasBlockMask[index] === 0) {
             continue;
           }
           overlaps.push({
             actorUid: actor.uid,
             tileX,
             tileY,
-            tileMask,
+            tileMask: this.tileBlockMasks[index],
           });
         }
       }
@@ -317,17 +810,17 @@ export class PhysicsSystem {
     return overlaps;
   }
 
-  private ensureBody(actor: ActorState): PhysicsBodyRuntime {
+  private ensureBody(actor: ActorState, x: number, y: number): PhysicsBodyRuntime {
     const existing = this.bodies.get(actor.uid);
     if (existing) {
       return existing;
     }
 
-    const config = this.resolveBodyConfig(actor);
     const body: PhysicsBodyRuntime = {
       uid: actor.uid,
-      x: actorCenterX(actor),
-      y: actorCenterY(actor),
+      type: actor.type,
+      x,
+      y,
       w: actorWidth(actor),
       h: actorHeight(actor),
       blockMask: this.resolveActorMask(actor),
@@ -335,9 +828,9 @@ export class PhysicsSystem {
       vy: asNumber(actor.vy, 0),
       onGround: false,
       active: actor.active !== false,
-      prevX: actorCenterX(actor),
-      prevY: actorCenterY(actor),
-      config,
+      prevX: x,
+      prevY: y,
+      config: this.resolveBodyConfig(actor),
     };
     this.bodies.set(actor.uid, body);
     return body;
@@ -455,15 +948,13 @@ export class PhysicsSystem {
       return;
     }
 
-    const worldWidth = this.mapSpec.width * this.mapSpec.tile_size;
-    const worldHeight = this.mapSpec.height * this.mapSpec.tile_size;
-    const halfW = body.w / 2;
-    const halfH = body.h / 2;
+    const halfW = body.w * 0.5;
+    const halfH = body.h * 0.5;
 
     const minX = halfW;
-    const maxX = Math.max(halfW, worldWidth - halfW);
+    const maxX = Math.max(halfW, this.worldWidth - halfW);
     const minY = halfH;
-    const maxY = Math.max(halfH, worldHeight - halfH);
+    const maxY = Math.max(halfH, this.worldHeight - halfH);
 
     if (body.x < minX) {
       body.x = minX;
@@ -487,21 +978,21 @@ export class PhysicsSystem {
     if (!this.mapSpec || body.blockMask === null) {
       return false;
     }
-    const corners: Array<[number, number]> = [
-      [body.x - body.w / 2 + 1, body.y - body.h / 2 + 1],
-      [body.x + body.w / 2 - 1, body.y - body.h / 2 + 1],
-      [body.x - body.w / 2 + 1, body.y + body.h / 2 - 1],
-      [body.x + body.w / 2 - 1, body.y + body.h / 2 - 1],
-    ];
+    const tileSize = this.mapSpec.tile_size;
+    const halfW = body.w * 0.5;
+    const halfH = body.h * 0.5;
+    const leftTile = Math.floor((body.x - halfW + 1) / tileSize);
+    const rightTile = Math.floor((body.x + halfW - 1) / tileSize);
+    const topTile = Math.floor((body.y - halfH + 1) / tileSize);
+    const bottomTile = Math.floor((body.y + halfH - 1) / tileSize);
+    const mask = body.blockMask;
 
-    for (const [x, y] of corners) {
-      const tileX = Math.floor(x / this.mapSpec.tile_size);
-      const tileY = Math.floor(y / this.mapSpec.tile_size);
-      if (this.isTileBlockingForActorMask(tileX, tileY, body.blockMask)) {
-        return true;
-      }
-    }
-    return false;
+    return (
+      this.isTileBlockingForActorMask(leftTile, topTile, mask) ||
+      this.isTileBlockingForActorMask(rightTile, topTile, mask) ||
+      this.isTileBlockingForActorMask(leftTile, bottomTile, mask) ||
+      this.isTileBlockingForActorMask(rightTile, bottomTile, mask)
+    );
   }
 
   private isActorCollisionEnabled(actor: ActorState): boolean {
@@ -613,13 +1104,16 @@ export class PhysicsSystem {
     a: PhysicsBodyRuntime,
     b: PhysicsBodyRuntime,
   ): boolean {
-    const dx = Math.abs(a.x - b.x);
-    const dy = Math.abs(a.y - b.y);
-    const halfW = (a.w + b.w) / 2;
-    const halfH = (a.h + b.h) / 2;
+    const dx = a.x - b.x;
+    const dy = a.y - b.y;
     const tolerance = EPSILON * 2;
+    const reachX = (a.w + b.w) / 2 + tolerance;
+    const reachY = (a.h + b.h) / 2 + tolerance;
+    if (dx * dx + dy * dy > reachX * reachX + reachY * reachY) {
+      return false;
+    }
 
-    return dx <= halfW + tolerance && dy <= halfH + tolerance;
+    return Math.abs(dx) <= reachX && Math.abs(dy) <= reachY;
   }
 
   private isTileBlockingForActorMask(
@@ -638,10 +1132,10 @@ export class PhysicsSystem {
     ) {
       return true;
     }
-    const tileMask = this.tileBlockMasks.get(`${tileX},${tileY}`);
-    if (tileMask === undefined) {
+    const index = tileY * this.tileGridWidth + tileX;
+    if (this.tileHasBlockMask[index] === 0) {
       return false;
     }
-    return tileMask > actorMask;
+    return this.tileBlockMasks[index] > actorMask;
   }
 }
@@ -15,13 +15,25 @@ import {
 } from "./types";
 import { actorCenterX, actorCenterY, actorHeight, actorWidth, asNumber, clamp } from "./utils";
 
+// Largest side, in pixels, of the pre-rendered static tile layer; bigger maps
+// keep filling the batched tile paths every frame instead.
+const MAX_STATIC_TILE_LAYER_SIZE = 4096;
+
 export class CanvasRenderer {
   private readonly canvas: HTMLCanvasElement;
   private readonly ctx: CanvasRenderingContext2D;
   private readonly options: CanvasHostOptions;
   private readonly assets: AssetStore;
   private readonly animation: AnimationSystem;
+  // Counts repaints and drives tile sprite animation. CanvasHost repaints
+  // only after a simulation step, so tiles animate at the step rate.
   private frameCounter = 0;
+  // Color-filled tiles grouped into one path per fill style, built once per map.
+  private tileLayerMap: MapSpec | null = null;
+  private tileColorBatches: Array<{ fillStyle: string; path: Path2D }> = [];
+  // The color batches rendered once into an offscreen canvas, when it fits.
+  private tileStaticLayer: HTMLCanvasElement | null = null;
+  private spriteTiles: Array<{ left: number; top: number; sprite: string }> = [];
 
   constructor(
     canvas: HTMLCanvasElement,
@@ -117,14 +129,60 @@ export class CanvasRenderer {
     if (!mapSpec) {
       return;
     }
+    if (mapSpec !== this.tileLayerMap) {
+      this.buildTileLayer(mapSpec);
+    }
 
     const tileSize = mapSpec.tile_size;
+    const offsetX = this.worldToScreenX(0, camera);
+    const offsetY = this.worldToScreenY(0, camera);
+
+    if (this.tileStaticLayer) {
+      this.ctx.drawImage(this.tileStaticLayer, offsetX, offsetY);
+    } else {
+      this.ctx.save();
+      this.ctx.translate(offsetX, offsetY);
+      for (const batch of this.tileColorBatches) {
+        this.ctx.fillStyle = batch.fillStyle;
+        this.ctx.fill(batch.path);
+      }
+      this.ctx.restore();
+    }
+
     const defaultTileColor = this.options.tileColor || "#2f3648";
+    for (const tile of this.spriteTiles) {
+      const screenX = tile.left + offsetX;
+      const screenY = tile.top + offsetY;
+      if (this.drawTileSprite(tile.sprite, screenX, screenY, tileSize)) {
+        continue;
+      }
+      this.ctx.fillStyle = defaultTileColor;
+      this.ctx.fillRect(screenX, screenY, tileSize, tileSize);
+    }
+  }
 
+  private buildTileLayer(mapSpec: MapSpec): void {
+    this.tileLayerMap = mapSpec;
+    this.tileColorBatches = [];
+    this.tileStaticLayer = null;
+    this.spriteTiles = [];
     if (!Array.isArray(mapSpec.tile_grid)) {
       return;
     }
 
+    const tileSize = mapSpec.tile_size;
+    const defaultTileColor = this.options.tileColor || "#2f3648";
+    const pathsByFillStyle = new Map<string, Path2D>();
+    const addRect = (fillStyle: string, left: number, top: number): void => {
+      let path = pathsByFillStyle.get(fillStyle);
+      if (!path) {
+        path = new Path2D();
+        pathsByFillStyle.set(fillStyle, path);
+        this.tileColorBatches.push({ fillStyle, path });
+      }
+      path.rect(left, top, tileSize, tileSize);
+    };
+
     for (let tileY = 0; tileY < mapSpec.tile_grid.length; tileY += 1) {
       const row = mapSpec.tile_grid[tileY];
       if (!Array.isArray(row)) {
@@ -139,31 +197,52 @@ export class CanvasRenderer {
           continue;
         }
 
-        const worldX = tileX * tileSize + tileSize / 2;
-        const worldY = tileY * tileSize + tileSize / 2;
-        const screenX = this.worldToScreenX(worldX, camera) - tileSize / 2;
-        const screenY = this.worldToScreenY(worldY, camera) - tileSize / 2;
+        const left = tileX * tileSize;
+        const top = tileY * tileSize;
         const tileDef = mapSpec.tile_defs?.[String(tileId)];
 
         const color = tileDef ? this.resolveTileColor(tileDef.color) : null;
         if (color) {
-          this.ctx.fillStyle = color;
-          this.ctx.fillRect(screenX, screenY, tileSize, tileSize);
+          addRect(color, left, top);
           continue;
         }
 
-        if (
-          tileDef &&
-          typeof tileDef.sprite === "string" &&
-          this.drawTileSprite(tileDef.sprite, screenX, screenY, tileSize)
-        ) {
+        // Sprite tiles animate and depend on image loading, so they are
+        // still drawn one by one each frame.
+        if (tileDef && typeof tileDef.sprite === "string") {
+          this.spriteTiles.push({ left, top, sprite: tileDef.sprite });
           continue;
         }
 
-        this.ctx.fillStyle = defaultTileColor;
-        this.ctx.fillRect(screenX, screenY, tileSize, tileSize);
+        addRect(defaultTileColor, left, top);
       }
     }
+
+    this.tileStaticLayer = this.renderStaticTileLayer(mapSpec);
+  }
+
+  private renderStaticTileLayer(mapSpec: MapSpec): HTMLCanvasElement | null {
+    const width = Math.ceil(asNumber(mapSpec.width, 0) * mapSpec.tile_size);
+    const height = Math.ceil(asNumber(mapSpec.height, 0) * mapSpec.tile_size);
+    if (
+      this.tileColorBatches.length === 0 ||
+      !(width > 0 && width <= MAX_STATIC_TILE_LAYER_SIZE) ||
+      !(height > 0 && height <= MAX_STATIC_TILE_LAYER_SIZE)
+    ) {
+      return null;
+    }
+    const layer = document.createElement("canvas");
+    layer.width = width;
+    layer.height = height;
+    const layerCtx = layer.getContext("2d");
+    if (!layerCtx) {
+      return null;
+    }
+    for (const batch of this.tileColorBatches) {
+      layerCtx.fillStyle = batch.fillStyle;
+      layerCtx.fill(batch.path);
+    }
+    return layer;
   }
 
   private resolveTileColor(
@@ -207,7 +286,7 @@ export class CanvasRenderer {
         ? sprite.defaultClip
         : Object.keys(sprite.clips)[0];
     const clip = clipName ? sprite.clips[clipName] : null;
-    if (!clip || !Array.isArray(clip.frames) || clip.frames.length === 0) {
+    if (!clip || !clip.frames || clip.frames.length === 0) {
       return false;
     }
 
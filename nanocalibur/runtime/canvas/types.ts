@@ -58,8 +58,16 @@ export interface CollisionPair {
   bUid: string;
 }
 
+export interface ActorIndexPairs {
+  // Flat [a0, b0, a1, b1, ...] indices into the scanned actors array; only the
+  // first `count` pairs are valid. The buffer is reused by the next scan.
+  indices: Int32Array;
+  count: number;
+}
+
 export interface AnimationClipConfig {
-  frames: number[];
+  // Sprite-sheet frame indices; spec-loaded clips use a packed Int32Array.
+  frames: number[] | Int32Array;
   ticksPerFrame?: number;
   loop?: boolean;
 }
@@ -154,6 +162,7 @@ export interface ResolvedBodyConfig {
 
 export interface PhysicsBodyRuntime {
   uid: string;
+  type: string;
   x: number;
   y: number;
   w: number;
@@ -168,7 +177,24 @@ export interface PhysicsBodyRuntime {
   config: ResolvedBodyConfig;
 }
 
+// A sprite's clips flattened into parallel arrays indexed by clip id, with
+// all frame indices packed into one pool addressed through `start`.
+export interface ClipTable {
+  names: string[];
+  indexByName: Map<string, number>;
+  start: Int32Array;
+  length: Int32Array;
+  ticksPerFrame: Int32Array;
+  loop: Uint8Array;
+  frames: Int32Array;
+}
+
 export interface AnimationRuntime {
+  // Sprite and clip resolved by the last update(), so drawing a frame does
+  // not repeat the name-keyed lookups.
+  sprite: SpriteAnimationConfig;
+  table: ClipTable;
+  clipIndex: number;
   clipName: string;
   frameCursor: number;
   ticksInFrame: number;
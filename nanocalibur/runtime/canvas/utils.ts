@@ -18,10 +18,16 @@ export function asNumber(value: unknown, fallback: number): number {
   return typeof value === "number" && Number.isFinite(value) ? value : fallback;
 }
 
-export function diffSets(current: Set<string>, previous: Set<string>): PhasePayload {
-  const begin: string[] = [];
-  const on: string[] = [];
-  const end: string[] = [];
+export function diffSets(
+  current: Set<string>,
+  previous: Set<string>,
+  out: PhasePayload = { begin: [], on: [], end: [] },
+): PhasePayload {
+  // Callers may pass the payload from the previous call to reuse its arrays.
+  const { begin, on, end } = out;
+  begin.length = 0;
+  on.length = 0;
+  end.length = 0;
 
   for (const item of current) {
     on.push(item);
@@ -30,20 +36,24 @@ export function diffSets(current: Set<string>, previous: Set<string>): PhasePayl
     }
   }
 
+  // Every previous item is still held when the counts line up, e.g. a key
+  // held across frames; skip the release scan then.
+  if (current.size - begin.length === previous.size) {
+    return out;
+  }
   for (const item of previous) {
     if (!current.has(item)) {
       end.push(item);
     }
   }
 
-  return { begin, on, end };
+  return out;
 }
 
+const MOUSE_BUTTON_NAMES = ["left", "middle", "right"];
+
 export function mapMouseButton(buttonCode: number): string {
-  if (buttonCode === 0) return "left";
-  if (buttonCode === 1) return "middle";
-  if (buttonCode === 2) return "right";
-  return `button_${buttonCode}`;
+  return MOUSE_BUTTON_NAMES[buttonCode] ?? `button_${buttonCode}`;
 }
 
 export function actorCenterX(actor: ActorState): number {
@@ -9,6 +9,7 @@ import {
   CanvasHostOptions,
   DEFAULT_FIXED_STEP_MS,
   DEFAULT_MAX_SUB_STEPS,
+  PhasePayload,
   SymbolicFrame,
 } from "./canvas/types";
 import { asNumber, clamp, diffSets, mapMouseButton } from "./canvas/utils";
@@ -34,9 +35,18 @@ export class CanvasHost {
   private interfaceHtml = "";
 
   private readonly keysDown = new Set<string>();
-  private previousKeysDown = new Set<string>();
+  private readonly previousKeysDown = new Set<string>();
   private readonly mouseDown = new Set<string>();
-  private previousMouseDown = new Set<string>();
+  private readonly previousMouseDown = new Set<string>();
+  private readonly keyboardPhases: PhasePayload = { begin: [], on: [], end: [] };
+  private readonly mousePhases: PhasePayload = { begin: [], on: [], end: [] };
+  // Latest pointer position in client coordinates; step() converts it to
+  // canvas pixels once, so layout is read at most once per step.
+  private mouseMovePending = false;
+  private mouseClientX = 0;
+  private mouseClientY = 0;
+  private mouseX = 0;
+  private mouseY = 0;
 
   private readonly fixedStepMs: number;
   private readonly maxSubSteps: number;
@@ -46,16 +56,21 @@ export class CanvasHost {
   private rafId: number | null = null;
   private accumulatorMs = 0;
   private lastFrameMs = 0;
+  private renderPending = true;
 
   private readonly handleKeyDown = (event: KeyboardEvent): void => {
+    if (event.key.startsWith("Arrow") || event.key === " ") {
+      event.preventDefault();
+    }
+    // OS autorepeat re-sends held keys; only re-add them after a blur cleared input.
+    if (event.repeat && this.keysDown.has(event.key)) {
+      return;
+    }
     this.keysDown.add(event.key);
     this.keysDown.add(event.code);
     if (event.key.length === 1) {
       this.keysDown.add(event.key.toLowerCase());
     }
-    if (event.key.startsWith("Arrow") || event.key === " ") {
-      event.preventDefault();
-    }
   };
 
   private readonly handleKeyUp = (event: KeyboardEvent): void => {
@@ -74,6 +89,14 @@ export class CanvasHost {
     this.mouseDown.delete(mapMouseButton(event.button));
   };
 
+  private readonly handleMouseMove = (event: MouseEvent): void => {
+    // mousemove can fire far above the step rate; keep only the latest
+    // position and let step() consume it once.
+    this.mouseClientX = event.clientX;
+    this.mouseClientY = event.clientY;
+    this.mouseMovePending = true;
+  };
+
   private readonly handleContextMenu = (event: MouseEvent): void => {
     event.preventDefault();
   };
@@ -115,7 +138,13 @@ export class CanvasHost {
       this.accumulatorMs = 0;
     }
 
-    this.renderer.render(this.core.getState(), this.core.getMap());
+    // Displays refreshing faster than the fixed step would otherwise redraw
+    // identical frames; only paint when the simulation advanced. This also
+    // keeps tile sprite animation, which counts repaints, at the step rate.
+    if (subSteps > 0 || this.renderPending) {
+      this.renderPending = false;
+      this.renderer.render(this.core.getState(), this.core.getMap());
+    }
     this.rafId = window.requestAnimationFrame(this.frameLoop);
   };
 
@@ -172,6 +201,7 @@ export class CanvasHost {
     this.running = true;
     this.accumulatorMs = 0;
     this.lastFrameMs = 0;
+    this.renderPending = true;
     this.rafId = window.requestAnimationFrame(this.frameLoop);
   }
 
@@ -185,14 +215,21 @@ export class CanvasHost {
   }
 
   private step(dtSeconds: number): void {
-    const keyboard = diffSets(this.keysDown, this.previousKeysDown);
-    const mouse = diffSets(this.mouseDown, this.previousMouseDown);
+    // The phase payloads are reused; core.step consumes them synchronously.
+    const keyboard = diffSets(this.keysDown, this.previousKeysDown, this.keyboardPhases);
+    const mouse = diffSets(this.mouseDown, this.previousMouseDown, this.mousePhases);
     const uiButtons = this.interfaceOverlay
       ? this.interfaceOverlay.consumeButtonEvents()
       : [];
 
-    this.previousKeysDown = new Set(this.keysDown);
-    this.previousMouseDown = new Set(this.mouseDown);
+    this.rememberPressed(this.keysDown, this.previousKeysDown);
+    this.rememberPressed(this.mouseDown, this.previousMouseDown);
+    if (this.mouseMovePending) {
+      const bounds = this.canvas.getBoundingClientRect();
+      this.mouseX = this.mouseClientX - bounds.left;
+      this.mouseY = this.mouseClientY - bounds.top;
+      this.mouseMovePending = false;
+    }
 
     this.core.step(dtSeconds, { keyboard, mouse, uiButtons });
     this.syncInterfaceOverlay();
@@ -201,6 +238,14 @@ export class CanvasHost {
     }
   }
 
+  private rememberPressed(current: Set<string>, previous: Set<string>): void {
+    // Refill the long-lived set instead of allocating a copy every step.
+    previous.clear();
+    for (const item of current) {
+      previous.add(item);
+    }
+  }
+
   private buildInterfaceGlobals(): Record<string, any> {
     const state = this.core.getState();
     const globals =
@@ -216,6 +261,8 @@ export class CanvasHost {
       state.scene && typeof state.scene.elapsed === "number"
         ? state.scene.elapsed
         : 0;
+    globals.__mouse_x = this.mouseX;
+    globals.__mouse_y = this.mouseY;
     return globals;
   }
 
@@ -224,13 +271,17 @@ export class CanvasHost {
       return;
     }
 
-    window.addEventListener("keydown", this.handleKeyDown, { passive: false });
-    window.addEventListener("keyup", this.handleKeyUp);
-    window.addEventListener("mousedown", this.handleMouseDown);
-    window.addEventListener("mouseup", this.handleMouseUp);
+    // keydown and contextmenu call preventDefault, so they cannot be passive.
+    window.addEventListener("keydown", this.handleKeyDown, { passive: false, capture: true });
+    window.addEventListener("keyup", this.handleKeyUp, { passive: true, capture: true });
+    window.addEventListener("mousedown", this.handleMouseDown, { passive: true, capture: true });
+    window.addEventListener("mouseup", this.handleMouseUp, { passive: true, capture: true });
+    window.addEventListener("mousemove", this.handleMouseMove, { passive: true, capture: true });
     window.addEventListener("contextmenu", this.handleContextMenu);
-    window.addEventListener("blur", this.handleWindowBlur);
-    document.addEventListener("visibilitychange", this.handleVisibilityChange);
+    window.addEventListener("blur", this.handleWindowBlur, { passive: true });
+    document.addEventListener("visibilitychange", this.handleVisibilityChange, {
+      passive: true,
+    });
     this.inputInstalled = true;
   }
 
@@ -239,10 +290,11 @@ export class CanvasHost {
       return;
     }
 
-    window.removeEventListener("keydown", this.handleKeyDown);
-    window.removeEventListener("keyup", this.handleKeyUp);
-    window.removeEventListener("mousedown", this.handleMouseDown);
-    window.removeEventListener("mouseup", this.handleMouseUp);
+    window.removeEventListener("keydown", this.handleKeyDown, { capture: true });
+    window.removeEventListener("keyup", this.handleKeyUp, { capture: true });
+    window.removeEventListener("mousedown", this.handleMouseDown, { capture: true });
+    window.removeEventListener("mouseup", this.handleMouseUp, { capture: true });
+    window.removeEventListener("mousemove", this.handleMouseMove, { capture: true });
     window.removeEventListener("contextmenu", this.handleContextMenu);
     window.removeEventListener("blur", this.handleWindowBlur);
     document.removeEventListener("visibilitychange", this.handleVisibilityChange);
@@ -254,6 +306,7 @@ export class CanvasHost {
     this.previousKeysDown.clear();
     this.mouseDown.clear();
     this.previousMouseDown.clear();
+    this.mouseMovePending = false;
   }
 
   private syncInterfaceOverlay(): void {
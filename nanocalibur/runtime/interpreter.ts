@@ -12,6 +12,13 @@ export interface CollisionFrameInput {
   uids?: string[];
 }
 
+export interface PackedCollisionFrameInput {
+  // Flat [a0, b0, a1, b1, ...] indices into `actors`; only `count` pairs are valid.
+  indices: Int32Array;
+  count: number;
+  actors: Array<{ uid: string; type?: string }>;
+}
+
 export interface ToolFrameInput {
   name: string;
   payload?: Record<string, any>;
@@ -24,6 +31,9 @@ export interface NanoCaliburFrameInput {
   uiButtons?: string[];
   collisions?: CollisionFrameInput[];
   contacts?: CollisionFrameInput[];
+  // Packed pairs are matched before the corresponding object lists.
+  overlapPairs?: PackedCollisionFrameInput;
+  contactPairs?: PackedCollisionFrameInput;
   toolCalls?: Array<string | ToolFrameInput>;
   parentPreviousPositions?: Array<{
     uid: string;
@@ -79,7 +89,26 @@ interface ConditionMatchResult {
   toolCall?: ToolFrameInput;
 }
 
+// Frame inputs normalized on first use and shared by every rule of a tick.
+interface NormalizedFrameInput {
+  // Pressed keys per phase as bit masks over the tokens keyboard rules use.
+  keyboard: { begin: Uint32Array; on: Uint32Array; end: Uint32Array } | null;
+  mouse: { begin: string[]; on: string[]; end: string[] } | null;
+  toolCalls: ToolFrameInput[] | null;
+  uiButtons: string[] | null;
+  // Pair numbers of the packed overlap/contact buffers grouped by actor type,
+  // so rules with a typed selector only visit pairs involving that type.
+  overlapPairsByType: Map<string, number[]> | null;
+  contactPairsByType: Map<string, number[]> | null;
+}
+
 type ActionGenerator = Iterator<unknown, void, unknown>;
+
+interface RunningAction {
+  generator: ActionGenerator;
+  // Ticks left before the next resume; `yield n` sleeps for n - 1 ticks.
+  sleepTicks: number;
+}
 type ActionFn = (ctx: Record<string, any>) => void | ActionGenerator;
 type PredicateFn = (payload: Record<string, any>) => boolean;
 
@@ -96,16 +125,43 @@ export class NanoCaliburInterpreter {
   private readonly rules: Record<string, any>[];
   private readonly map: Record<string, any> | null;
   private readonly cameraConfig: Record<string, any> | null;
+  // Follow-camera target, resolved lazily and reset when that uid spawns or dies.
+  private cameraTarget: Record<string, any> | null = null;
+  private cameraTargetResolved = false;
   private readonly predicateMeta: Record<
     string,
     { actor_type: string | null; params: Array<Record<string, any>> | null }
   >;
-  private readonly maskedTiles: Set<string>;
+  // 1 for tiles with a block mask, indexed by `tileY * map.width + tileX`.
+  private readonly maskedTiles: Uint8Array;
   private readonly actorRefGlobals = new Map<string, string>();
-  private readonly runningActions: ActionGenerator[] = [];
+  // uid -> actor, kept in step with spawn/destroy so lookups avoid scans.
+  private readonly actorsByUid = new Map<string, Record<string, any>>();
+  // Positions at the start of the current tick, used to carry children along
+  // with their parents. Reused across ticks instead of reallocated.
+  private readonly previousPositionIndex = new Map<string, number>();
+  private previousX = new Float64Array(16);
+  private previousY = new Float64Array(16);
+  private previousZ = new Float64Array(16);
+  private readonly runningActions: RunningAction[] = [];
+  private readonly frameInput: NormalizedFrameInput = {
+    keyboard: null,
+    mouse: null,
+    toolCalls: null,
+    uiButtons: null,
+    overlapPairsByType: null,
+    contactPairsByType: null,
+  };
   private readonly sceneState: InterpreterSceneState;
   private readonly rolesById: Record<string, any>;
   private readonly keyboardAliasLookup: Map<string, Set<string>>;
+  // Expanded key tokens; aliases are fixed after construction, so a token
+  // always expands to the same candidates.
+  private readonly keyboardTokenCache = new Map<string, string[]>();
+  // Bit index of every token a keyboard rule listens to, and each keyboard
+  // condition's key(s) folded through the alias closure into a bit mask.
+  private readonly keyboardTokenBits = new Map<string, number>();
+  private readonly keyboardConditionMasks = new WeakMap<object, Uint32Array>();
   private runtimeHooks: RuntimeHooks;
 
   constructor(
@@ -120,8 +176,13 @@ export class NanoCaliburInterpreter {
     this.runtimeHooks = runtimeHooks || {};
 
     this.actors = this.initActors(this.spec.actors || []);
+    for (const actor of this.actors) {
+      if (typeof actor.uid === "string" && !this.actorsByUid.has(actor.uid)) {
+        this.actorsByUid.set(actor.uid, actor);
+      }
+    }
     this.globals = this.initGlobals(this.spec.globals || []);
-    this.rules = this.spec.rules || [];
+    this.rules = this.internRuleSelectors(this.spec.rules || []);
     this.map = this.spec.map || null;
     this.cameraConfig = this.spec.camera || null;
     this.predicateMeta = this.buildPredicateMeta(this.spec.predicates || []);
@@ -129,15 +190,22 @@ export class NanoCaliburInterpreter {
     this.sceneState = this.initSceneState(this.spec.scene || null);
     this.rolesById = this.initRoles(this.spec.roles || []);
     this.keyboardAliasLookup = this.buildKeyboardAliasLookup(this.spec.scene || null);
+    for (const rule of this.rules) {
+      const condition = rule?.condition;
+      if (
+        condition &&
+        typeof condition === "object" &&
+        (condition.kind === "keyboard" || condition.kind === "keyboard_pressed")
+      ) {
+        this.keyboardMaskForCondition(condition);
+      }
+    }
   }
 
   tick(frame: NanoCaliburFrameInput = {}): void {
-    const fallbackPreviousPositions = this.captureActorPositions();
-    const previousPositions = this.resolveParentPreviousPositions(
-      frame.parentPreviousPositions,
-      fallbackPreviousPositions,
-    );
+    this.capturePreviousPositions(frame.parentPreviousPositions);
     this.sceneState.turnChangedThisStep = false;
+    this.resetFrameInput();
     this.advanceRunningActions();
     for (const rule of this.rules) {
       const match = this.conditionMatches(rule.condition, frame);
@@ -152,10 +220,10 @@ export class NanoCaliburInterpreter {
       const context = this.buildContext(match.collisionPair || null, match.toolCall || null);
       const result = fn(context);
       if (this.isActionGenerator(result)) {
-        this.runningActions.push(result);
+        this.runningActions.push({ generator: result, sleepTicks: 0 });
       }
     }
-    this.applyParentBindings(previousPositions);
+    this.applyParentBindings();
     this.sceneState.elapsed += 1;
   }
 
@@ -231,7 +299,11 @@ export class NanoCaliburInterpreter {
       };
     }
     if (this.cameraConfig.mode === "follow") {
-      const actor = this.getActorByUid(this.cameraConfig.target_uid);
+      if (!this.cameraTargetResolved) {
+        this.cameraTarget = this.getActorByUid(this.cameraConfig.target_uid);
+        this.cameraTargetResolved = true;
+      }
+      const actor = this.cameraTarget;
       return {
         mode: "follow",
         target_uid: this.cameraConfig.target_uid,
@@ -249,7 +321,11 @@ export class NanoCaliburInterpreter {
     const tileSize = this.map.tile_size;
     const tileX = Math.floor(worldX / tileSize);
     const tileY = Math.floor(worldY / tileSize);
-    return this.maskedTiles.has(`${tileX},${tileY}`);
+    const width = this.map.width;
+    if (tileX < 0 || tileY < 0 || tileX >= width || tileY >= this.map.height) {
+      return false;
+    }
+    return this.maskedTiles[tileY * width + tileX] === 1;
   }
 
   private buildContext(
@@ -322,21 +398,43 @@ export class NanoCaliburInterpreter {
     };
   }
 
+  private resetFrameInput(): void {
+    this.frameInput.keyboard = null;
+    this.frameInput.mouse = null;
+    this.frameInput.toolCalls = null;
+    this.frameInput.uiButtons = null;
+    this.frameInput.overlapPairsByType = null;
+    this.frameInput.contactPairsByType = null;
+  }
+
   private advanceRunningActions(): void {
     if (this.runningActions.length === 0) {
       return;
     }
     let writeIndex = 0;
     for (const action of this.runningActions) {
-      const result = action.next();
-      if (!result.done) {
-        this.runningActions[writeIndex] = action;
-        writeIndex += 1;
+      if (action.sleepTicks > 0) {
+        action.sleepTicks -= 1;
+      } else {
+        const result = action.generator.next();
+        if (result.done) {
+          continue;
+        }
+        action.sleepTicks = this.resolveSleepTicks(result.value);
       }
+      this.runningActions[writeIndex] = action;
+      writeIndex += 1;
     }
     this.runningActions.length = writeIndex;
   }
 
+  private resolveSleepTicks(yielded: unknown): number {
+    if (typeof yielded !== "number" || !Number.isFinite(yielded) || yielded <= 1) {
+      return 0;
+    }
+    return Math.floor(yielded) - 1;
+  }
+
   private isActionGenerator(value: unknown): value is ActionGenerator {
     if (!value || typeof value !== "object") {
       return false;
@@ -363,11 +461,26 @@ export class NanoCaliburInterpreter {
 
   private initActors(actorSpecs: Record<string, any>[]): Record<string, any>[] {
     return actorSpecs.map((actor) => {
-      const out = {
-        ...(this.cloneStructuredValue(actor.fields || {}) as Record<string, any>),
+      const fields = this.cloneStructuredValue(actor.fields || {}) as Record<string, any>;
+      const out: Record<string, any> = {
         uid: actor.uid,
         type: actor.type,
-      } as Record<string, any>;
+      };
+      // Lay fields out in schema order, as spawnActor does, so every actor of
+      // a type shares one object shape regardless of how it was declared.
+      const schema = this.spec?.schemas?.[actor.type] as Record<string, string> | undefined;
+      if (schema && typeof schema === "object") {
+        for (const fieldName of Object.keys(schema)) {
+          if (fieldName in fields && !(fieldName in out)) {
+            out[fieldName] = fields[fieldName];
+          }
+        }
+      }
+      for (const [fieldName, value] of Object.entries(fields)) {
+        if (!(fieldName in out)) {
+          out[fieldName] = value;
+        }
+      }
       if (typeof out.active !== "boolean") {
         out.active = true;
       }
@@ -451,19 +564,21 @@ export class NanoCaliburInterpreter {
       typeof html === "string" ? html : String(html ?? "");
   }
 
-  private buildMaskedTileSet(mapSpec: Record<string, any> | null): Set<string> {
-    const tiles = new Set<string>();
+  private buildMaskedTileSet(mapSpec: Record<string, any> | null): Uint8Array {
     if (!mapSpec) {
-      return tiles;
+      return new Uint8Array(0);
     }
+    const width = Math.max(0, Math.trunc(this.numberOrZero(mapSpec.width)));
+    const height = Math.max(0, Math.trunc(this.numberOrZero(mapSpec.height)));
+    const tiles = new Uint8Array(width * height);
 
     if (Array.isArray(mapSpec.tile_grid)) {
-      for (let tileY = 0; tileY < mapSpec.tile_grid.length; tileY += 1) {
+      for (let tileY = 0; tileY < Math.min(height, mapSpec.tile_grid.length); tileY += 1) {
         const row = mapSpec.tile_grid[tileY];
         if (!Array.isArray(row)) {
           continue;
         }
-        for (let tileX = 0; tileX < row.length; tileX += 1) {
+        for (let tileX = 0; tileX < Math.min(width, row.length); tileX += 1) {
           const tileIdRaw = row[tileX];
           if (typeof tileIdRaw !== "number" || !Number.isFinite(tileIdRaw)) {
             continue;
@@ -479,13 +594,46 @@ export class NanoCaliburInterpreter {
           if (typeof tileDef.block_mask !== "number" || !Number.isFinite(tileDef.block_mask)) {
             continue;
           }
-          tiles.add(`${tileX},${tileY}`);
+          tiles[tileY * width + tileX] = 1;
         }
       }
     }
     return tiles;
   }
 
+  // Rules that name the same selector share one selector object, so matching
+  // can tell symmetric conditions like OnOverlap(Coin, Coin) apart by identity.
+  private internRuleSelectors(rules: Record<string, any>[]): Record<string, any>[] {
+    const interned = new Map<string, Record<string, any>>();
+    const intern = (selector: unknown): unknown => {
+      if (!selector || typeof selector !== "object") {
+        return selector;
+      }
+      const source = selector as Record<string, any>;
+      const key = JSON.stringify([source.kind, source.uid ?? null, source.actor_type ?? null]);
+      const existing = interned.get(key);
+      if (existing) {
+        return existing;
+      }
+      interned.set(key, source);
+      return source;
+    };
+
+    return rules.map((rule) => {
+      const condition = rule?.condition;
+      if (!condition || typeof condition !== "object") {
+        return rule;
+      }
+      const next: Record<string, any> = { ...condition };
+      for (const field of ["left", "right", "target"]) {
+        if (field in next) {
+          next[field] = intern(next[field]);
+        }
+      }
+      return { ...rule, condition: next };
+    });
+  }
+
   private buildPredicateMeta(
     predicateDefs: Array<
       string | { name?: string; actor_type?: string | null; params?: unknown }
@@ -524,7 +672,13 @@ export class NanoCaliburInterpreter {
         return { matched: false };
       }
       const phase = condition.phase || "on";
-      return { matched: this.matchKeyboardPhase(frame, phase, condition.key) };
+      return {
+        matched: this.matchKeyboardPhase(
+          frame,
+          phase,
+          this.keyboardMaskForCondition(condition),
+        ),
+      };
     }
 
     if (condition.kind === "mouse" || condition.kind === "mouse_clicked") {
@@ -548,6 +702,29 @@ export class NanoCaliburInterpreter {
           : condition.kind === "contact"
             ? "contact"
             : "overlap";
+      const packed = mode === "contact" ? frame.contactPairs : frame.overlapPairs;
+      if (packed) {
+        const pairType = this.selectorActorType(condition.left) ?? this.selectorActorType(condition.right);
+        const typedPairs =
+          pairType === null ? null : this.packedPairsOfType(mode, packed, pairType);
+        const pairCount = typedPairs ? typedPairs.length : packed.count;
+        for (let n = 0; n < pairCount; n += 1) {
+          const p = typedPairs ? typedPairs[n] : n;
+          const first = packed.actors[packed.indices[2 * p]];
+          const second = packed.actors[packed.indices[2 * p + 1]];
+          // Selectors only look at uid and type, so most pairs can be ruled
+          // out on the frame snapshot before resolving the live actors.
+          if (!this.collisionSelectorsMatch(condition, first, second)) {
+            continue;
+          }
+          const a = this.getActorByUid(first.uid);
+          const b = this.getActorByUid(second.uid);
+          const match = this.matchCollisionCondition(condition, a, b);
+          if (match) {
+            return match;
+          }
+        }
+      }
       const collisions =
         mode === "contact"
           ? Array.isArray(frame.contacts)
@@ -558,20 +735,9 @@ export class NanoCaliburInterpreter {
             : [];
       for (const collision of collisions) {
         const [a, b] = this.resolveCollisionPair(collision);
-        if (!a || !b) {
-          continue;
-        }
-        const direct =
-          this.matchesSelector(condition.left, a) &&
-          this.matchesSelector(condition.right, b);
-        const swapped =
-          this.matchesSelector(condition.left, b) &&
-          this.matchesSelector(condition.right, a);
-        if (direct || swapped) {
-          return {
-            matched: true,
-            collisionPair: direct ? [a, b] : [b, a],
-          };
+        const match = this.matchCollisionCondition(condition, a, b);
+        if (match) {
+          return match;
         }
       }
       return { matched: false };
@@ -608,7 +774,10 @@ export class NanoCaliburInterpreter {
       if (!toolName) {
         return { matched: false };
       }
-      const toolCalls = this.normalizeToolCalls(frame.toolCalls);
+      if (!this.frameInput.toolCalls) {
+        this.frameInput.toolCalls = this.normalizeToolCalls(frame.toolCalls);
+      }
+      const toolCalls = this.frameInput.toolCalls;
       for (const toolCall of toolCalls) {
         if (toolCall.name === toolName && this.matchesRoleScope(condition, frame, toolCall)) {
           return { matched: true, toolCall };
@@ -622,13 +791,100 @@ export class NanoCaliburInterpreter {
       if (!buttonName) {
         return { matched: false };
       }
-      const buttons = this.normalizeStringArray(frame.uiButtons || []);
+      if (!this.frameInput.uiButtons) {
+        this.frameInput.uiButtons = this.normalizeStringArray(frame.uiButtons || []);
+      }
+      const buttons = this.frameInput.uiButtons;
       return { matched: buttons.includes(buttonName) };
     }
 
     return { matched: false };
   }
 
+  private matchCollisionCondition(
+    condition: Record<string, any>,
+    a: Record<string, any> | null,
+    b: Record<string, any> | null,
+  ): ConditionMatchResult | null {
+    if (!a || !b) {
+      return null;
+    }
+    const direct =
+      this.matchesSelector(condition.left, a) &&
+      this.matchesSelector(condition.right, b);
+    // With one selector on both sides the swapped test repeats the direct one.
+    const swapped =
+      condition.left === condition.right
+        ? direct
+        : this.matchesSelector(condition.left, b) &&
+          this.matchesSelector(condition.right, a);
+    if (!direct && !swapped) {
+      return null;
+    }
+    return {
+      matched: true,
+      collisionPair: direct ? [a, b] : [b, a],
+    };
+  }
+
+  private selectorActorType(selector: unknown): string | null {
+    if (!selector || typeof selector !== "object") {
+      return null;
+    }
+    const actorType = (selector as Record<string, any>).actor_type;
+    return typeof actorType === "string" && actorType ? actorType : null;
+  }
+
+  private packedPairsOfType(
+    mode: string,
+    packed: PackedCollisionFrameInput,
+    actorType: string,
+  ): number[] {
+    const key = mode === "contact" ? "contactPairsByType" : "overlapPairsByType";
+    let byType = this.frameInput[key];
+    if (!byType) {
+      byType = new Map<string, number[]>();
+      for (let p = 0; p < packed.count; p += 1) {
+        const typeA = packed.actors[packed.indices[2 * p]].type;
+        const typeB = packed.actors[packed.indices[2 * p + 1]].type;
+        if (typeof typeA === "string") {
+          const list = byType.get(typeA);
+          if (list) {
+            list.push(p);
+          } else {
+            byType.set(typeA, [p]);
+          }
+        }
+        if (typeof typeB === "string" && typeB !== typeA) {
+          const list = byType.get(typeB);
+          if (list) {
+            list.push(p);
+          } else {
+            byType.set(typeB, [p]);
+          }
+        }
+      }
+      this.frameInput[key] = byType;
+    }
+    return byType.get(actorType) || [];
+  }
+
+  private collisionSelectorsMatch(
+    condition: Record<string, any>,
+    a: Record<string, any>,
+    b: Record<string, any>,
+  ): boolean {
+    if (condition.left === condition.right) {
+      return this.matchesSelector(condition.left, a) && this.matchesSelector(condition.left, b);
+    }
+    return (
+      (this.matchesSelector(condition.left, a) &&
+        this.matchesSelector(condition.right, b)) ||
+      (this.matchesSelector(condition.left, b) &&
+        this.matchesSelector(condition.right, a))
+    );
+  }
+
   private resolveCollisionPair(
     collision: CollisionFrameInput,
   ): [Record<string, any> | null, Record<string, any> | null] {
@@ -653,27 +909,74 @@ export class NanoCaliburInterpreter {
   private matchKeyboardPhase(
     frame: NanoCaliburFrameInput,
     phase: string,
-    key: string | string[],
+    keyMask: Uint32Array,
   ): boolean {
-    const keyboard = frame.keyboard || {};
-    const begin = this.expandKeyboardValues(this.normalizeStringArray(
-      keyboard.begin || frame.keysJustPressed || frame.keysBegin || [],
-    ));
-    const on = this.expandKeyboardValues(this.normalizeStringArray(
-      keyboard.on || frame.keysPressed || frame.keysDown || [],
-    ));
-    const end = this.expandKeyboardValues(this.normalizeStringArray(
-      keyboard.end || frame.keysJustReleased || frame.keysEnd || [],
-    ));
-    if (Array.isArray(key)) {
-      for (const item of key) {
-        if (this.phaseSetContains(phase, begin, on, end, item)) {
-          return true;
+    if (!this.frameInput.keyboard) {
+      const keyboard = frame.keyboard || {};
+      this.frameInput.keyboard = {
+        begin: this.buildKeyboardPhaseMask(this.normalizeStringArray(
+          keyboard.begin || frame.keysJustPressed || frame.keysBegin || [],
+        )),
+        on: this.buildKeyboardPhaseMask(this.normalizeStringArray(
+          keyboard.on || frame.keysPressed || frame.keysDown || [],
+        )),
+        end: this.buildKeyboardPhaseMask(this.normalizeStringArray(
+          keyboard.end || frame.keysJustReleased || frame.keysEnd || [],
+        )),
+      };
+    }
+    const { begin, on, end } = this.frameInput.keyboard;
+    const pressed = phase === "begin" ? begin : phase === "end" ? end : on;
+    const words = Math.min(pressed.length, keyMask.length);
+    for (let word = 0; word < words; word += 1) {
+      if ((pressed[word] & keyMask[word]) !== 0) {
+        return true;
+      }
+    }
+    return false;
+  }
+
+  private keyboardMaskForCondition(condition: Record<string, any>): Uint32Array {
+    let mask = this.keyboardConditionMasks.get(condition);
+    if (mask) {
+      return mask;
+    }
+    const keys: unknown[] = Array.isArray(condition.key) ? condition.key : [condition.key];
+    const bits: number[] = [];
+    for (const key of keys) {
+      if (typeof key !== "string") {
+        continue;
+      }
+      for (const token of this.expandKeyboardToken(key)) {
+        let bit = this.keyboardTokenBits.get(token);
+        if (bit === undefined) {
+          bit = this.keyboardTokenBits.size;
+          this.keyboardTokenBits.set(token, bit);
+          // Phase masks built earlier this tick cannot see the new token.
+          this.frameInput.keyboard = null;
+        }
+        bits.push(bit);
+      }
+    }
+    mask = new Uint32Array(Math.ceil(this.keyboardTokenBits.size / 32));
+    for (const bit of bits) {
+      mask[bit >>> 5] |= 1 << (bit & 31);
+    }
+    this.keyboardConditionMasks.set(condition, mask);
+    return mask;
+  }
+
+  private buildKeyboardPhaseMask(values: string[]): Uint32Array {
+    const mask = new Uint32Array(Math.ceil(this.keyboardTokenBits.size / 32));
+    for (const value of values) {
+      for (const token of this.expandKeyboardToken(value)) {
+        const bit = this.keyboardTokenBits.get(token);
+        if (bit !== undefined) {
+          mask[bit >>> 5] |= 1 << (bit & 31);
         }
       }
-      return false;
     }
-    return this.phaseSetContains(phase, begin, on, end, key);
+    return mask;
   }
 
   private matchMousePhase(
@@ -681,14 +984,19 @@ export class NanoCaliburInterpreter {
     phase: string,
     button: string,
   ): boolean {
-    const mouse = frame.mouse || {};
-    const begin = this.normalizeStringArray(
-      mouse.begin || frame.mouseButtonsJustPressed || [],
-    );
-    const on = this.normalizeStringArray(mouse.on || frame.mouseButtons || []);
-    const end = this.normalizeStringArray(
-      mouse.end || frame.mouseButtonsJustReleased || [],
-    );
+    if (!this.frameInput.mouse) {
+      const mouse = frame.mouse || {};
+      this.frameInput.mouse = {
+        begin: this.normalizeStringArray(
+          mouse.begin || frame.mouseButtonsJustPressed || [],
+        ),
+        on: this.normalizeStringArray(mouse.on || frame.mouseButtons || []),
+        end: this.normalizeStringArray(
+          mouse.end || frame.mouseButtonsJustReleased || [],
+        ),
+      };
+    }
+    const { begin, on, end } = this.frameInput.mouse;
 
     if (phase === "on" && begin.length === 0 && on.length === 0 && end.length === 0) {
       const clicked = frame.mouseClicked;
@@ -719,47 +1027,19 @@ export class NanoCaliburInterpreter {
     return on.includes(value);
   }
 
-  private phaseSetContains(
-    phase: string,
-    begin: Set<string>,
-    on: Set<string>,
-    end: Set<string>,
-    value: string,
-  ): boolean {
-    const candidates = this.expandKeyboardToken(value);
-    if (phase === "begin") {
-      return this.setContainsAny(begin, candidates);
-    }
-    if (phase === "end") {
-      return this.setContainsAny(end, candidates);
-    }
-    return this.setContainsAny(on, candidates);
-  }
-
-  private setContainsAny(haystack: Set<string>, candidates: string[]): boolean {
-    for (const candidate of candidates) {
-      if (haystack.has(candidate)) {
-        return true;
-      }
-    }
-    return false;
-  }
-
-  private expandKeyboardValues(values: string[]): Set<string> {
-    const out = new Set<string>();
-    for (const value of values) {
-      const expanded = this.expandKeyboardToken(value);
-      for (const token of expanded) {
-        out.add(token);
-      }
-    }
-    return out;
-  }
-
   private expandKeyboardToken(token: string): string[] {
     if (typeof token !== "string" || token.length === 0) {
       return [];
     }
+    let cached = this.keyboardTokenCache.get(token);
+    if (!cached) {
+      cached = this.computeKeyboardTokenExpansion(token);
+      this.keyboardTokenCache.set(token, cached);
+    }
+    return cached;
+  }
+
+  private computeKeyboardTokenExpansion(token: string): string[] {
 
     const out = new Set<string>();
     const queue: string[] = [token];
@@ -1069,6 +1349,8 @@ export class NanoCaliburInterpreter {
     }
 
     this.actors.push(actor);
+    this.actorsByUid.set(resolvedUid, actor);
+    this.invalidateCameraTarget(resolvedUid);
     this.refreshActorRefGlobalsForUid(resolvedUid);
 
     if (this.runtimeHooks.scene?.spawnActor) {
@@ -1096,7 +1378,13 @@ export class NanoCaliburInterpreter {
     }
 
     const removed = this.actors.splice(index, 1)[0];
+    this.actorsByUid.delete(uid);
+    const duplicate = this.actors.find((actor) => actor.uid === uid);
+    if (duplicate) {
+      this.actorsByUid.set(uid, duplicate);
+    }
     removed.active = false;
+    this.invalidateCameraTarget(uid);
     this.refreshActorRefGlobalsForUid(uid);
 
     if (this.runtimeHooks.destroyActor) {
@@ -1104,6 +1392,12 @@ export class NanoCaliburInterpreter {
     }
   }
 
+  private invalidateCameraTarget(uid: string): void {
+    if (this.cameraConfig && this.cameraConfig.target_uid === uid) {
+      this.cameraTargetResolved = false;
+    }
+  }
+
   private refreshActorRefGlobalsForUid(uid: string): void {
     for (const [globalName, globalUid] of this.actorRefGlobals.entries()) {
       if (globalUid !== uid) {
@@ -1113,22 +1407,7 @@ export class NanoCaliburInterpreter {
     }
   }
 
-  private captureActorPositions(): Map<string, { x: number; y: number; z: number }> {
-    const out = new Map<string, { x: number; y: number; z: number }>();
-    for (const actor of this.actors) {
-      if (typeof actor.uid !== "string" || !actor.uid) {
-        continue;
-      }
-      out.set(actor.uid, {
-        x: this.numberOrZero(actor.x),
-        y: this.numberOrZero(actor.y),
-        z: this.numberOrZero(actor.z),
-      });
-    }
-    return out;
-  }
-
-  private resolveParentPreviousPositions(
+  private capturePreviousPositions(
     encoded:
       | Array<{
           uid: string;
@@ -1137,36 +1416,56 @@ export class NanoCaliburInterpreter {
           z?: number;
         }>
       | undefined,
-    fallback: Map<string, { x: number; y: number; z: number }>,
-  ): Map<string, { x: number; y: number; z: number }> {
-    if (!Array.isArray(encoded) || encoded.length === 0) {
-      return fallback;
-    }
-    const out = new Map<string, { x: number; y: number; z: number }>();
-    for (const item of encoded) {
-      if (!item || typeof item.uid !== "string" || !item.uid) {
-        continue;
+  ): void {
+    this.previousPositionIndex.clear();
+    if (Array.isArray(encoded)) {
+      for (const item of encoded) {
+        if (!item || typeof item.uid !== "string" || !item.uid) {
+          continue;
+        }
+        this.recordPreviousPosition(item.uid, item.x, item.y, item.z);
       }
-      out.set(item.uid, {
-        x: this.numberOrZero(item.x),
-        y: this.numberOrZero(item.y),
-        z: this.numberOrZero(item.z),
-      });
     }
-    if (out.size === 0) {
-      return fallback;
+    if (this.previousPositionIndex.size > 0) {
+      return;
+    }
+    for (const actor of this.actors) {
+      if (typeof actor.uid !== "string" || !actor.uid) {
+        continue;
+      }
+      this.recordPreviousPosition(actor.uid, actor.x, actor.y, actor.z);
     }
-    return out;
   }
 
-  private applyParentBindings(
-    previousPositions: Map<string, { x: number; y: number; z: number }>,
-  ): void {
-    const byUid = new Map<string, Record<string, any>>();
-    for (const actor of this.actors) {
-      if (typeof actor.uid === "string" && actor.uid) {
-        byUid.set(actor.uid, actor);
+  private recordPreviousPosition(uid: string, x: unknown, y: unknown, z: unknown): void {
+    let index = this.previousPositionIndex.get(uid);
+    if (index === undefined) {
+      index = this.previousPositionIndex.size;
+      if (index === this.previousX.length) {
+        this.growPreviousPositions(index * 2);
       }
+      this.previousPositionIndex.set(uid, index);
+    }
+    this.previousX[index] = this.numberOrZero(x);
+    this.previousY[index] = this.numberOrZero(y);
+    this.previousZ[index] = this.numberOrZero(z);
+  }
+
+  private growPreviousPositions(capacity: number): void {
+    const grow = (source: Float64Array): Float64Array => {
+      const next = new Float64Array(capacity);
+      next.set(source);
+      return next;
+    };
+    this.previousX = grow(this.previousX);
+    this.previousY = grow(this.previousY);
+    this.previousZ = grow(this.previousZ);
+  }
+
+  private applyParentBindings(): void {
+    // Most scenes have no attached actors; skip the traversal state for them.
+    if (!this.actors.some((actor) => typeof actor.parent === "string" && actor.parent)) {
+      return;
     }
 
     const visiting = new Set<string>();
@@ -1184,13 +1483,16 @@ export class NanoCaliburInterpreter {
 
       const parentUid = typeof actor.parent === "string" ? actor.parent : "";
       if (parentUid) {
-        const parent = byUid.get(parentUid);
+        const parent = this.actorsByUid.get(parentUid);
         if (parent) {
           applyFor(parent);
-          const previous = previousPositions.get(parentUid);
-          const parentPrevX = previous ? previous.x : this.numberOrZero(parent.x);
-          const parentPrevY = previous ? previous.y : this.numberOrZero(parent.y);
-          const parentPrevZ = previous ? previous.z : this.numberOrZero(parent.z);
+          const previous = this.previousPositionIndex.get(parentUid);
+          const parentPrevX =
+            previous !== undefined ? this.previousX[previous] : this.numberOrZero(parent.x);
+          const parentPrevY =
+            previous !== undefined ? this.previousY[previous] : this.numberOrZero(parent.y);
+          const parentPrevZ =
+            previous !== undefined ? this.previousZ[previous] : this.numberOrZero(parent.z);
           const dx = this.numberOrZero(parent.x) - parentPrevX;
           const dy = this.numberOrZero(parent.y) - parentPrevY;
           const dz = this.numberOrZero(parent.z) - parentPrevZ;
@@ -1268,6 +1570,6 @@ export class NanoCaliburInterpreter {
   }
 
   private getActorByUid(uid: string): Record<string, any> | null {
-    return this.actors.find((actor) => actor.uid === uid) || null;
+    return this.actorsByUid.get(uid) || null;
   }
 }
@@ -41,7 +41,7 @@ function toSpriteConfig(specSprite: SpecSpriteDef): SpriteAnimationConfig | null
       continue;
     }
     clips[clipName] = {
-      frames: clipDef.frames,
+      frames: Int32Array.from(clipDef.frames, (frame) => Math.trunc(asNumber(frame, 0))),
       ticksPerFrame: clipDef.ticks_per_frame,
       loop: clipDef.loop,
     };
@@ -140,11 +140,21 @@ export function mergeSpecOptions(
   };
 }
 
+interface PreviousPosition {
+  uid: string;
+  x: number;
+  y: number;
+  z: number;
+}
+
 export class RuntimeCore {
   private readonly interpreter: NanoCaliburInterpreter;
   private readonly options: CanvasHostOptions;
   private readonly physics: PhysicsSystem;
   private readonly animation: AnimationSystem;
+  // Hot per-step position snapshot, kept apart from the actor records and
+  // refilled in place so stepping does not allocate one object per actor.
+  private readonly previousPositions: PreviousPosition[] = [];
 
   constructor(
     interpreter: NanoCaliburInterpreter,
@@ -201,12 +211,7 @@ export class RuntimeCore {
     this.refreshScene(beforeState);
     const beforeActors = beforeState.actors as ActorState[];
     this.applySpriteDefaultDimensions(beforeActors);
-    const parentPreviousPositions = beforeActors.map((actor) => ({
-      uid: actor.uid,
-      x: actorCenterX(actor),
-      y: actorCenterY(actor),
-      z: asNumber(actor.z, 0),
-    }));
+    const parentPreviousPositions = this.capturePreviousPositions(beforeActors);
 
     this.physics.syncBodiesFromActors(beforeActors, false);
     this.physics.integrate(dtSeconds);
@@ -214,31 +219,33 @@ export class RuntimeCore {
     this.physics.resolvePostActionSolidCollisions();
     this.physics.writeBodiesToActors(beforeActors);
 
-    const actorOverlaps = this.physics.detectCollisions(beforeActors);
-    const contacts = this.physics.detectContacts(beforeActors);
+    // Actor pairs stay packed as index buffers; the interpreter resolves uids
+    // only for the pairs its rules actually inspect.
+    const actorOverlaps = this.physics.detectCollisionIndexPairs(beforeActors);
+    const contacts = this.physics.detectContactIndexPairs(beforeActors);
     const tileOverlaps = this.physics.detectTileOverlaps(beforeActors);
+    // beforeActors is the interpreter's live list, which actions may splice
+    // mid-tick; pair indices refer to this snapshot instead.
+    const pairActors = beforeActors.slice();
     const actorsByUid = new Map(beforeActors.map((actor) => [actor.uid, actor] as const));
-    const overlapFrameEvents: CollisionFrameInput[] = [
-      ...actorOverlaps.map((pair) => ({ aUid: pair.aUid, bUid: pair.bUid })),
-      ...tileOverlaps
-        .map((item): CollisionFrameInput | null => {
-          const actor = actorsByUid.get(item.actorUid);
-          if (!actor) {
-            return null;
-          }
-          return {
-            a: actor,
-            b: {
-              uid: `__tile_${item.tileX}_${item.tileY}`,
-              type: "Tile",
-              tile_x: item.tileX,
-              tile_y: item.tileY,
-              block_mask: item.tileMask,
-            },
-          };
-        })
-        .filter((entry): entry is CollisionFrameInput => entry !== null),
-    ];
+    const tileOverlapFrameEvents: CollisionFrameInput[] = tileOverlaps
+      .map((item): CollisionFrameInput | null => {
+        const actor = actorsByUid.get(item.actorUid);
+        if (!actor) {
+          return null;
+        }
+        return {
+          a: actor,
+          b: {
+            uid: `__tile_${item.tileX}_${item.tileY}`,
+            type: "Tile",
+            tile_x: item.tileX,
+            tile_y: item.tileY,
+            block_mask: item.tileMask,
+          },
+        };
+      })
+      .filter((entry): entry is CollisionFrameInput => entry !== null);
 
     const frame: NanoCaliburFrameInput = {
       keyboard: input.keyboard,
@@ -252,8 +259,9 @@ export class RuntimeCore {
           : typeof input.role_id === "string"
             ? input.role_id
             : undefined,
-      collisions: overlapFrameEvents,
-      contacts: contacts.map((pair) => ({ aUid: pair.aUid, bUid: pair.bUid })),
+      overlapPairs: { ...actorOverlaps, actors: pairActors },
+      collisions: tileOverlapFrameEvents,
+      contactPairs: { ...contacts, actors: pairActors },
     };
 
     this.interpreter.tick(frame);
@@ -270,8 +278,31 @@ export class RuntimeCore {
     this.animation.update(afterActors);
   }
 
+  private capturePreviousPositions(actors: ActorState[]): PreviousPosition[] {
+    const positions = this.previousPositions;
+    for (let index = 0; index < actors.length; index += 1) {
+      const actor = actors[index];
+      let entry = positions[index];
+      if (!entry) {
+        entry = { uid: "", x: 0, y: 0, z: 0 };
+        positions.push(entry);
+      }
+      entry.uid = actor.uid;
+      entry.x = actorCenterX(actor);
+      entry.y = actorCenterY(actor);
+      entry.z = asNumber(actor.z, 0);
+    }
+    positions.length = actors.length;
+    return positions;
+  }
+
   private applySpriteDefaultDimensions(actors: ActorState[]): void {
     for (const actor of actors) {
+      // Sized actors keep their dimensions, so only unsized ones need the
+      // name/uid/type sprite lookup; after the first step that is usually none.
+      if (typeof actor.w === "number" && typeof actor.h === "number") {
+        continue;
+      }
       const sprite = this.resolveSpriteConfig(actor);
       if (!sprite) {
         continue;
@@ -727,6 +727,14 @@ function __nc_dict_items(base: any): any[] {
     def _emit_range_for(self, stmt: For, indent: int, post_yield_refresh_calls=None):
         pad = "  " * indent
         post_yield_refresh_calls = post_yield_refresh_calls or []
+        wait_ticks = self._tick_wait_loop_count(stmt)
+        if wait_ticks is not None:
+            # `for _ in range(n): yield tick` only waits; a single `yield n`
+            # lets the interpreter sleep the action instead of resuming it n times.
+            lines = [pad + f"yield {wait_ticks};"]
+            for refresh_fn in post_yield_refresh_calls:
+                lines.append(pad + f"{refresh_fn}();")
+            return lines
         args = stmt.iterable.args
         if len(args) == 1:
             start_expr = "0"
@@ -762,6 +770,27 @@ function __nc_dict_items(base: any): any[] {
         lines.append(pad + "}")
         return lines
 
+    def _tick_wait_loop_count(self, stmt: For) -> int | None:
+        args = stmt.iterable.args
+        if len(args) != 1 or len(stmt.body) != 1:
+            return None
+        count = args[0]
+        if not (
+            isinstance(count, Const)
+            and isinstance(count.value, int)
+            and not isinstance(count.value, bool)
+            and count.value > 0
+        ):
+            return None
+        body = stmt.body[0]
+        if not (
+            isinstance(body, Yield)
+            and isinstance(body.value, Var)
+            and body.value.name in getattr(self, "_tick_vars", set())
+        ):
+            return None
+        return count.value
+
     def _emit_expr(self, expr):
         if isinstance(expr, Const):
             value = expr.value
@@ -370,6 +370,200 @@ def test_actor_overlap_still_reports_collision_pair(tmp_path):
     assert values["collisions"] == [{"aUid": "hero", "bUid": "coin_pet"}]
 
 
+def test_broad_phase_collisions_match_all_pairs_order(tmp_path):
+    root = Path(__file__).resolve().parent.parent
+    physics_ts_path = root / "nanocalibur" / "runtime" / "canvas" / "physics.ts"
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(physics_ts_path),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    physics_js_path = compiled_dir / "physics.js"
+
+    actors = []
+    for index in range(40):
+        actors.append(
+            {
+                "uid": f"actor_{index}",
+                "type": "Coin",
+                "x": (index * 37) % 300 + 0.5,
+                "y": (index * 53) % 200,
+                "w": 10 + (index % 5) * 12,
+                "h": 10 + (index % 3) * 20,
+                "active": index % 7 != 3,
+            }
+        )
+    # Widths are clamped to 1, but at 2**53 a 1-wide collider has equal left
+    # and right edges. Its left edge matches the left edge of "wide", which
+    # sorts first and is still active when "zero_width" is swept.
+    actors.append({"uid": "wide", "type": "Coin", "x": 2**53 + 12, "y": 0, "w": 24, "h": 10})
+    actors.append({"uid": "zero_width", "type": "Coin", "x": 2**53, "y": 0, "w": 1, "h": 10})
+    actors.append({"uid": "no_width", "type": "Coin", "x": 40, "y": 40, "w": 0, "h": 10})
+
+    def width(actor):
+        return max(1, actor["w"])
+
+    def overlaps(a, b):
+        return (
+            a["x"] - width(a) / 2 < b["x"] + width(b) / 2
+            and a["x"] + width(a) / 2 > b["x"] - width(b) / 2
+            and a["y"] - a["h"] / 2 < b["y"] + b["h"] / 2
+            and a["y"] + a["h"] / 2 > b["y"] - b["h"] / 2
+        )
+
+    def all_pairs(frame):
+        return [
+            {"aUid": a["uid"], "bUid": b["uid"]}
+            for i, a in enumerate(frame)
+            for b in frame[i + 1 :]
+            if a.get("active", True) and b.get("active", True) and overlaps(a, b)
+        ]
+
+    moved = [dict(actor, x=300 - actor["x"]) for actor in actors]
+    expected = [all_pairs(actors), all_pairs(moved)]
+
+    script = textwrap.dedent(
+        f"""
+        const {{ PhysicsSystem }} = require({json.dumps(str(physics_js_path))});
+
+        const physics = new PhysicsSystem({{}});
+        physics.setMap({{
+          width: 10,
+          height: 7,
+          tile_size: 32,
+          tile_grid: Array.from({{ length: 7 }}, () => Array.from({{ length: 10 }}, () => 0)),
+          tile_defs: {{}}
+        }});
+        const frames = [{json.dumps(actors)}, {json.dumps(moved)}];
+        const results = frames.map((actors) => {{
+          physics.syncBodiesFromActors(actors, false);
+          return physics.detectCollisions(actors);
+        }});
+        console.log(JSON.stringify(results));
+        """
+    )
+
+    proc = subprocess.run(
+        ["node", "-e", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    collisions = json.loads(proc.stdout.strip())
+    assert all(expected)
+    assert collisions == expected
+
+
+def test_incremental_collisions_match_all_pairs_when_few_actors_move(tmp_path):
+    root = Path(__file__).resolve().parent.parent
+    physics_ts_path = root / "nanocalibur" / "runtime" / "canvas" / "physics.ts"
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(physics_ts_path),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    physics_js_path = compiled_dir / "physics.js"
+
+    actors = []
+    for index in range(24):
+        actors.append(
+            {
+                "uid": f"actor_{index}",
+                "type": "Coin",
+                "x": (index * 37) % 200 + 0.5,
+                "y": (index * 53) % 120,
+                "w": 20 + (index % 5) * 10,
+                "h": 20 + (index % 3) * 15,
+                "active": True,
+            }
+        )
+
+    def overlaps(a, b):
+        return (
+            a["x"] - a["w"] / 2 < b["x"] + b["w"] / 2
+            and a["x"] + a["w"] / 2 > b["x"] - b["w"] / 2
+            and a["y"] - a["h"] / 2 < b["y"] + b["h"] / 2
+            and a["y"] + a["h"] / 2 > b["y"] - b["h"] / 2
+        )
+
+    def all_pairs(frame):
+        return [
+            {"aUid": a["uid"], "bUid": b["uid"]}
+            for i, a in enumerate(frame)
+            for b in frame[i + 1 :]
+            if a["active"] and b["active"] and overlaps(a, b)
+        ]
+
+    frames = [actors]
+    for step in range(1, 6):
+        frame = [dict(actor) for actor in frames[-1]]
+        frame[step]["x"] += 40
+        frame[step + 7]["y"] -= 25
+        if step == 3:
+            frame[10]["active"] = False
+        if step == 4:
+            frame[10]["active"] = True
+        frames.append(frame)
+    frames.append([dict(actor) for actor in frames[-1]])
+    expected = [all_pairs(frame) for frame in frames]
+
+    script = textwrap.dedent(
+        f"""
+        const {{ PhysicsSystem }} = require({json.dumps(str(physics_js_path))});
+
+        const physics = new PhysicsSystem({{}});
+        const frames = {json.dumps(frames)};
+        const results = frames.map((actors) => {{
+          physics.syncBodiesFromActors(actors, false);
+          return physics.detectCollisions(actors);
+        }});
+        console.log(JSON.stringify(results));
+        """
+    )
+
+    proc = subprocess.run(
+        ["node", "-e", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    collisions = json.loads(proc.stdout.strip())
+    assert all(expected)
+    assert collisions == expected
+
+
 def test_actor_contacts_require_equal_block_masks(tmp_path):
     root = Path(__file__).resolve().parent.parent
     physics_ts_path = root / "nanocalibur" / "runtime" / "canvas" / "physics.ts"
@@ -440,6 +634,94 @@ def test_actor_contacts_require_equal_block_masks(tmp_path):
     assert values["differentContacts"] == []
 
 
+def test_grid_contacts_match_all_pairs_for_many_actors(tmp_path):
+    root = Path(__file__).resolve().parent.parent
+    physics_ts_path = root / "nanocalibur" / "runtime" / "canvas" / "physics.ts"
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(physics_ts_path),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    physics_js_path = compiled_dir / "physics.js"
+
+    actors = []
+    for index in range(40):
+        actors.append(
+            {
+                "uid": f"actor_{index}",
+                "type": "Coin",
+                # Widths and spacing line many neighbours up edge to edge.
+                "x": (index % 8) * 20 + (index // 8) * 3,
+                "y": (index // 8) * 20 - 40,
+                "w": 20 if index % 3 else 26,
+                "h": 20,
+                "active": index % 11 != 5,
+                "block_mask": 1 + index % 2,
+            }
+        )
+    actors[17].update({"x": 60, "y": 0, "w": 400, "h": 400})
+    actors[31].update({"x": 80, "y": 20, "w": 400, "h": 400, "active": True})
+    actors[18]["block_mask"] = None
+
+    def touching(a, b):
+        tolerance = 0.001 * 2
+        return abs(a["x"] - b["x"]) <= (a["w"] + b["w"]) / 2 + tolerance and abs(
+            a["y"] - b["y"]
+        ) <= (a["h"] + b["h"]) / 2 + tolerance
+
+    expected = [
+        {"aUid": a["uid"], "bUid": b["uid"]}
+        for i, a in enumerate(actors)
+        for b in actors[i + 1 :]
+        if a["active"]
+        and b["active"]
+        and a["block_mask"] is not None
+        and a["block_mask"] == b["block_mask"]
+        and touching(a, b)
+    ]
+
+    script = textwrap.dedent(
+        f"""
+        const {{ PhysicsSystem }} = require({json.dumps(str(physics_js_path))});
+
+        const physics = new PhysicsSystem({{}});
+        const actors = {json.dumps(actors)};
+        physics.syncBodiesFromActors(actors, false);
+        const first = physics.detectContacts(actors);
+        // Oversized flags must not leak into the next call.
+        console.log(JSON.stringify([first, physics.detectContacts(actors)]));
+        """
+    )
+
+    proc = subprocess.run(
+        ["node", "-e", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    first, second = json.loads(proc.stdout.strip())
+    assert len(expected) > 20
+    assert {"aUid": "actor_17", "bUid": "actor_31"} in expected
+    assert first == expected
+    assert second == expected
+
+
 def test_actor_tile_overlap_events_include_tile_coords(tmp_path):
     root = Path(__file__).resolve().parent.parent
     physics_ts_path = root / "nanocalibur" / "runtime" / "canvas" / "physics.ts"
@@ -519,3 +801,105 @@ def test_actor_tile_overlap_events_include_tile_coords(tmp_path):
     )
     values = json.loads(proc.stdout.strip())
     assert values == [{"actorUid": "hero", "tileX": 1, "tileY": 1, "tileMask": 2}]
+
+
+def test_runtime_overlap_pairs_survive_actor_removal_mid_tick(tmp_path):
+    root = Path(__file__).resolve().parent.parent
+    runtime_dir = root / "nanocalibur" / "runtime"
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(runtime_dir / "headless_host.ts"),
+            str(runtime_dir / "runtime_core.ts"),
+            str(runtime_dir / "symbolic_renderer.ts"),
+            str(runtime_dir / "interpreter.ts"),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    script = textwrap.dedent(
+        f"""
+        const {{ NanoCaliburInterpreter }} = require({json.dumps(str(compiled_dir / "interpreter.js"))});
+        const {{ HeadlessHost }} = require({json.dumps(str(compiled_dir / "headless_host.js"))});
+
+        const coin = (uid, x) => ({{
+          type: "Coin",
+          uid,
+          fields: {{ x, y: 16, w: 16, h: 16, active: true }}
+        }});
+        const spec = {{
+          schemas: {{
+            Player: {{ uid: "str", x: "float", y: "float", w: "float", h: "float", active: "bool" }},
+            Coin: {{ uid: "str", x: "float", y: "float", w: "float", h: "float", active: "bool" }}
+          }},
+          actors: [
+            coin("coin_a", -4),
+            {{ type: "Player", uid: "hero", fields: {{ x: 16, y: 16, w: 32, h: 16, active: true }} }},
+            coin("coin_c", 20),
+            coin("coin_b", 30)
+          ],
+          globals: [{{ name: "collected", kind: "list", value: [] }}],
+          predicates: [],
+          tools: [],
+          rules: [
+            {{
+              condition: {{
+                kind: "collision",
+                left: {{ kind: "with_uid", uid: "hero" }},
+                right: {{ kind: "with_uid", uid: "coin_a" }}
+              }},
+              action: "collect"
+            }},
+            {{
+              condition: {{
+                kind: "collision",
+                left: {{ kind: "with_uid", uid: "hero" }},
+                right: {{ kind: "with_uid", uid: "coin_b" }}
+              }},
+              action: "collect"
+            }}
+          ]
+        }};
+
+        const actions = {{
+          collect: (ctx) => {{
+            const coin = ctx.getActorByUid("__nanocalibur_collision_right__");
+            ctx.globals.collected.push(coin.uid);
+            ctx.destroyActor(coin);
+          }}
+        }};
+
+        const interpreter = new NanoCaliburInterpreter(spec, actions, {{}});
+        const host = new HeadlessHost(interpreter, {{}});
+        host.step({{ dtSeconds: 0 }});
+        const state = host.getState();
+        console.log(JSON.stringify({{
+          collected: state.globals.collected,
+          remaining: state.actors.map((actor) => actor.uid)
+        }}));
+        """
+    )
+
+    proc = subprocess.run(
+        ["node", "-e", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    values = json.loads(proc.stdout.strip())
+    assert values["collected"] == ["coin_a", "coin_b"]
+    assert values["remaining"] == ["hero", "coin_c"]
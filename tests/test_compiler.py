@@ -605,6 +605,64 @@ def test_reject_yield_for_non_tick_parameter():
         )
 
 
+def test_reject_scene_wait_ticks_without_single_argument():
+    with pytest.raises(DSLValidationError, match="wait_ticks\\(...\\) expects one argument"):
+        compile_source(
+            """
+            def bad(scene: Scene):
+                yield scene.wait_ticks()
+            """
+        )
+
+
+def test_reject_scene_wait_ticks_with_string_argument():
+    with pytest.raises(DSLValidationError, match="wait_ticks\\(...\\) expects an int"):
+        compile_source(
+            """
+            def bad(scene: Scene):
+                yield scene.wait_ticks("soon")
+            """
+        )
+
+
+def test_reject_scene_wait_ticks_with_float_or_bool_argument():
+    for argument in ("2.5", "True", "10 / 2", "1 < 2"):
+        with pytest.raises(DSLValidationError, match="wait_ticks\\(...\\) expects an int"):
+            compile_source(
+                f"""
+                def bad(scene: Scene):
+                    yield scene.wait_ticks({argument})
+                """
+            )
+
+
+def test_reject_scene_wait_ticks_with_actor_argument():
+    with pytest.raises(DSLValidationError, match="wait_ticks\\(...\\) expects an int"):
+        compile_source(
+            """
+            class Player(Actor):
+                pass
+
+            def bad(scene: Scene, player: Player["hero"]):
+                yield scene.wait_ticks(player)
+            """
+        )
+
+
+def test_accept_scene_wait_ticks_with_int_field_expression():
+    actions = compile_source(
+        """
+        class Player(Actor):
+            cooldown: int
+
+        def pause(scene: Scene, player: Player["hero"]):
+            yield scene.wait_ticks(player.cooldown * 2 + 1)
+        """
+    )
+
+    assert isinstance(actions[0].body[0], Yield)
+
+
 def test_accept_while_true():
     actions = compile_source(
         """
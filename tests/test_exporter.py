@@ -1,7 +1,9 @@
 import json
 import textwrap
 
-from nanocalibur.exporter import export_project
+import pytest
+
+from nanocalibur.exporter import compile_project, export_project
 
 
 def test_export_project_writes_spec_and_logic_files(tmp_path):
@@ -52,7 +54,9 @@ def test_export_project_writes_spec_and_logic_files(tmp_path):
     assert not js_path.exists()
     assert not esm_path.exists()
 
-    spec = json.loads(spec_path.read_text(encoding="utf-8"))
+    spec_text = spec_path.read_text(encoding="utf-8")
+    assert "\n" not in spec_text
+    spec = json.loads(spec_text)
     assert spec["schemas"]["Player"]["life"] == "int"
     assert spec["map"]["tile_size"] == 16
     assert spec["map"]["tile_grid"] == [[0, 1], [0, 0]]
@@ -177,6 +181,69 @@ def test_export_project_resolves_grid_file_relative_to_source_path(tmp_path):
     assert spec["map"]["tile_grid"] == [[0, 1, 0], [1, 0, 0]]
 
 
+def test_compile_project_returns_independent_copies_for_same_source():
+    source = textwrap.dedent(
+        """
+        class Player(Actor):
+            pass
+
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        game.add_global("score", 0)
+        scene.add_actor(Player(uid="hero", x=16, y=16))
+        """
+    )
+
+    first = compile_project(source)
+    first.globals.clear()
+    second = compile_project(source)
+    assert [global_var.name for global_var in second.globals] == ["score"]
+    assert second.actors[0].uid == "hero"
+
+
+def test_compile_project_replays_warnings_for_same_source():
+    source = textwrap.dedent(
+        """
+        def helper(value):
+            return value
+
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        """
+    )
+
+    with pytest.warns(UserWarning, match="no DSL decorator"):
+        compile_project(source)
+    with pytest.warns(UserWarning, match="no DSL decorator"):
+        compile_project(source)
+
+
+def test_compile_project_rereads_changed_grid_file(tmp_path):
+    grid_path = tmp_path / "level.txt"
+    grid_path.write_text("0 1\n", encoding="utf-8")
+    source = textwrap.dedent(
+        """
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        scene.set_map(
+            TileMap(
+                tile_size=16,
+                grid="level.txt",
+                tiles={1: Tile(block_mask=2, color=Color(70, 70, 70))},
+            )
+        )
+        """
+    )
+    source_path = str(tmp_path / "scene.py")
+
+    assert compile_project(source, source_path).tile_map.tile_grid == [[0, 1]]
+    grid_path.write_text("1 0\n", encoding="utf-8")
+    assert compile_project(source, source_path).tile_map.tile_grid == [[1, 0]]
+
+
 def test_export_project_serializes_scene_interface_html_and_button_condition(tmp_path):
     source = textwrap.dedent(
         '''
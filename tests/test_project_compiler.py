@@ -1,8 +1,10 @@
+import ast
 import textwrap
 import warnings
 
 import pytest
 
+from nanocalibur.codeblocks import preprocess_code_blocks
 from nanocalibur.errors import DSLValidationError
 from nanocalibur.game_model import (
     ButtonConditionSpec,
@@ -260,6 +262,26 @@ def test_project_parses_roles_and_role_scoped_conditions():
     assert tool_rule.condition.role_id == "ai_1"
 
 
+def test_game_add_roles_declares_roles_in_order():
+    project = compile_project(
+        """
+        class Player(Actor):
+            pass
+
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        bot = Role(id="ai_1", required=False, kind=RoleKind.AI)
+        game.add_roles([Role(id="human_1", kind=RoleKind.HUMAN), bot])
+        scene.add_actor(Player(uid="hero", x=0, y=0))
+        """
+    )
+
+    assert [role.id for role in project.roles] == ["human_1", "ai_1"]
+    assert project.roles[1].required is False
+    assert project.roles[1].kind == RoleKind.AI
+
+
 def test_project_parses_role_schema_and_role_bindings():
     project = compile_project(
         """
@@ -690,6 +712,45 @@ def test_scene_add_actor_accepts_alias_of_named_actor_variable():
     assert coin.fields["sprite"] == "coin"
 
 
+def test_scene_add_actors_declares_actors_in_order():
+    project = compile_project(
+        """
+        class Player(Actor):
+            speed: int
+
+        class Coin(Actor):
+            pass
+
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+
+        hero_player = Player(uid="hero", x=10, y=20, speed=2)
+        scene.add_actor(Coin(x=1, y=2))
+        scene.add_actors([hero_player, Coin(x=3, y=4), Coin(parent="hero", x=5, y=6)])
+        """
+    )
+
+    assert [actor.uid for actor in project.actors] == ["coin_1", "hero", "coin_2", "coin_3"]
+    assert project.actors[1].fields["speed"] == 2
+    assert project.actors[3].fields["parent"] == "hero"
+
+
+def test_scene_add_actors_rejects_duplicate_uids_within_batch():
+    with pytest.raises(DSLValidationError, match="duplicate actor uid 'coin_a'"):
+        compile_project(
+            """
+            class Coin(Actor):
+                pass
+
+            game = Game()
+            scene = Scene(gravity=False)
+            game.set_scene(scene)
+            scene.add_actors([Coin(uid="coin_a"), Coin(uid="coin_a")])
+            """
+        )
+
+
 def test_general_top_level_aliasing_for_calls_and_callables():
     project = compile_project(
         """
@@ -859,6 +920,39 @@ def test_tile_map_grid_can_load_from_relative_text_file(tmp_path):
     assert project.tile_map.tile_defs[2].sprite == "torch"
 
 
+def test_tile_map_grid_file_errors_point_at_first_offending_cell(tmp_path):
+    scene_path = tmp_path / "scene.py"
+    source = """
+        class Player(Actor):
+            pass
+
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        scene.add_actor(Player(uid="hero", x=10, y=20))
+
+        scene.set_map(
+            TileMap(
+                tile_size=16,
+                grid="level.txt",
+                tiles={1: Tile(block_mask=2, color=Color(120, 120, 120))},
+            )
+        )
+        """
+
+    (tmp_path / "level.txt").write_text("0 1 0\n1 x 2\n", encoding="utf-8")
+    with pytest.raises(DSLValidationError, match="Invalid map grid value 'x' .* line 2"):
+        compile_project(source, source_path=str(scene_path))
+
+    (tmp_path / "level.txt").write_text("0 1 -3\n-4 0 1\n", encoding="utf-8")
+    with pytest.raises(DSLValidationError, match="negative tile id -3"):
+        compile_project(source, source_path=str(scene_path))
+
+    (tmp_path / "level.txt").write_text("0 1 0\n3 0 2\n", encoding="utf-8")
+    with pytest.raises(DSLValidationError, match="tile id '3' at \\(0, 1\\)"):
+        compile_project(source, source_path=str(scene_path))
+
+
 def test_tile_map_grid_palette_supports_color_and_sprite_tiles():
     project = compile_project(
         """
@@ -1749,6 +1843,128 @@ def test_abstract_code_block_instantiation_expands_rules_and_selectors():
     assert project.actions[0].name != project.actions[1].name
 
 
+def test_abstract_code_block_substitutes_list_macro_values():
+    project = compile_project(
+        """
+        AbstractCodeBlock.begin("stop_controls", id=str, keys=list)
+
+        @condition(KeyboardCondition.end_press(keys, id=id))
+        def stop(player: Player["hero"]):
+            player.x = 0
+
+        AbstractCodeBlock.end("stop_controls")
+
+        AbstractCodeBlock.instantiate("stop_controls", id="human_1", keys=["q", "d"])
+        AbstractCodeBlock.instantiate("stop_controls", id="human_2", keys=["z", "s"])
+
+        CodeBlock.begin("main")
+
+        class Player(Actor):
+            pass
+
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        game.add_role(Role(id="human_1", required=True, kind=RoleKind.HUMAN))
+        game.add_role(Role(id="human_2", required=True, kind=RoleKind.HUMAN))
+        scene.add_actor(Player(uid="hero", x=0, y=0))
+
+        CodeBlock.end("main")
+        """,
+        require_code_blocks=True,
+    )
+
+    keys_by_role = {
+        rule.condition.role_id: rule.condition.key  # type: ignore[attr-defined]
+        for rule in project.rules
+    }
+    assert keys_by_role == {"human_1": ["q", "d"], "human_2": ["z", "s"]}
+
+
+def test_abstract_code_block_substitutes_parameters_inside_f_strings():
+    source = textwrap.dedent(
+        """
+        AbstractCodeBlock.begin("banner", name=str)
+        scene.set_interface_html(f"<p>{name}</p>")
+        AbstractCodeBlock.end("banner")
+
+        AbstractCodeBlock.instantiate("banner", name="bob")
+        """
+    )
+
+    result = preprocess_code_blocks(
+        source,
+        require_code_blocks=True,
+        unboxed_disable_flag="--allow-unboxed",
+    )
+
+    (stmt,) = ast.parse(result).body
+    formatted = stmt.value.args[0].values[1]
+    assert isinstance(formatted, ast.FormattedValue)
+    assert isinstance(formatted.value, ast.Constant)
+    assert formatted.value.value == "bob"
+
+
+def test_abstract_code_block_substitutes_list_values_inside_f_strings():
+    source = textwrap.dedent(
+        """
+        AbstractCodeBlock.begin("banner", keys=list)
+        scene.set_interface_html(f"<p>{keys}</p>")
+        AbstractCodeBlock.end("banner")
+
+        AbstractCodeBlock.instantiate("banner", keys=["q", "d"])
+        """
+    )
+
+    result = preprocess_code_blocks(
+        source,
+        require_code_blocks=True,
+        unboxed_disable_flag="--allow-unboxed",
+    )
+
+    (stmt,) = ast.parse(result).body
+    formatted = stmt.value.args[0].values[1]
+    assert ast.literal_eval(formatted.value) == ["q", "d"]
+
+
+def test_abstract_code_block_repeated_identical_instantiation_gets_fresh_names():
+    project = compile_project(
+        """
+        AbstractCodeBlock.begin("nudge", step=int)
+
+        @condition(KeyboardCondition.on_press("d", id="human_1"))
+        def nudge(player: Player["hero"]):
+            player.x = player.x + step
+
+        AbstractCodeBlock.end("nudge")
+
+        AbstractCodeBlock.instantiate("nudge", step=2)
+        AbstractCodeBlock.instantiate("nudge", step=2)
+        AbstractCodeBlock.instantiate("nudge", step=2)
+
+        CodeBlock.begin("main")
+
+        class Player(Actor):
+            pass
+
+        game = Game()
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        game.add_role(Role(id="human_1", required=True, kind=RoleKind.HUMAN))
+        scene.add_actor(Player(uid="hero", x=0, y=0))
+
+        CodeBlock.end("main")
+        """,
+        require_code_blocks=True,
+    )
+
+    assert sorted(action.name for action in project.actions) == [
+        "nudge__nudge_1",
+        "nudge__nudge_2",
+        "nudge__nudge_3",
+    ]
+
+
 def test_abstract_code_block_warns_when_not_instantiated():
     with pytest.warns(UserWarning, match="never instantiated"):
         compile_project(
@@ -1778,6 +1994,79 @@ def test_abstract_code_block_warns_when_not_instantiated():
         )
 
 
+def test_unused_abstract_code_blocks_are_reported_in_one_warning():
+    with pytest.warns(UserWarning) as record:
+        compile_project(
+            """
+            AbstractCodeBlock.begin("left", id=str, descr="left move")
+
+            @condition(KeyboardCondition.on_press("q", id=id))
+            def move_left(player: Player["hero"]):
+                player.x = player.x - 1
+
+            AbstractCodeBlock.end("left")
+
+            AbstractCodeBlock.begin("right", id=str)
+
+            @condition(KeyboardCondition.on_press("d", id=id))
+            def move_right(player: Player["hero"]):
+                player.x = player.x + 1
+
+            AbstractCodeBlock.end("right")
+
+            CodeBlock.begin("main")
+
+            class Player(Actor):
+                pass
+
+            game = Game()
+            scene = Scene(gravity=False)
+            game.set_scene(scene)
+            scene.add_actor(Player(uid="hero", x=0, y=0))
+
+            CodeBlock.end("main")
+            """,
+            require_code_blocks=True,
+        )
+
+    messages = [
+        str(warning.message)
+        for warning in record
+        if "never instantiated" in str(warning.message)
+    ]
+    assert len(messages) == 1
+    assert "'left' (left move), 'right' are never instantiated" in messages[0]
+
+
+def test_repeated_preprocessing_replays_code_block_warnings():
+    source = """
+    AbstractCodeBlock.begin("unused", id=str)
+
+    @condition(KeyboardCondition.on_press("d", id=id))
+    def move_right(player: Player["hero"]):
+        player.x = player.x + 1
+
+    AbstractCodeBlock.end("unused")
+
+    CodeBlock.begin("main")
+
+    class Player(Actor):
+        pass
+
+    game = Game()
+    scene = Scene(gravity=False)
+    game.set_scene(scene)
+    scene.add_actor(Player(uid="hero", x=0, y=0))
+
+    CodeBlock.end("main")
+    """
+    with pytest.warns(UserWarning, match="never instantiated"):
+        first = compile_project(source, require_code_blocks=True)
+    with pytest.warns(UserWarning, match="never instantiated"):
+        second = compile_project(source, require_code_blocks=True)
+    assert [actor.uid for actor in second.actors] == [actor.uid for actor in first.actors]
+
+
 def test_code_block_without_end_raises_error():
     with pytest.raises(DSLValidationError, match="never closed"):
         compile_project(
@@ -401,3 +401,116 @@ def test_generator_actor_binding_rebinds_after_yield(tmp_path):
     )
     result = json.loads(proc.stdout.strip())
     assert result["actor_count"] == 0
+
+
+def test_folded_tick_wait_resumes_on_the_same_tick_as_unrolled_yields(tmp_path):
+    source = textwrap.dedent(
+        """
+        class Coin(Actor):
+            pass
+
+        def delayed_score(tick: Tick, score: Global["score", int]):
+            for _ in range(3):
+                yield tick
+            score = score + 1
+
+        def stepped_score(tick: Tick, score: Global["stepped", int]):
+            yield tick
+            yield tick
+            yield tick
+            score = score + 1
+
+        game = Game()
+        game.add_role(Role(id="human_1", required=True, kind=RoleKind.HUMAN))
+        scene = Scene(gravity=False)
+        game.set_scene(scene)
+        game.add_global("score", 0)
+        game.add_global("stepped", 0)
+        scene.add_actor(Coin(uid="coin_1", x=0, y=0))
+        scene.add_rule(KeyboardCondition.begin_press("E", id="human_1"), delayed_score)
+        scene.add_rule(KeyboardCondition.begin_press("E", id="human_1"), stepped_score)
+        """
+    )
+
+    export_project(source, str(tmp_path))
+
+    runtime_ts_path = (
+        Path(__file__).resolve().parent.parent
+        / "nanocalibur"
+        / "runtime"
+        / "interpreter.ts"
+    )
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(tmp_path / "game_logic.ts"),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(runtime_ts_path),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    runner_path = tmp_path / "run_runtime_wait_test.js"
+    runner_path.write_text(
+        textwrap.dedent(
+            f"""
+            const spec = require({json.dumps(str(tmp_path / "game_spec.json"))});
+            const logic = require({json.dumps(str(compiled_dir / "game_logic.js"))});
+            const {{ NanoCaliburInterpreter }} = require({json.dumps(str(compiled_dir / "interpreter.js"))});
+
+            const interpreter = new NanoCaliburInterpreter(spec, {{
+              delayed_score: logic.delayed_score,
+              stepped_score: logic.stepped_score
+            }}, {{}});
+
+            const history = [];
+            for (let i = 0; i < 6; i += 1) {{
+              interpreter.tick({{
+                roleId: "human_1",
+                keyboard: {{ begin: i === 0 ? ["E"] : [], on: [], end: [] }}
+              }});
+              const globals = interpreter.getState().globals;
+              history.push([globals.score, globals.stepped]);
+            }}
+            console.log(JSON.stringify(history));
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    proc = subprocess.run(
+        ["node", str(runner_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    history = json.loads(proc.stdout.strip())
+    assert history == [[0, 0], [0, 0], [0, 0], [0, 0], [1, 1], [1, 1]]
@@ -177,6 +177,76 @@ def test_runtime_keyboard_normalization_and_scene_aliases(tmp_path):
     assert values["layout"] == 1
 
 
+def test_runtime_keyboard_rules_over_many_keys(tmp_path):
+    root = Path(__file__).resolve().parent.parent
+    runtime_ts_path = root / "nanocalibur" / "runtime" / "interpreter.ts"
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(runtime_ts_path),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    runtime_path = compiled_dir / "interpreter.js"
+
+    script = textwrap.dedent(
+        f"""
+        const {{ NanoCaliburInterpreter }} = require({json.dumps(str(runtime_path))});
+
+        const letters = "abcdefghijklmnopqrstuvwxyz".split("");
+        const spec = {{
+          actors: [],
+          globals: letters.map((letter) => ({{ name: letter, kind: "int", value: 0 }})),
+          predicates: [],
+          rules: letters.map((letter) => ({{
+            condition: {{ kind: "keyboard", phase: "end", key: [letter, "ArrowUp"] }},
+            action: "inc_" + letter
+          }}))
+        }};
+
+        const actions = {{}};
+        for (const letter of letters) {{
+          actions["inc_" + letter] = (ctx) => {{
+            ctx.globals[letter] = ctx.globals[letter] + 1;
+          }};
+        }}
+
+        const i = new NanoCaliburInterpreter(spec, actions, {{}});
+        i.tick({{ keyboard: {{ end: ["KeyZ", "Y"] }} }});
+        i.tick({{ keyboard: {{ end: ["a"] }} }});
+        i.tick({{ keyboard: {{ on: ["b"], end: ["Enter"] }} }});
+        i.tick({{ keyboard: {{ end: ["up"] }} }});
+        console.log(JSON.stringify(i.getState().globals));
+        """
+    )
+
+    proc = subprocess.run(
+        ["node", "-e", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    values = json.loads(proc.stdout.strip())
+    assert values["z"] == 2
+    assert values["y"] == 2
+    assert values["a"] == 2
+    assert values["b"] == 1
+    assert values["m"] == 1
+
+
 def test_runtime_role_state_and_context_binding(tmp_path):
     root = Path(__file__).resolve().parent.parent
     runtime_ts_path = root / "nanocalibur" / "runtime" / "interpreter.ts"
@@ -952,3 +1022,166 @@ def test_runtime_collision_modes_distinguish_overlap_and_contact(tmp_path):
     values = json.loads(proc.stdout.strip())
     assert values["overlap_count"] == 1
     assert values["contact_count"] == 1
+
+
+def test_canvas_host_reads_canvas_bounds_once_per_step_for_mouse_moves(tmp_path):
+    root = Path(__file__).resolve().parent.parent
+    runtime_dir = root / "nanocalibur" / "runtime"
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(runtime_dir / "interpreter.ts"),
+            str(runtime_dir / "canvas_host.ts"),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    script = textwrap.dedent(
+        f"""
+        const context = new Proxy({{}}, {{ get: () => () => undefined, set: () => true }});
+        let boundsReads = 0;
+        const canvas = {{
+          width: 64,
+          height: 64,
+          style: {{}},
+          getContext: () => context,
+          getBoundingClientRect: () => {{
+            boundsReads += 1;
+            return {{ left: 10, top: 20 }};
+          }}
+        }};
+        globalThis.window = {{ addEventListener() {{}}, removeEventListener() {{}} }};
+        globalThis.document = {{ hidden: false, addEventListener() {{}}, removeEventListener() {{}} }};
+
+        const {{ NanoCaliburInterpreter }} = require({json.dumps(str(compiled_dir / "interpreter.js"))});
+        const {{ CanvasHost }} = require({json.dumps(str(compiled_dir / "canvas_host.js"))});
+
+        const spec = {{ actors: [], globals: [], predicates: [], rules: [] }};
+        const host = new CanvasHost(canvas, new NanoCaliburInterpreter(spec, {{}}, {{}}), {{}});
+        const readsAfterSetup = boundsReads;
+
+        host.handleMouseMove({{ clientX: 15, clientY: 25 }});
+        host.handleMouseMove({{ clientX: 40, clientY: 70 }});
+        host.handleMouseMove({{ clientX: 50, clientY: 90 }});
+        const readsAfterMoves = boundsReads;
+        host.step(1 / 60);
+        const moved = host.buildInterfaceGlobals();
+        host.step(1 / 60);
+        const idle = host.buildInterfaceGlobals();
+
+        console.log(JSON.stringify({{
+          moveReads: readsAfterMoves - readsAfterSetup,
+          stepReads: boundsReads - readsAfterMoves,
+          moved: [moved.__mouse_x, moved.__mouse_y],
+          idle: [idle.__mouse_x, idle.__mouse_y]
+        }}));
+        """
+    )
+
+    proc = subprocess.run(
+        ["node", "-e", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result = json.loads(proc.stdout.strip())
+    assert result["moveReads"] == 0
+    assert result["stepReads"] == 1
+    assert result["moved"] == [40, 70]
+    assert result["idle"] == [40, 70]
+
+
+def test_canvas_host_repaints_and_animates_tiles_at_step_rate(tmp_path):
+    root = Path(__file__).resolve().parent.parent
+    runtime_dir = root / "nanocalibur" / "runtime"
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [
+            "npx",
+            "-p",
+            "typescript",
+            "tsc",
+            str(runtime_dir / "interpreter.ts"),
+            str(runtime_dir / "canvas_host.ts"),
+            "--target",
+            "ES2020",
+            "--module",
+            "commonjs",
+            "--outDir",
+            str(compiled_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    script = textwrap.dedent(
+        f"""
+        const context = new Proxy({{}}, {{ get: () => () => undefined, set: () => true }});
+        const canvas = {{
+          width: 64,
+          height: 64,
+          style: {{}},
+          getContext: () => context,
+          getBoundingClientRect: () => ({{ left: 0, top: 0 }})
+        }};
+        globalThis.window = {{
+          addEventListener() {{}},
+          removeEventListener() {{}},
+          requestAnimationFrame: () => 1,
+          cancelAnimationFrame() {{}}
+        }};
+        globalThis.document = {{ hidden: false, addEventListener() {{}}, removeEventListener() {{}} }};
+
+        const {{ NanoCaliburInterpreter }} = require({json.dumps(str(compiled_dir / "interpreter.js"))});
+        const {{ CanvasHost }} = require({json.dumps(str(compiled_dir / "canvas_host.js"))});
+
+        (async () => {{
+          const spec = {{ actors: [], globals: [], predicates: [], rules: [] }};
+          const host = new CanvasHost(canvas, new NanoCaliburInterpreter(spec, {{}}, {{}}), {{}});
+          let steps = 0;
+          const step = host.step.bind(host);
+          host.step = (dt) => {{
+            steps += 1;
+            step(dt);
+          }};
+          await host.start();
+
+          // One second of 144 Hz display refreshes against the default 60 Hz step.
+          const paintsBefore = host.renderer.frameCounter;
+          for (let frame = 1; frame <= 144; frame += 1) {{
+            host.frameLoop((frame * 1000) / 144);
+          }}
+          console.log(JSON.stringify({{
+            steps,
+            paints: host.renderer.frameCounter - paintsBefore
+          }}));
+        }})();
+        """
+    )
+
+    proc = subprocess.run(
+        ["node", "-e", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result = json.loads(proc.stdout.strip())
+    assert 58 <= result["steps"] <= 60
+    # One paint right after start(), then one per refresh that ran a step, so
+    # the renderer's tile animation counter follows the step rate.
+    assert result["paints"] == result["steps"] + 1
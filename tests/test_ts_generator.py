@@ -177,6 +177,42 @@ def test_ts_refreshes_actor_selector_bindings_after_yield():
     assert "yield tick;\n  __nc_refresh_binding_last_coin();" in ts
 
 
+def test_ts_folds_tick_wait_loop_into_single_yield():
+    ts = compile_to_ts(
+        """
+        class Coin(Actor):
+            pass
+
+        def spawn(scene: Scene, tick: Tick, last_coin: Coin[-1]):
+            for _ in range(20):
+                yield tick
+            for i in range(3):
+                yield tick
+                i = i + 1
+        """
+    )
+
+    assert "yield 20;\n  __nc_refresh_binding_last_coin();" in ts
+    assert "for (let _ " not in ts
+    assert "for (let i = 0;" in ts
+
+
+def test_ts_emits_scene_wait_ticks_as_single_yield():
+    ts = compile_to_ts(
+        """
+        class Coin(Actor):
+            pass
+
+        def spawn(scene: Scene, last_coin: Coin[-1]):
+            yield scene.wait_ticks(20)
+            scene.next_turn()
+        """
+    )
+
+    assert "function* spawn(" in ts
+    assert "yield 20;\n  __nc_refresh_binding_last_coin();" in ts
+
+
 def test_ts_emits_random_helpers_and_calls():
     ts = compile_to_ts(
         """
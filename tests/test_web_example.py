@@ -4,6 +4,8 @@ import sys
 import textwrap
 from pathlib import Path
 
+from nanocalibur.build_game import COLLECT_CACHE_DIR, _collect_game_source, build_web_input
+
 
 ROOT = Path(__file__).resolve().parent.parent
 BUILD_SCRIPT = ROOT / "nanocalibur" / "build_game.py"
@@ -254,3 +256,80 @@ def test_build_game_resolves_local_relative_imports(tmp_path):
     )
     assert "Player" in spec["schemas"]
     assert spec["rules"][0]["action"] == "move_right"
+
+
+def test_collect_game_source_cache_tracks_local_modules(tmp_path):
+    main_path = tmp_path / "main.py"
+    main_path.write_text(
+        textwrap.dedent(
+            """
+            from .helpers import bonus
+
+            score = 1
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    first = _collect_game_source(main_path)
+    assert "from .helpers import bonus" in first
+    assert len(list((tmp_path / COLLECT_CACHE_DIR).glob("*.json"))) == 1
+    assert _collect_game_source(main_path) == first
+
+    # Editing a module replaces its entry instead of adding another one.
+    main_path.write_text(main_path.read_text(encoding="utf-8") + "level = 2\n", encoding="utf-8")
+    assert "level = 2" in _collect_game_source(main_path)
+    assert len(list((tmp_path / COLLECT_CACHE_DIR).glob("*.json"))) == 1
+
+    (tmp_path / "helpers.py").write_text("bonus = 2\n", encoding="utf-8")
+    second = _collect_game_source(main_path)
+    assert "from .helpers import bonus" not in second
+    assert "# --- source: helpers.py ---\nbonus = 2" in second
+    assert second.index("bonus = 2") < second.index("score = 1")
+
+
+def test_collect_game_source_keeps_text_around_removed_imports(tmp_path):
+    (tmp_path / "helpers.py").write_text("bonus = 2  # from helpers\n", encoding="utf-8")
+    main_path = tmp_path / "main.py"
+    main_path.write_text(
+        textwrap.dedent(
+            """
+            # entry module
+            from .helpers import (
+                bonus,
+            )
+            from .helpers import bonus; score = 1
+            label = "café"
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    collected = _collect_game_source(main_path)
+    assert "import" not in collected
+    assert "bonus = 2  # from helpers" in collected
+    assert "# entry module" in collected
+    assert "score = 1" in collected
+    assert 'label = "café"' in collected
+    compile(collected, "collected", "exec")
+
+
+def test_build_web_input_leaves_unchanged_runtime_files_untouched(tmp_path):
+    main_path = tmp_path / "main.py"
+    _write_scene(main_path)
+    output_dir = tmp_path / "bundle"
+
+    generated_dir = build_web_input(main_path, output_dir, require_code_blocks=True)
+    interpreter_path = generated_dir / "interpreter.ts"
+    physics_path = generated_dir / "canvas" / "physics.ts"
+    stale_path = generated_dir / "canvas" / "removed_module.ts"
+    stale_path.write_text("export {};\n", encoding="utf-8")
+    physics_path.write_text("// edited\n", encoding="utf-8")
+    interpreter_mtime = interpreter_path.stat().st_mtime_ns
+
+    build_web_input(main_path, output_dir, require_code_blocks=True)
+    assert interpreter_path.stat().st_mtime_ns == interpreter_mtime
+    assert not stale_path.exists()
+    assert physics_path.read_bytes() == (
+        ROOT / "nanocalibur" / "runtime" / "canvas" / "physics.ts"
+    ).read_bytes()